@@ -0,0 +1,117 @@
+"""Initial schema
+
+Matches the tables previously created by ``Base.metadata.create_all`` at
+startup. Databases created that way should be marked as migrated with
+``alembic stamp 0001`` instead of running this revision.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "organizations",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column(
+            "type",
+            sa.Enum("CLINIC", "HOSPITAL", "URGENT_CARE", name="organizationtype"),
+            nullable=True,
+        ),
+        sa.Column("npi_number", sa.String(length=10), nullable=True),
+        sa.Column("address", sa.Text(), nullable=True),
+        sa.Column("phone", sa.String(length=20), nullable=True),
+        sa.Column(
+            "subscription_tier",
+            sa.Enum("TRIAL", "BASIC", "PROFESSIONAL", name="subscriptiontier"),
+            nullable=True,
+        ),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("npi_number"),
+    )
+
+    op.create_table(
+        "users",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("email", sa.String(length=255), nullable=False),
+        sa.Column("password_hash", sa.String(length=255), nullable=False),
+        sa.Column("full_name", sa.String(length=255), nullable=False),
+        sa.Column("role", sa.Enum("ADMIN", "STAFF", "VIEWER", name="userrole"), nullable=True),
+        sa.Column("organization_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("last_login", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["organization_id"], ["organizations.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    op.create_table(
+        "audit_logs",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("action", sa.String(length=100), nullable=False),
+        sa.Column("resource_type", sa.String(length=50), nullable=False),
+        sa.Column("resource_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("ip_address", sa.String(length=45), nullable=True),
+        sa.Column("extra_data", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_audit_logs_created_at", "audit_logs", ["created_at"])
+    op.create_index("ix_audit_logs_user_id", "audit_logs", ["user_id"])
+
+    op.create_table(
+        "eligibility_checks",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("organization_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("patient_first_name", sa.String(length=100), nullable=False),
+        sa.Column("patient_last_name", sa.String(length=100), nullable=False),
+        sa.Column("patient_dob", sa.Date(), nullable=False),
+        sa.Column("insurance_company", sa.String(length=255), nullable=False),
+        sa.Column("member_id", sa.String(length=50), nullable=False),
+        sa.Column("group_number", sa.String(length=50), nullable=True),
+        sa.Column(
+            "status",
+            sa.Enum("PENDING", "SUCCESS", "ERROR", name="eligibilitystatus"),
+            nullable=True,
+        ),
+        sa.Column("response_data", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column("response_time_ms", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["organization_id"], ["organizations.id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_eligibility_checks_organization_id", "eligibility_checks", ["organization_id"])
+    op.create_index("ix_eligibility_checks_member_id", "eligibility_checks", ["member_id"])
+    op.create_index("ix_eligibility_checks_created_at", "eligibility_checks", ["created_at"])
+    op.create_index("ix_eligibility_checks_user_id", "eligibility_checks", ["user_id"])
+
+
+def downgrade() -> None:
+    op.drop_table("eligibility_checks")
+    op.drop_table("audit_logs")
+    op.drop_index("ix_users_email", table_name="users")
+    op.drop_table("users")
+    op.drop_table("organizations")
+    sa.Enum(name="eligibilitystatus").drop(op.get_bind())
+    sa.Enum(name="userrole").drop(op.get_bind())
+    sa.Enum(name="subscriptiontier").drop(op.get_bind())
+    sa.Enum(name="organizationtype").drop(op.get_bind())
@@ -0,0 +1,84 @@
+"""Partition audit_logs by month
+
+Nothing wrote to audit_logs before this revision, so the table is
+recreated as a range-partitioned table instead of being migrated in place.
+Partitions for the current and next two months are created here; the audit
+writer keeps creating them ahead of time. A default partition catches rows
+outside every monthly range so inserts never fail.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19
+"""
+
+from datetime import date
+
+from alembic import op
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def _add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def upgrade() -> None:
+    op.drop_table("audit_logs")
+    op.execute(
+        """
+        CREATE TABLE audit_logs (
+            id UUID NOT NULL,
+            user_id UUID NOT NULL REFERENCES users (id),
+            action VARCHAR(100) NOT NULL,
+            resource_type VARCHAR(50) NOT NULL,
+            resource_id UUID,
+            ip_address VARCHAR(45),
+            extra_data JSONB,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+        """
+    )
+    op.create_index("ix_audit_logs_user_id_created_at", "audit_logs", ["user_id", "created_at"])
+    op.create_index(
+        "ix_audit_logs_resource_created_at",
+        "audit_logs",
+        ["resource_type", "resource_id", "created_at"],
+    )
+    op.create_index(
+        "ix_audit_logs_created_at", "audit_logs", ["created_at"], postgresql_using="brin"
+    )
+
+    this_month = date.today().replace(day=1)
+    for offset in range(3):
+        start = _add_months(this_month, offset)
+        end = _add_months(this_month, offset + 1)
+        op.execute(
+            f"CREATE TABLE audit_logs_p{start:%Y%m} PARTITION OF audit_logs "
+            f"FOR VALUES FROM ('{start}') TO ('{end}')"
+        )
+    op.execute("CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT")
+
+
+def downgrade() -> None:
+    op.drop_table("audit_logs")
+    op.execute(
+        """
+        CREATE TABLE audit_logs (
+            id UUID NOT NULL PRIMARY KEY,
+            user_id UUID NOT NULL REFERENCES users (id),
+            action VARCHAR(100) NOT NULL,
+            resource_type VARCHAR(50) NOT NULL,
+            resource_id UUID,
+            ip_address VARCHAR(45),
+            extra_data JSONB,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL
+        )
+        """
+    )
+    op.create_index("ix_audit_logs_created_at", "audit_logs", ["created_at"])
+    op.create_index("ix_audit_logs_user_id", "audit_logs", ["user_id"])
@@ -0,0 +1,42 @@
+"""Add member_eligibility_latest
+
+Holds the most recent conclusive result per (organization, insurer, member,
+date of birth), backfilled here from eligibility_checks.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+from app.models.eligibility import BACKFILL_MEMBER_ELIGIBILITY_LATEST
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "member_eligibility_latest",
+        sa.Column("organization_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("insurance_company", sa.String(length=255), nullable=False),
+        sa.Column("member_id", sa.String(length=50), nullable=False),
+        sa.Column("patient_dob", sa.Date(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("response_data", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("check_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("checked_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["organization_id"], ["organizations.id"]),
+        sa.ForeignKeyConstraint(["check_id"], ["eligibility_checks.id"]),
+        sa.PrimaryKeyConstraint("organization_id", "insurance_company", "member_id", "patient_dob"),
+    )
+    op.execute(BACKFILL_MEMBER_ELIGIBILITY_LATEST)
+
+
+def downgrade() -> None:
+    op.drop_table("member_eligibility_latest")
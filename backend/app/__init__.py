@@ -1 +1,5 @@
 # CareLink Backend Application
+import time
+
+# Reference point for the startup time report (see app.core.startup)
+IMPORT_STARTED = time.perf_counter()
@@ -1,13 +1,21 @@
 """API routes."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
+from app.api.admin import router as admin_router
 from app.api.auth import router as auth_router
 from app.api.eligibility import router as eligibility_router
 from app.api.users import router as users_router
+from app.core.dependencies import enforce_rate_limit
 
 api_router = APIRouter()
 
 api_router.include_router(auth_router, prefix="/auth", tags=["Authentication"])
 api_router.include_router(eligibility_router, prefix="/eligibility", tags=["Eligibility"])
-api_router.include_router(users_router, prefix="/users", tags=["Users"])
+api_router.include_router(
+    users_router,
+    prefix="/users",
+    tags=["Users"],
+    dependencies=[Depends(enforce_rate_limit)],
+)
+api_router.include_router(admin_router, prefix="/admin", tags=["Admin"])
@@ -0,0 +1,247 @@
+"""Admin diagnostics API endpoints."""
+
+import asyncio
+import os
+import tracemalloc
+from datetime import timedelta
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.core import logs, profiling
+from app.core.dependencies import require_admin
+from app.core.rate_limit import rate_limiter
+from app.core.redis_pool import get_redis
+from app.core.redis_shards import get_cache_shards
+from app.database import get_db
+from app.models.user import User
+from app.schemas.admin import (
+    CacheShardStatus,
+    LoggingStatsResponse,
+    PrioritySchedulerStats,
+    MemoryDiffResponse,
+    MemorySnapshotResponse,
+    RateLimitStatsResponse,
+    ReverificationReportResponse,
+)
+from app.services.priority import db_write_scheduler, provider_scheduler
+from app.services.reverification import reverification_scheduler
+
+router = APIRouter()
+settings = get_settings()
+
+# Keeps a reference so manually triggered runs are not garbage collected
+_reverification_runs: set[asyncio.Task] = set()
+
+
+def _ensure_profiler_free() -> None:
+    if profiling.profiling_lock.locked():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A profile is already running on this worker",
+        )
+
+
+@router.post("/profile/cpu")
+async def profile_cpu(
+    duration: float = Query(default=10.0, gt=0, description="Seconds to profile"),
+    format: Literal["collapsed", "pstats"] = Query(
+        default="collapsed", description="collapsed stacks or binary pstats"
+    ),
+    current_user: User = Depends(require_admin),
+) -> Response:
+    """Profile this worker's CPU usage for a bounded time window (admin only).
+
+    ``collapsed`` samples every thread and returns flamegraph-ready stacks.
+    ``pstats`` runs cProfile on the event loop thread and returns a file
+    loadable with ``pstats.Stats``.
+    """
+    if duration > settings.PROFILING_MAX_DURATION_S:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Duration may not exceed {settings.PROFILING_MAX_DURATION_S}s",
+        )
+
+    _ensure_profiler_free()
+    async with profiling.profiling_lock:
+        if format == "pstats":
+            body = await profiling.profile_event_loop(duration)
+            return Response(
+                content=body,
+                media_type="application/octet-stream",
+                headers={
+                    "Content-Disposition": f'attachment; filename="worker-{os.getpid()}.pstats"',
+                    "X-Worker-Pid": str(os.getpid()),
+                },
+            )
+
+        body = await profiling.sample_cpu(
+            duration, settings.PROFILING_SAMPLE_INTERVAL_MS / 1000
+        )
+        return Response(
+            content=body,
+            media_type="text/plain",
+            headers={"X-Worker-Pid": str(os.getpid())},
+        )
+
+
+@router.post("/profile/memory/snapshots", response_model=MemorySnapshotResponse)
+async def take_memory_snapshot(
+    frames: int = Query(default=10, ge=1, le=100, description="Traceback depth"),
+    limit: int = Query(default=25, ge=1, le=500, description="Top sites to return"),
+    current_user: User = Depends(require_admin),
+) -> MemorySnapshotResponse:
+    """Take a tracemalloc snapshot on this worker (admin only).
+
+    Tracing starts on the first snapshot and stays on until it is stopped
+    with ``DELETE /profile/memory``.
+    """
+    snapshot_id, snapshot = profiling.take_snapshot(frames)
+    current, peak = tracemalloc.get_traced_memory()
+
+    return MemorySnapshotResponse(
+        snapshot_id=snapshot_id,
+        pid=os.getpid(),
+        traced_current_bytes=current,
+        traced_peak_bytes=peak,
+        top=profiling.top_allocations(snapshot, limit),
+    )
+
+
+@router.get("/profile/memory/snapshots", response_model=list[int])
+async def list_memory_snapshots(
+    current_user: User = Depends(require_admin),
+) -> list[int]:
+    """List snapshot IDs stored on this worker (admin only)."""
+    return profiling.list_snapshot_ids()
+
+
+@router.get("/profile/memory/diff", response_model=MemoryDiffResponse)
+async def diff_memory_snapshots(
+    base_id: int = Query(description="Snapshot to compare against"),
+    target_id: Optional[int] = Query(
+        default=None, description="Snapshot to compare; a new one is taken if omitted"
+    ),
+    limit: int = Query(default=25, ge=1, le=500, description="Top sites to return"),
+    current_user: User = Depends(require_admin),
+) -> MemoryDiffResponse:
+    """Diff two tracemalloc snapshots on this worker (admin only)."""
+    base = profiling.get_snapshot(base_id)
+    if base is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Base snapshot not found",
+        )
+
+    if target_id is None:
+        target_id, target = profiling.take_snapshot()
+    else:
+        target = profiling.get_snapshot(target_id)
+        if target is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Target snapshot not found",
+            )
+
+    return MemoryDiffResponse(
+        base_id=base_id,
+        target_id=target_id,
+        pid=os.getpid(),
+        diff=profiling.diff_snapshots(base, target, limit),
+    )
+
+
+@router.delete("/profile/memory", status_code=status.HTTP_204_NO_CONTENT)
+async def stop_memory_tracing(
+    current_user: User = Depends(require_admin),
+) -> Response:
+    """Stop tracemalloc and discard stored snapshots (admin only)."""
+    profiling.stop_tracing()
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.post("/reverification/run", status_code=status.HTTP_202_ACCEPTED)
+async def run_reverification(
+    hours: float = Query(default=1.0, gt=0, le=24, description="Spread the run over this many hours"),
+    current_user: User = Depends(require_admin),
+) -> dict:
+    """Re-verify the organization's recently seen members now (admin only).
+
+    Only one run per organization is in progress across all workers, and
+    none starts during the scheduled run.
+    """
+    if get_redis() is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Re-verification needs the cache, which is unavailable",
+        )
+
+    deadline = reverification_scheduler.clock.now() + timedelta(hours=hours)
+    task = reverification_scheduler.start_organization_run(current_user.organization_id, deadline)
+    if task is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A re-verification run is already in progress",
+        )
+    _reverification_runs.add(task)
+    task.add_done_callback(_reverification_runs.discard)
+    return {"status": "started", "deadline": deadline}
+
+
+@router.get("/reverification/last", response_model=Optional[ReverificationReportResponse])
+async def get_last_reverification(
+    current_user: User = Depends(require_admin),
+) -> Optional[ReverificationReportResponse]:
+    """Get the organization's last completed re-verification on this worker (admin only)."""
+    return reverification_scheduler.organization_reports.get(current_user.organization_id)
+
+
+@router.get("/rate-limit", response_model=RateLimitStatsResponse)
+async def get_rate_limit_stats(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_admin),
+) -> RateLimitStatsResponse:
+    """Get the organization's request rate limit and counters (admin only)."""
+    organization_id = current_user.organization_id
+    return RateLimitStatsResponse(
+        organization_id=organization_id,
+        limit=rate_limiter.limit_for(organization_id, db),
+        window_seconds=settings.RATE_LIMIT_WINDOW_SECONDS,
+        **rate_limiter.metrics(organization_id),
+    )
+
+
+@router.get("/cache/shards", response_model=list[CacheShardStatus])
+async def get_cache_shard_status(
+    current_user: User = Depends(require_admin),
+) -> list[CacheShardStatus]:
+    """Get the health of each eligibility cache node; empty when not sharded (admin only)."""
+    shards = get_cache_shards()
+    return [CacheShardStatus(**shard) for shard in shards.status()] if shards else []
+
+
+@router.get("/priority", response_model=dict[str, PrioritySchedulerStats])
+async def get_priority_stats(
+    current_user: User = Depends(require_admin),
+) -> dict[str, PrioritySchedulerStats]:
+    """Get per-lane queue waits for provider calls and check writes on this worker (admin only)."""
+    return {
+        scheduler.name: PrioritySchedulerStats(**scheduler.metrics())
+        for scheduler in (provider_scheduler, db_write_scheduler)
+    }
+
+
+@router.get("/logging", response_model=LoggingStatsResponse)
+async def get_logging_stats(
+    current_user: User = Depends(require_admin),
+) -> LoggingStatsResponse:
+    """Get the log queue depth and dropped record counts on this worker (admin only)."""
+    metrics = logs.metrics()
+    if metrics is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Logging has not started",
+        )
+    return LoggingStatsResponse(**metrics)
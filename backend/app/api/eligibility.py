@@ -1,33 +1,130 @@
 """Eligibility check API endpoints."""
 
 from datetime import date
-from typing import Optional
+from functools import lru_cache
+from typing import AsyncIterator, Literal, Optional, Union
 from uuid import UUID
+import asyncio
 import math
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from app.database import get_db
-from app.models.user import User
+from app.core import profiling, serialization
+from app.core.deadline import Deadline
+from app.core.http_cache import conditional_response, make_etag
+from app.core.serialization import JSONBytesResponse
+from app.insurance import get_insurance_provider
+from app.database import SessionLocal, get_db
+from app.models.eligibility import EligibilityCheck, EligibilityStatus
+from app.models.user import User, UserRole
 from app.schemas.eligibility import (
     EligibilityCheckRequest,
     EligibilityCheckResponse,
+    EligibilityCheckAcceptedResponse,
     EligibilityHistoryResponse,
-    EligibilityHistoryItem,
-    CoverageInfo,
-    SubscriberInfo,
-    PaginationInfo,
+    EligibilityHistorySummaryItem,
+    EligibilityHistorySummaryResponse,
+    MemberEligibilityLookupRequest,
+    MemberEligibilityLookupResponse,
+)
+from app.services.audit import audit_writer
+from app.services.check_events import check_events
+from app.services.eligibility_service import EligibilityService, HISTORY_COLUMNS
+from app.services.priority import Lane, priority_lane
+from app.core.dependencies import (
+    admit_check,
+    enforce_rate_limit,
+    get_client_ip,
+    get_current_user,
+    get_current_user_for_stream,
+    get_deadline,
+    get_read_db,
 )
-from app.services.eligibility_service import EligibilityService
-from app.core.dependencies import get_current_user
 
 router = APIRouter()
 
+# Check records never change; they contain PHI, so only the browser may cache them
+CHECK_CACHE_CONTROL = "private, max-age=86400, immutable"
+# The insurer list only changes between releases
+INSURERS_CACHE_CONTROL = "private, max-age=3600"
+# Pending checks change once they complete
+PENDING_CACHE_CONTROL = "no-store"
+
+# Roles allowed to bypass the result cache and re-query the insurer
+FORCE_REFRESH_ROLES = (UserRole.ADMIN, UserRole.STAFF)
+
+# Longest a GET /{check_id} may wait for a pending check
+MAX_WAIT_SECONDS = 30
+# Comment lines sent on idle event streams so proxies keep them open
+SSE_KEEPALIVE_SECONDS = 15
+
+
+@lru_cache()
+def get_insurers_payload() -> tuple[bytes, str]:
+    """Encoded supported-insurer list and its ETag, built once per process."""
+    body = serialization.dumps(get_insurance_provider().get_supported_insurers())
+    return body, make_etag(body)
+
 
-@router.post("/check", response_model=EligibilityCheckResponse)
+async def complete_check(
+    check_id: UUID, force_refresh: bool = False, lane: Lane = Lane.BATCH
+) -> None:
+    """Background task resolving a check accepted in async mode.
+
+    Runs after the request's session is closed, so it opens its own.
+    """
+    db = SessionLocal()
+    try:
+        with priority_lane(lane):
+            await EligibilityService(db).complete_pending_check(check_id, force_refresh)
+    finally:
+        db.close()
+
+
+@router.post(
+    "/check",
+    response_model=EligibilityCheckResponse,
+    # Admission runs first so shed requests cost no authentication query
+    dependencies=[Depends(admit_check), Depends(enforce_rate_limit)],
+    responses={
+        status.HTTP_202_ACCEPTED: {"model": EligibilityCheckAcceptedResponse},
+    },
+)
 async def check_eligibility(
     request: EligibilityCheckRequest,
+    background_tasks: BackgroundTasks,
+    async_mode: bool = Query(
+        default=False,
+        alias="async",
+        description="Return 202 with the check ID and push the result when it completes",
+    ),
+    profile: bool = Query(
+        default=False,
+        description="Return a cProfile report of this call instead of the result (admin only)",
+    ),
+    force_refresh: bool = Query(
+        default=False,
+        description="Bypass the cached result and re-query the insurer (admin and staff)",
+    ),
+    priority: Optional[Literal["interactive", "batch"]] = Query(
+        default=None,
+        description="Priority lane; interactive by default, batch for async checks",
+    ),
+    cache_control: Optional[str] = Header(default=None),
+    client_ip: Optional[str] = Depends(get_client_ip),
+    deadline: Deadline = Depends(get_deadline),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ) -> EligibilityCheckResponse:
@@ -35,48 +132,193 @@ async def check_eligibility(
 
     This endpoint checks a patient's insurance eligibility and returns
     coverage details including copays, deductibles, and out-of-pocket maximums.
+
+    With ``async=true`` the check is recorded as pending and 202 Accepted is
+    returned immediately. The result is pushed on ``GET /events`` and can be
+    long-polled with ``GET /{check_id}?wait=``.
+
+    ``force_refresh`` or a ``Cache-Control: no-cache`` request header skips
+    the cached result and repopulates it.
+
+    The check must finish within ``X-Request-Timeout-Ms`` (or
+    ``timeout_ms``, or the server default). If the insurer is too slow, its
+    request is cancelled and the member's last known result is returned
+    with an explanatory ``error_message``; without one the response is
+    504 and no check is recorded. Asynchronous checks have no deadline.
     """
+    if profile:
+        _ensure_can_profile(current_user)
+    force_refresh = _resolve_force_refresh(current_user, force_refresh, cache_control)
+
     service = EligibilityService(db)
 
-    check = await service.check_eligibility(
-        user=current_user,
-        patient_first_name=request.patient_first_name,
-        patient_last_name=request.patient_last_name,
-        patient_dob=request.patient_dob,
-        insurance_company=request.insurance_company,
-        member_id=request.member_id,
-        group_number=request.group_number,
-    )
+    if async_mode and not profile:
+        check = service.create_pending_check(
+            user=current_user,
+            patient_first_name=request.patient_first_name,
+            patient_last_name=request.patient_last_name,
+            patient_dob=request.patient_dob,
+            insurance_company=request.insurance_company,
+            member_id=request.member_id,
+            group_number=request.group_number,
+        )
+        background_tasks.add_task(
+            complete_check, check.id, force_refresh, Lane(priority or Lane.BATCH)
+        )
+        _audit_check(current_user, check, client_ip, force_refresh=force_refresh, async_mode=True)
+
+        return JSONBytesResponse(
+            serialization.dumps({"id": check.id, "status": "pending"}),
+            status_code=status.HTTP_202_ACCEPTED,
+            # Relative to /check, so this resolves to GET /{check_id}
+            headers={"Location": str(check.id)},
+        )
+
+    # Lanes follow the context into the provider call and the write
+    with priority_lane(Lane(priority or Lane.INTERACTIVE)):
+        check_call = service.check_eligibility(
+            user=current_user,
+            patient_first_name=request.patient_first_name,
+            patient_last_name=request.patient_last_name,
+            patient_dob=request.patient_dob,
+            insurance_company=request.insurance_company,
+            member_id=request.member_id,
+            group_number=request.group_number,
+            force_refresh=force_refresh,
+            deadline=deadline,
+        )
+
+        if profile:
+            async with profiling.profiling_lock:
+                check, report = await profiling.profile_awaitable(check_call)
+            _audit_check(current_user, check, client_ip, force_refresh=force_refresh, profile=True)
+            return Response(
+                content=report,
+                media_type="text/plain",
+                headers={"X-Check-Id": str(check.id)},
+            )
 
-    # Build response
-    response_data = check.response_data or {}
-    coverage_data = response_data.get("coverage")
-    subscriber_data = response_data.get("subscriber")
-
-    return EligibilityCheckResponse(
-        id=check.id,
-        status=response_data.get("status", "error"),
-        coverage=CoverageInfo(**coverage_data) if coverage_data else None,
-        subscriber=SubscriberInfo(**subscriber_data) if subscriber_data else None,
-        error_message=check.error_message,
-        response_time_ms=check.response_time_ms,
-        created_at=check.created_at,
+        check = await check_call
+
+    _audit_check(current_user, check, client_ip, force_refresh=force_refresh)
+
+    # Encode once; the same body serves later GET /{check_id} calls
+    body = serialization.dumps(serialization.check_response_content(check))
+    service.cache_check_response(check, body)
+
+    return JSONBytesResponse(body)
+
+
+def _audit_check(
+    current_user: User, check: EligibilityCheck, client_ip: Optional[str], **extra_data
+) -> None:
+    audit_writer.record(
+        current_user,
+        action="eligibility.check",
+        resource_type="eligibility_check",
+        resource_id=check.id,
+        ip_address=client_ip,
+        extra_data={"insurance_company": check.insurance_company, **extra_data},
     )
 
 
-@router.get("/history", response_model=EligibilityHistoryResponse)
+def _resolve_force_refresh(
+    current_user: User, force_refresh: bool, cache_control: Optional[str]
+) -> bool:
+    """Decide whether this check may bypass the result cache.
+
+    An explicit ``force_refresh`` from a role without the right is refused.
+    ``Cache-Control: no-cache`` is only a request, so it is ignored instead.
+    """
+    allowed = current_user.role in FORCE_REFRESH_ROLES
+    if force_refresh and not allowed:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Insufficient permissions to force a refresh",
+        )
+
+    if cache_control and allowed:
+        directives = {directive.strip().lower() for directive in cache_control.split(",")}
+        force_refresh = force_refresh or "no-cache" in directives
+
+    return force_refresh
+
+
+def _ensure_can_profile(current_user: User) -> None:
+    """Only admins may profile, and only one profile runs per worker."""
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Insufficient permissions",
+        )
+
+    if profiling.profiling_lock.locked():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A profile is already running on this worker",
+        )
+
+
+SUMMARY_FIELDS = tuple(EligibilityHistorySummaryItem.model_fields)
+
+
+def _parse_fields(fields: Optional[str], view: str) -> Optional[list[str]]:
+    """Resolve the columns to select, or None for full entities."""
+    if fields is None:
+        return list(SUMMARY_FIELDS) if view == "summary" else None
+
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in requested if name not in HISTORY_COLUMNS]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}",
+        )
+
+    # The ID is always returned so items can be opened
+    return ["id"] + [name for name in dict.fromkeys(requested) if name != "id"]
+
+
+@router.get(
+    "/history",
+    response_model=Union[EligibilityHistoryResponse, EligibilityHistorySummaryResponse],
+    dependencies=[Depends(enforce_rate_limit)],
+)
 async def get_eligibility_history(
     page: int = Query(default=1, ge=1, description="Page number"),
     limit: int = Query(default=50, ge=1, le=100, description="Items per page"),
     start_date: Optional[date] = Query(default=None, description="Filter by start date"),
     end_date: Optional[date] = Query(default=None, description="Filter by end date"),
-    db: Session = Depends(get_db),
+    view: Literal["full", "summary"] = Query(
+        default="full", description="summary omits coverage data"
+    ),
+    fields: Optional[str] = Query(
+        default=None, description="Comma-separated item fields to return (overrides view)"
+    ),
+    client_ip: Optional[str] = Depends(get_client_ip),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ) -> EligibilityHistoryResponse:
     """Retrieve eligibility check history for the user's organization.
 
-    Results are paginated and can be filtered by date range.
+    Results are paginated and can be filtered by date range. ``view=summary``
+    or ``fields`` select only the needed columns, so the response_data JSONB
+    is not read unless asked for.
     """
+    columns = _parse_fields(fields, view)
+    audit_writer.record(
+        current_user,
+        action="eligibility.history",
+        resource_type="eligibility_check",
+        ip_address=client_ip,
+        extra_data={
+            "page": page,
+            "limit": limit,
+            "start_date": start_date.isoformat() if start_date else None,
+            "end_date": end_date.isoformat() if end_date else None,
+            "fields": columns,
+        },
+    )
     service = EligibilityService(db)
 
     checks, total = service.get_history(
@@ -85,74 +327,224 @@ async def get_eligibility_history(
         limit=limit,
         start_date=start_date,
         end_date=end_date,
+        fields=columns,
     )
 
-    # Convert to response items
-    items = [
-        EligibilityHistoryItem(
-            id=check.id,
-            patient_first_name=check.patient_first_name,
-            patient_last_name=check.patient_last_name,
-            patient_dob=check.patient_dob,
-            insurance_company=check.insurance_company,
-            member_id=check.member_id,
-            group_number=check.group_number,
-            status=check.response_data.get("status", "error") if check.response_data else "error",
-            response_data=check.response_data,
-            error_message=check.error_message,
-            response_time_ms=check.response_time_ms,
-            created_at=check.created_at,
-        )
-        for check in checks
+    # Rows are trusted, so skip model validation and encode directly
+    if columns is None:
+        items = [serialization.history_item_content(check) for check in checks]
+    else:
+        items = [row._asdict() for row in checks]
+
+    content = {
+        "data": items,
+        "pagination": {
+            "page": page,
+            "limit": limit,
+            "total": total,
+            "pages": math.ceil(total / limit) if total > 0 else 0,
+        },
+    }
+
+    return JSONBytesResponse(serialization.dumps(content))
+
+
+@router.post(
+    "/latest",
+    response_model=MemberEligibilityLookupResponse,
+    dependencies=[Depends(enforce_rate_limit)],
+)
+async def lookup_latest_eligibility(
+    request: MemberEligibilityLookupRequest,
+    client_ip: Optional[str] = Depends(get_client_ip),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+) -> MemberEligibilityLookupResponse:
+    """Get the latest known status of up to 500 members at once.
+
+    Reads the organization's last conclusive result per member with one
+    primary key query; no insurer is contacted. ``fresh`` tells whether the
+    result is still within the cache policy's TTL.
+    """
+    members = [
+        (member.insurance_company, member.member_id, member.patient_dob)
+        for member in request.members
     ]
+    audit_writer.record(
+        current_user,
+        action="eligibility.lookup",
+        resource_type="member_eligibility",
+        ip_address=client_ip,
+        extra_data={"members": len(members)},
+    )
+
+    items = EligibilityService(db).lookup_latest(user=current_user, members=members)
+
+    return JSONBytesResponse(serialization.dumps({"data": items}))
+
+
+@router.get("/events")
+async def stream_check_events(
+    request: Request,
+    scope: Literal["user", "organization"] = Query(
+        default="user", description="Checks started by this user or by the whole organization"
+    ),
+    client_ip: Optional[str] = Depends(get_client_ip),
+    current_user: User = Depends(get_current_user_for_stream),
+    db: Session = Depends(get_db),
+) -> StreamingResponse:
+    """Server-Sent Events stream of completed eligibility checks.
+
+    Each ``check.completed`` event carries the check in the same shape as
+    ``GET /{check_id}``. Browsers that cannot send an Authorization header
+    may pass the token as ``access_token``.
+    """
+    user_id = str(current_user.id)
+    organization_id = current_user.organization_id
+    audit_writer.record(
+        current_user,
+        action="eligibility.subscribe",
+        resource_type="eligibility_check",
+        ip_address=client_ip,
+        extra_data={"scope": scope},
+    )
+    # The session that authenticated the user would otherwise hold a pooled
+    # connection until the client disconnects
+    db.close()
+
+    async def event_stream() -> AsyncIterator[bytes]:
+        async with check_events.subscribe(organization_id) as subscription:
+            yield b"retry: 3000\n\n"
+            while not await request.is_disconnected():
+                event = await subscription.get(timeout=SSE_KEEPALIVE_SECONDS)
+                if event is None:
+                    yield b": keepalive\n\n"
+                    continue
+                if scope == "user" and event["user_id"] != user_id:
+                    continue
+                check = event["check"]
+                yield (
+                    f"id: {check['id']}\nevent: {event['type']}\ndata: ".encode()
+                    + serialization.dumps(check)
+                    + b"\n\n"
+                )
 
-    return EligibilityHistoryResponse(
-        data=items,
-        pagination=PaginationInfo(
-            page=page,
-            limit=limit,
-            total=total,
-            pages=math.ceil(total / limit) if total > 0 else 0,
-        ),
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-store", "X-Accel-Buffering": "no"},
     )
 
 
-@router.get("/{check_id}", response_model=EligibilityCheckResponse)
+@router.get(
+    "/{check_id}",
+    response_model=EligibilityCheckResponse,
+    dependencies=[Depends(enforce_rate_limit)],
+)
 async def get_eligibility_check(
     check_id: UUID,
+    wait: int = Query(
+        default=0,
+        ge=0,
+        le=MAX_WAIT_SECONDS,
+        description="Seconds to wait for a pending check to complete",
+    ),
+    if_none_match: Optional[str] = Header(default=None),
+    client_ip: Optional[str] = Depends(get_client_ip),
+    read_db: Session = Depends(get_read_db),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ) -> EligibilityCheckResponse:
-    """Get details of a specific eligibility check."""
-    service = EligibilityService(db)
+    """Get details of a specific eligibility check.
 
-    check = service.get_check_by_id(user=current_user, check_id=check_id)
-    if not check:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Eligibility check not found",
-        )
+    Responses carry a strong ETag; a matching If-None-Match returns 304.
+    When the encoded body is cached, no eligibility query is made.
+
+    A pending check is returned as ``status: "pending"`` with no-store;
+    ``wait`` long-polls for its completion instead.
+    """
+    service = EligibilityService(read_db)
+
+    body = service.get_cached_check_response(user=current_user, check_id=check_id)
+    if body is not None:
+        _audit_view(current_user, check_id, client_ip)
+    else:
+        check = service.get_check_by_id(user=current_user, check_id=check_id)
+        replica_read = read_db.get_bind() is not db.get_bind()
+        if replica_read and (check is None or check.status == EligibilityStatus.PENDING):
+            # A replica may not have the check or its result yet; ask the primary
+            service = EligibilityService(db)
+            check = service.get_check_by_id(user=current_user, check_id=check_id)
+
+        if not check:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Eligibility check not found",
+            )
+
+        # Recorded before waiting: the member's identity is disclosed either way
+        _audit_view(current_user, check_id, client_ip)
+        if check.status == EligibilityStatus.PENDING and wait:
+            check = await _wait_for_completion(service, current_user, check, wait)
+
+        body = serialization.dumps(serialization.check_response_content(check))
+        if check.status == EligibilityStatus.PENDING:
+            return JSONBytesResponse(body, headers={"Cache-Control": PENDING_CACHE_CONTROL})
+        service.cache_check_response(check, body)
 
-    response_data = check.response_data or {}
-    coverage_data = response_data.get("coverage")
-    subscriber_data = response_data.get("subscriber")
-
-    return EligibilityCheckResponse(
-        id=check.id,
-        status=response_data.get("status", "error"),
-        coverage=CoverageInfo(**coverage_data) if coverage_data else None,
-        subscriber=SubscriberInfo(**subscriber_data) if subscriber_data else None,
-        error_message=check.error_message,
-        response_time_ms=check.response_time_ms,
-        created_at=check.created_at,
+    return conditional_response(body, if_none_match, CHECK_CACHE_CONTROL)
+
+
+def _audit_view(current_user: User, check_id: UUID, client_ip: Optional[str]) -> None:
+    audit_writer.record(
+        current_user,
+        action="eligibility.view",
+        resource_type="eligibility_check",
+        resource_id=check_id,
+        ip_address=client_ip,
     )
 
 
-@router.get("/insurers/list", response_model=list[str])
+async def _wait_for_completion(
+    service: EligibilityService,
+    current_user: User,
+    check: EligibilityCheck,
+    wait: int,
+) -> EligibilityCheck:
+    """Wait up to ``wait`` seconds for a pending check's completion event."""
+    check_id = str(check.id)
+    # Release the pooled connection while waiting
+    service.db.rollback()
+
+    async with check_events.subscribe(current_user.organization_id) as subscription:
+        # Re-read after subscribing so a completion in between is not missed
+        check = service.get_check_by_id(user=current_user, check_id=check.id)
+        if check.status != EligibilityStatus.PENDING:
+            return check
+        service.db.rollback()
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + wait
+        while (remaining := deadline - loop.time()) > 0:
+            event = await subscription.get(timeout=remaining)
+            if event is not None and event["check"]["id"] == check_id:
+                break
+
+    return service.get_check_by_id(user=current_user, check_id=check.id)
+
+
+@router.get(
+    "/insurers/list",
+    response_model=list[str],
+    dependencies=[Depends(enforce_rate_limit)],
+)
 async def list_supported_insurers(
-    db: Session = Depends(get_db),
+    if_none_match: Optional[str] = Header(default=None),
     current_user: User = Depends(get_current_user),
 ) -> list[str]:
-    """Get list of supported insurance companies."""
-    service = EligibilityService(db)
-    return service.get_supported_insurers()
+    """Get list of supported insurance companies.
+
+    The list is encoded once per process and served with an ETag.
+    """
+    body, etag = get_insurers_payload()
+    return conditional_response(body, if_none_match, INSURERS_CACHE_CONTROL, etag)
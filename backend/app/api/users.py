@@ -6,18 +6,18 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_db, replica_router
 from app.models.user import User, UserRole
 from app.schemas.user import UserCreate, UserUpdate, UserResponse
 from app.core.security import get_password_hash
-from app.core.dependencies import get_current_user, require_admin
+from app.core.dependencies import get_current_user, get_read_db, require_admin
 
 router = APIRouter()
 
 
 @router.get("", response_model=List[UserResponse])
 async def list_users(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ) -> List[UserResponse]:
     """List all users in the current user's organization."""
@@ -55,6 +55,7 @@ async def create_user(
     db.add(user)
     db.commit()
     db.refresh(user)
+    replica_router.mark_write(current_user.id)
 
     return user
 
@@ -62,7 +63,7 @@ async def create_user(
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
     user_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ) -> UserResponse:
     """Get a specific user by ID."""
@@ -120,5 +121,6 @@ async def update_user(
 
     db.commit()
     db.refresh(user)
+    replica_router.mark_write(current_user.id)
 
     return user
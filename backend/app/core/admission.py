@@ -0,0 +1,174 @@
+"""Admission control for eligibility checks.
+
+Each worker runs at most ``ADMISSION_MAX_IN_FLIGHT`` checks at once. Up to
+``ADMISSION_MAX_QUEUE`` more wait for a slot, each for at most
+``ADMISSION_MAX_QUEUE_WAIT_MS`` or until its own deadline. Everything
+beyond that is shed straight away with 503 and a ``Retry-After``, before
+authentication or any database work. New checks are also shed while the
+database pool is nearly exhausted, so the requests already admitted can
+still get connections.
+
+``/ready`` reports the same signals. Because a worker that is shedding
+reports itself unready, the load balancer sends traffic elsewhere instead
+of letting requests pile up in uvicorn.
+"""
+
+import asyncio
+import math
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional
+
+from sqlalchemy.pool import QueuePool
+
+from app.config import get_settings
+from app.database import engine
+
+# Weight of the newest sample in the moving averages
+EWMA_ALPHA = 0.2
+# Longest Retry-After suggested to shed clients
+MAX_RETRY_AFTER_S = 30
+
+
+class Overloaded(Exception):
+    """A request was shed; retry after ``retry_after`` seconds."""
+
+    def __init__(self, reason: str, retry_after: int):
+        self.reason = reason
+        self.retry_after = retry_after
+        super().__init__(reason)
+
+
+@dataclass
+class AdmissionStats:
+    """Point-in-time load of one worker."""
+
+    ready: bool
+    in_flight: int
+    max_in_flight: int
+    queued: int
+    max_queue: int
+    queue_wait_ms: float  # moving average over admitted requests
+    service_time_ms: float  # moving average of admitted checks
+    db_pool_in_use: int
+    db_pool_capacity: int
+    admitted: int
+    shed: int
+
+
+def db_pool_usage() -> tuple[int, int]:
+    """Connections checked out of the primary pool, and the pool's limit."""
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return 0, 0
+    return pool.checkedout(), pool.size() + max(pool._max_overflow, 0)
+
+
+class AdmissionController:
+    """Bounds concurrent checks per worker and sheds what cannot wait."""
+
+    def __init__(self):
+        self.settings = get_settings()
+        self.max_in_flight = self.settings.ADMISSION_MAX_IN_FLIGHT
+        self.max_queue = self.settings.ADMISSION_MAX_QUEUE
+        self._slots: Optional[asyncio.Semaphore] = None
+        self.in_flight = 0
+        self.queued = 0
+        self.queue_wait_s = 0.0
+        self.service_time_s = 0.0
+        self.admitted = 0
+        self.shed = 0
+        self._shed_at = float("-inf")
+
+    @property
+    def slots(self) -> asyncio.Semaphore:
+        # Created on first use so it binds to the serving event loop
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_in_flight)
+        return self._slots
+
+    def db_saturated(self) -> bool:
+        in_use, capacity = db_pool_usage()
+        return capacity > 0 and in_use >= capacity * self.settings.ADMISSION_DB_POOL_SATURATION
+
+    def retry_after(self) -> int:
+        """Seconds until the current backlog is likely to have drained."""
+        backlog = (self.queued + 1) / max(self.max_in_flight, 1)
+        return min(MAX_RETRY_AFTER_S, max(1, math.ceil(self.service_time_s * backlog)))
+
+    def _reject(self, reason: str) -> Overloaded:
+        self.shed += 1
+        self._shed_at = time.monotonic()
+        return Overloaded(reason, self.retry_after())
+
+    @asynccontextmanager
+    async def admit(self, max_wait_s: Optional[float] = None) -> AsyncIterator[None]:
+        """Hold a check slot for the duration of the block.
+
+        Args:
+            max_wait_s: Longest the caller can wait for a slot; capped at
+                ``ADMISSION_MAX_QUEUE_WAIT_MS``
+
+        Raises:
+            Overloaded: The request was shed
+        """
+        if self.db_saturated():
+            raise self._reject("database pool saturated")
+
+        wait_s = self.settings.ADMISSION_MAX_QUEUE_WAIT_MS / 1000
+        if max_wait_s is not None:
+            wait_s = min(wait_s, max_wait_s)
+
+        started = time.monotonic()
+        if not self.slots.locked():
+            await self.slots.acquire()  # a free slot is taken without suspending
+        else:
+            # Waiting only helps if a slot is likely to free up in time
+            if self.queued >= self.max_queue or self.queue_wait_s > wait_s:
+                raise self._reject("too many checks in progress")
+            self.queued += 1
+            try:
+                await asyncio.wait_for(self.slots.acquire(), timeout=max(wait_s, 0))
+            except asyncio.TimeoutError:
+                raise self._reject("queue wait exceeded") from None
+            finally:
+                self.queued -= 1
+
+        admitted_at = time.monotonic()
+        self.queue_wait_s += EWMA_ALPHA * (admitted_at - started - self.queue_wait_s)
+        self.admitted += 1
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self.slots.release()
+            self.service_time_s += EWMA_ALPHA * (
+                time.monotonic() - admitted_at - self.service_time_s
+            )
+
+    def stats(self) -> AdmissionStats:
+        """Current load; not ready while queueing heavily, shedding or out of connections."""
+        in_use, capacity = db_pool_usage()
+        recently_shed = (
+            time.monotonic() - self._shed_at < self.settings.ADMISSION_READY_COOLDOWN_S
+        )
+        return AdmissionStats(
+            ready=not (
+                recently_shed or self.queued * 2 > self.max_queue or self.db_saturated()
+            ),
+            in_flight=self.in_flight,
+            max_in_flight=self.max_in_flight,
+            queued=self.queued,
+            max_queue=self.max_queue,
+            queue_wait_ms=round(self.queue_wait_s * 1000, 1),
+            service_time_ms=round(self.service_time_s * 1000, 1),
+            db_pool_in_use=in_use,
+            db_pool_capacity=capacity,
+            admitted=self.admitted,
+            shed=self.shed,
+        )
+
+
+admission_controller = AdmissionController()
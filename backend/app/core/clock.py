@@ -0,0 +1,112 @@
+"""Wall and virtual clocks.
+
+Code that simulates time (the mock provider, benchmarks, tests) takes its
+time and sleeps from a clock so a ``VirtualClock`` can replace real time
+and run hours of simulated traffic in seconds.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Optional
+
+from app.config import get_settings
+
+
+class SystemClock:
+    """Clock backed by real time."""
+
+    def time(self) -> float:
+        """Get the current time as a UNIX timestamp."""
+        return time.time()
+
+    def now(self) -> datetime:
+        """Get the current UTC time."""
+        return datetime.utcnow()
+
+    async def sleep(self, seconds: float) -> None:
+        """Sleep for ``seconds`` of real time."""
+        await asyncio.sleep(seconds)
+
+
+class VirtualClock:
+    """Discrete-event clock where sleeping advances simulated time.
+
+    Sleepers are kept in a deadline heap. With ``auto_advance`` enabled the
+    clock jumps straight to the earliest deadline once the event loop has
+    had a chance to run other ready tasks, so concurrent sleeps overlap the
+    way they would in real time. With it disabled, time only moves when
+    ``advance`` is called.
+    """
+
+    def __init__(self, start: Optional[datetime] = None, auto_advance: bool = True):
+        """Start at ``start`` (naive means UTC, like ``now()``), or the current time."""
+        if start is None:
+            self._now = time.time()
+        elif start.tzinfo is None:
+            # A naive datetime's .timestamp() would read it as local time
+            self._now = start.replace(tzinfo=timezone.utc).timestamp()
+        else:
+            self._now = start.timestamp()
+        self._sleepers: list[tuple[float, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._driver: Optional[asyncio.Task] = None
+        self.auto_advance = auto_advance
+
+    def time(self) -> float:
+        """Get the simulated time as a UNIX timestamp."""
+        return self._now
+
+    def now(self) -> datetime:
+        """Get the simulated UTC time."""
+        return datetime.utcfromtimestamp(self._now)
+
+    async def sleep(self, seconds: float) -> None:
+        """Sleep for ``seconds`` of simulated time."""
+        if seconds <= 0:
+            await asyncio.sleep(0)
+            return
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        heapq.heappush(self._sleepers, (self._now + seconds, next(self._sequence), future))
+
+        if self.auto_advance and (self._driver is None or self._driver.done()):
+            self._driver = loop.create_task(self._drive())
+
+        await future
+
+    def advance(self, seconds: float) -> None:
+        """Move simulated time forward, waking every sleeper that falls due."""
+        target = self._now + seconds
+        self._release_until(target)
+        self._now = target
+
+    def _release_until(self, target: float) -> None:
+        while self._sleepers and self._sleepers[0][0] <= target:
+            deadline, _, future = heapq.heappop(self._sleepers)
+            self._now = max(self._now, deadline)
+            if not future.done():
+                future.set_result(None)
+
+    async def _drive(self) -> None:
+        while self._sleepers:
+            # Let runnable tasks reach their next sleep before jumping ahead
+            for _ in range(3):
+                await asyncio.sleep(0)
+            if self._sleepers:
+                self._release_until(self._sleepers[0][0])
+
+
+Clock = SystemClock | VirtualClock
+
+
+@lru_cache()
+def get_clock() -> Clock:
+    """Get the process-wide clock, virtual when MOCK_VIRTUAL_CLOCK is set."""
+    if get_settings().MOCK_VIRTUAL_CLOCK:
+        return VirtualClock()
+    return SystemClock()
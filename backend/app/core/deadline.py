@@ -0,0 +1,72 @@
+"""Request deadlines.
+
+A client states how long it will wait with an ``X-Request-Timeout-Ms``
+header or a ``timeout_ms`` query parameter; otherwise the server default
+applies. The resulting ``Deadline`` is passed down to the service layer,
+which checks it before each stage and bounds provider calls and database
+writes by the time remaining, so no work continues after the client has
+given up.
+"""
+
+import asyncio
+import time
+from typing import Awaitable, TypeVar
+
+from app.core.exceptions import CareLinkeException
+
+T = TypeVar("T")
+
+
+class DeadlineExceeded(CareLinkeException):
+    """The request deadline passed before the work completed."""
+
+    def __init__(self, stage: str):
+        super().__init__(
+            message=f"Request deadline exceeded during {stage}",
+            status_code=504,
+            details={"stage": stage},
+        )
+        self.stage = stage
+
+
+class Deadline:
+    """A point in time after which the caller no longer wants the result."""
+
+    def __init__(self, timeout_s: float):
+        self.timeout_s = timeout_s
+        self.expires_at = time.monotonic() + timeout_s
+
+    def remaining(self) -> float:
+        """Seconds left, never negative."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def check(self, stage: str) -> None:
+        """Raise DeadlineExceeded if no time is left to start ``stage``."""
+        if self.expired:
+            raise DeadlineExceeded(stage)
+
+    async def run(self, awaitable: Awaitable[T], stage: str, reserve_s: float = 0.0) -> T:
+        """Await ``awaitable``, cancelling it when the deadline comes.
+
+        Args:
+            awaitable: Work to bound
+            stage: Name reported if the deadline passes
+            reserve_s: Time kept back for the work that follows, e.g.
+                writing the result
+
+        Returns:
+            The awaitable's result
+        """
+        budget = self.remaining() - reserve_s
+        if budget <= 0:
+            if asyncio.iscoroutine(awaitable):
+                awaitable.close()
+            raise DeadlineExceeded(stage)
+        try:
+            return await asyncio.wait_for(awaitable, budget)
+        except asyncio.TimeoutError:
+            raise DeadlineExceeded(stage) from None
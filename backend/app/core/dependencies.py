@@ -3,15 +3,57 @@
 from typing import Optional
 from uuid import UUID
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, Header, HTTPException, Query, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.config import get_settings
+from app.database import get_db, replica_router
+from app.core import logs, timing
+from app.core.admission import Overloaded, admission_controller
+from app.core.deadline import Deadline
+from app.core.rate_limit import rate_limiter
 from app.models.user import User, UserRole
 from app.core.security import decode_token
 
+logger = logs.get_logger("auth")
+
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
+
+
+def _unauthorized(detail: str, challenge: bool = True) -> HTTPException:
+    """Build a 401 and log why the caller was rejected."""
+    logger.info("Authentication rejected: %s", detail)
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"} if challenge else None,
+    )
+
+
+def _user_from_token(token: str, db: Session) -> User:
+    """Resolve an active user from a JWT access token."""
+    with timing.phase("auth"):
+        payload = decode_token(token)
+
+        if payload is None:
+            raise _unauthorized("Invalid or expired token")
+
+        user_id = payload.get("sub")
+        if user_id is None:
+            raise _unauthorized("Invalid token payload")
+
+        user = db.query(User).filter(User.id == UUID(user_id)).first()
+        if user is None:
+            raise _unauthorized("User not found")
+
+        if not user.is_active:
+            raise _unauthorized("User account is disabled", challenge=False)
+
+    # Every later record of this request names the caller
+    logs.bind(user_id=str(user.id), organization_id=str(user.organization_id))
+    return user
 
 
 async def get_current_user(
@@ -19,39 +61,77 @@ async def get_current_user(
     db: Session = Depends(get_db),
 ) -> User:
     """Get the current authenticated user from JWT token."""
-    token = credentials.credentials
-    payload = decode_token(token)
+    return _user_from_token(credentials.credentials, db)
 
-    if payload is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired token",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
 
-    user_id = payload.get("sub")
-    if user_id is None:
+async def get_current_user_for_stream(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
+    access_token: Optional[str] = Query(None),
+    db: Session = Depends(get_db),
+) -> User:
+    """Get the current user for event streams.
+
+    Browser EventSource cannot set headers, so the token may also be passed
+    as an ``access_token`` query parameter.
+    """
+    token = credentials.credentials if credentials else access_token
+    if not token:
+        raise _unauthorized("Not authenticated")
+    return _user_from_token(token, db)
+
+
+def get_client_ip(request: Request) -> Optional[str]:
+    """Get the client address for audit records."""
+    return request.client.host if request.client else None
+
+
+def get_deadline(
+    x_request_timeout_ms: Optional[int] = Header(default=None, ge=1),
+    timeout_ms: Optional[int] = Query(
+        default=None, ge=1, description="Milliseconds the client will wait for the result"
+    ),
+) -> Deadline:
+    """Get the request deadline, capped at REQUEST_DEADLINE_MAX_MS.
+
+    The header takes precedence over the query parameter; without either
+    the server default applies.
+    """
+    settings = get_settings()
+    requested = x_request_timeout_ms or timeout_ms or settings.REQUEST_DEADLINE_DEFAULT_MS
+    return Deadline(min(requested, settings.REQUEST_DEADLINE_MAX_MS) / 1000)
+
+
+async def admit_check(deadline: Deadline = Depends(get_deadline)):
+    """Hold an admission slot for an eligibility check, or shed it with 503.
+
+    Time spent waiting for a slot counts against the request deadline.
+    """
+    if not get_settings().ADMISSION_ENABLED:
+        yield
+        return
+
+    try:
+        async with admission_controller.admit(max_wait_s=deadline.remaining()):
+            yield
+    except Overloaded as exc:
         raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token payload",
-            headers={"WWW-Authenticate": "Bearer"},
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Server is overloaded ({exc.reason}); retry later",
+            headers={"Retry-After": str(exc.retry_after)},
         )
 
-    user = db.query(User).filter(User.id == UUID(user_id)).first()
-    if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
 
-    if not user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User account is disabled",
-        )
+def get_read_db(current_user: User = Depends(get_current_user)):
+    """Dependency to get a session for read-only queries.
 
-    return user
+    Uses a caught-up replica when one is configured, unless the user wrote
+    recently; otherwise the primary.
+    """
+    db = replica_router.session(current_user.id)
+    try:
+        yield db
+    finally:
+        db.close()
 
 
 async def get_current_active_user(
@@ -85,3 +165,25 @@ def require_role(allowed_roles: list[UserRole]):
 # Convenience dependencies for common role checks
 require_admin = require_role([UserRole.ADMIN])
 require_staff_or_admin = require_role([UserRole.ADMIN, UserRole.STAFF])
+
+
+async def enforce_rate_limit(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+) -> None:
+    """Count the request against the organization's rate limit."""
+    if not get_settings().RATE_LIMIT_ENABLED:
+        return
+
+    limit = rate_limiter.limit_for(current_user.organization_id, db)
+    decision = rate_limiter.hit(current_user.organization_id, limit)
+    if not decision.allowed:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Rate limit exceeded for your organization",
+            headers={
+                "Retry-After": str(decision.retry_after),
+                "X-RateLimit-Limit": str(decision.limit),
+                "X-RateLimit-Remaining": "0",
+            },
+        )
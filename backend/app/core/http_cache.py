@@ -0,0 +1,48 @@
+"""HTTP validators and conditional GET helpers."""
+
+import hashlib
+from typing import Optional
+
+from fastapi import Response, status
+
+from app.core.serialization import JSONBytesResponse
+
+
+def make_etag(body: bytes) -> str:
+    """Strong ETag derived from the exact response bytes."""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Evaluate an If-None-Match header against ``etag``.
+
+    If-None-Match uses weak comparison (RFC 9110 13.1.2), so a ``W/``
+    prefix on the client's tag is ignored.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def conditional_response(
+    body: bytes,
+    if_none_match: Optional[str],
+    cache_control: str,
+    etag: Optional[str] = None,
+) -> Response:
+    """Return 304 when the client's copy is current, else the JSON body."""
+    etag = etag or make_etag(body)
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return JSONBytesResponse(body, headers=headers)
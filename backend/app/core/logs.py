@@ -0,0 +1,167 @@
+"""Structured JSON logging with a background writer.
+
+Application loggers (``carelink.*``) never format or write on the calling
+thread. A ``DroppingQueueHandler`` only stamps each record with the
+request's context and puts it on a bounded queue. A ``QueueListener``
+thread then encodes the records as one JSON object per line and writes
+them to stdout. When the queue is full, records are dropped and counted
+instead of blocking the event loop.
+
+Every record carries the current request ID (from ``RequestIdMiddleware``)
+and any fields bound with ``bind()``, such as the user and organization
+set by ``get_current_user``. Records from a request, the service and the
+provider can therefore be joined on ``request_id``.
+
+Sampling is decided once per request, so a sampled request keeps all of
+its INFO records and an unsampled one keeps none. Warnings and errors are
+always kept, as are records logged outside a request.
+"""
+
+import logging
+import queue
+import random
+import sys
+import threading
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Optional
+
+import orjson
+
+from app.config import get_settings
+
+LOGGER_NAME = "carelink"
+
+request_id: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+request_sampled: ContextVar[bool] = ContextVar("request_sampled", default=True)
+_bound_fields: ContextVar[dict[str, Any]] = ContextVar("log_fields", default={})
+
+# LogRecord attributes that are not user-supplied ``extra`` fields
+_RECORD_ATTRIBUTES = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Get an application logger, e.g. ``get_logger("eligibility")``."""
+    return logging.getLogger(f"{LOGGER_NAME}.{name}")
+
+
+def bind(**fields: Any) -> None:
+    """Add fields to every record logged in the current context."""
+    _bound_fields.set({**_bound_fields.get(), **fields})
+
+
+def sample_request() -> bool:
+    """Decide whether the current request's INFO records are kept."""
+    sampled = random.random() < get_settings().LOG_INFO_SAMPLE_RATE
+    request_sampled.set(sampled)
+    return sampled
+
+
+class JSONFormatter(logging.Formatter):
+    """One JSON object per record, with ``extra`` fields at the top level."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc"] = record.exc_text
+        return orjson.dumps(entry, default=str).decode()
+
+
+class DroppingQueueHandler(QueueHandler):
+    """Queue handler that samples, stamps context, and never blocks."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+        self.sampled_out = 0
+        self._lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Formatting is left to the writer; only make the record safe to hand over
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        record.request_id = request_id.get()
+        for key, value in _bound_fields.get().items():
+            setattr(record, key, value)
+        return record
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if record.levelno < logging.WARNING and not request_sampled.get():
+            with self._lock:
+                self.sampled_out += 1
+            return
+        try:
+            self.queue.put_nowait(self.prepare(record))
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+        except Exception:
+            self.handleError(record)
+
+    def metrics(self) -> dict[str, int]:
+        """Queue depth and records lost to sampling or a full queue."""
+        return {
+            "queued": self.queue.qsize(),
+            "capacity": self.queue.maxsize,
+            "dropped": self.dropped,
+            "sampled_out": self.sampled_out,
+        }
+
+
+_handler: Optional[DroppingQueueHandler] = None
+_listener: Optional[QueueListener] = None
+
+
+def start() -> DroppingQueueHandler:
+    """Attach the queue handler to the ``carelink`` logger and start the writer.
+
+    Called from each worker's lifespan, after any fork; safe to call again.
+    """
+    global _handler, _listener
+    if _listener is not None:
+        return _handler
+
+    settings = get_settings()
+    writer = logging.StreamHandler(sys.stdout)
+    writer.setFormatter(JSONFormatter())
+
+    _handler = DroppingQueueHandler(queue.Queue(maxsize=settings.LOG_QUEUE_MAX))
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.setLevel(settings.LOG_LEVEL.upper())
+    logger.addHandler(_handler)
+    logger.propagate = False
+
+    _listener = QueueListener(_handler.queue, writer)
+    _listener.start()
+    return _handler
+
+
+def stop() -> None:
+    """Write out queued records and stop the writer thread."""
+    global _handler, _listener
+    if _listener is None:
+        return
+    logging.getLogger(LOGGER_NAME).removeHandler(_handler)
+    _listener.stop()
+    _handler, _listener = None, None
+
+
+def metrics() -> Optional[dict[str, int]]:
+    """Logging queue counters, or None before ``start()``."""
+    return _handler.metrics() if _handler else None
@@ -0,0 +1,201 @@
+"""On-demand CPU and memory profiling for running workers.
+
+Nothing in this module is active until an admin endpoint asks for it, so
+there is no overhead on the request path while profiling is off.
+"""
+
+import asyncio
+import cProfile
+import io
+import marshal
+import os
+import pstats
+import sys
+import threading
+import tracemalloc
+from collections import Counter, OrderedDict
+from typing import Any, Awaitable, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Only one profiler may own the interpreter's profiling hooks at a time
+profiling_lock = asyncio.Lock()
+
+# Keep a bounded number of tracemalloc snapshots per worker
+MAX_SNAPSHOTS = 10
+_snapshots: "OrderedDict[int, tracemalloc.Snapshot]" = OrderedDict()
+_next_snapshot_id = 1
+
+
+def _collapse_frame(frame) -> str:
+    """Render a frame and its callers as a root-first collapsed stack."""
+    parts = []
+    while frame is not None:
+        code = frame.f_code
+        parts.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+        frame = frame.f_back
+    parts.reverse()
+    return ";".join(parts)
+
+
+class SamplingProfiler:
+    """Statistical profiler that samples every thread's stack on a timer.
+
+    Output is in the collapsed-stack format understood by flamegraph.pl
+    and speedscope: one ``frame;frame;frame count`` line per unique stack.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.samples = 0
+        self._stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _run(self) -> None:
+        own_ident = threading.get_ident()
+        thread_names = {t.ident: t.name for t in threading.enumerate()}
+        while not self._stop.wait(self.interval):
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+                name = thread_names.get(ident, str(ident))
+                self._stacks[f"{name};{_collapse_frame(frame)}"] += 1
+            self.samples += 1
+
+    def start(self) -> None:
+        """Start sampling in a daemon thread."""
+        self._thread = threading.Thread(
+            target=self._run, name="sampling-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampler thread to exit."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def collapsed(self) -> str:
+        """Return the collected samples as collapsed stacks."""
+        return "\n".join(
+            f"{stack} {count}" for stack, count in self._stacks.most_common()
+        )
+
+
+async def sample_cpu(duration: float, interval: float) -> str:
+    """Sample all threads for ``duration`` seconds and return collapsed stacks."""
+    profiler = SamplingProfiler(interval=interval)
+    profiler.start()
+    try:
+        await asyncio.sleep(duration)
+    finally:
+        await asyncio.to_thread(profiler.stop)
+    return profiler.collapsed()
+
+
+async def profile_event_loop(duration: float) -> bytes:
+    """Run cProfile on the event loop thread for ``duration`` seconds.
+
+    All request handlers share the loop thread, so this captures every
+    coroutine that runs during the window. Returns the same binary format
+    as ``cProfile.Profile.dump_stats``, loadable with ``pstats.Stats``.
+    """
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        await asyncio.sleep(duration)
+    finally:
+        profiler.disable()
+    profiler.create_stats()
+    return marshal.dumps(profiler.stats)
+
+
+async def profile_awaitable(awaitable: Awaitable[T], limit: int = 40) -> tuple[T, str]:
+    """Await ``awaitable`` under cProfile and return its result with a text report."""
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        result = await awaitable
+    finally:
+        profiler.disable()
+
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(limit)
+    return result, stream.getvalue()
+
+
+def take_snapshot(frames: int = 10) -> tuple[int, tracemalloc.Snapshot]:
+    """Take a tracemalloc snapshot, starting tracing on first use."""
+    global _next_snapshot_id
+
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(frames)
+
+    snapshot = tracemalloc.take_snapshot().filter_traces(
+        (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        )
+    )
+    snapshot_id = _next_snapshot_id
+    _next_snapshot_id += 1
+
+    _snapshots[snapshot_id] = snapshot
+    while len(_snapshots) > MAX_SNAPSHOTS:
+        _snapshots.popitem(last=False)
+
+    return snapshot_id, snapshot
+
+
+def get_snapshot(snapshot_id: int) -> Optional[tracemalloc.Snapshot]:
+    """Get a stored snapshot by ID."""
+    return _snapshots.get(snapshot_id)
+
+
+def list_snapshot_ids() -> list[int]:
+    """Get IDs of stored snapshots, oldest first."""
+    return list(_snapshots)
+
+
+def stop_tracing() -> None:
+    """Stop tracemalloc and drop stored snapshots."""
+    _snapshots.clear()
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def top_allocations(
+    snapshot: tracemalloc.Snapshot,
+    limit: int = 25,
+    key_type: str = "lineno",
+) -> list[dict[str, Any]]:
+    """Summarize the largest allocation sites in a snapshot."""
+    return [
+        {
+            "location": str(stat.traceback),
+            "size_bytes": stat.size,
+            "count": stat.count,
+        }
+        for stat in snapshot.statistics(key_type)[:limit]
+    ]
+
+
+def diff_snapshots(
+    base: tracemalloc.Snapshot,
+    target: tracemalloc.Snapshot,
+    limit: int = 25,
+    key_type: str = "lineno",
+) -> list[dict[str, Any]]:
+    """Compare two snapshots and return the largest growth sites."""
+    return [
+        {
+            "location": str(stat.traceback),
+            "size_bytes": stat.size,
+            "size_diff_bytes": stat.size_diff,
+            "count": stat.count,
+            "count_diff": stat.count_diff,
+        }
+        for stat in target.compare_to(base, key_type)[:limit]
+    ]
@@ -0,0 +1,163 @@
+"""Per-organization request rate limiting.
+
+Limits are requests per ``RATE_LIMIT_WINDOW_SECONDS``, derived from the
+organization's subscription tier unless overridden for that organization.
+Counting uses a sliding window counter: the previous fixed window's count is
+weighted by how much of it still overlaps the sliding window. A single Lua
+script reads both windows, admits or rejects, and records per-organization
+metrics, so each check is one Redis round-trip.
+"""
+
+import json
+import math
+import time
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+import redis
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.core.redis_pool import get_redis
+from app.models.organization import Organization, SubscriptionTier
+
+KEY_PREFIX = "ratelimit:"
+METRICS_KEY = "ratelimit:metrics"
+
+# How long an organization's limit is reused before its tier is re-read
+LIMIT_CACHE_SECONDS = 60
+
+# KEYS[1] current window, KEYS[2] previous window, KEYS[3] metrics hash
+# ARGV: limit, window seconds, seconds elapsed in current window, org id
+SLIDING_WINDOW_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local elapsed = tonumber(ARGV[3])
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+local weight = (window - elapsed) / window
+local count = previous * weight + current
+
+if count + 1 > limit then
+    redis.call('HINCRBY', KEYS[3], ARGV[4] .. ':limited', 1)
+    local retry_after
+    if current + 1 > limit then
+        -- Wait for this window to become the previous one and decay enough
+        retry_after = (window - elapsed) + window * (1 - (limit - 1) / current)
+    else
+        -- Wait for the previous window's share to decay enough
+        retry_after = window * (1 - (limit - 1 - current) / previous) - elapsed
+    end
+    return {0, math.ceil(count), tostring(retry_after)}
+end
+
+redis.call('INCR', KEYS[1])
+redis.call('EXPIRE', KEYS[1], window * 2)
+redis.call('HINCRBY', KEYS[3], ARGV[4] .. ':allowed', 1)
+return {1, math.ceil(count + 1), '0'}
+"""
+
+
+@dataclass
+class RateLimitDecision:
+    """Outcome of one rate limit check."""
+
+    allowed: bool
+    limit: int
+    count: int
+    retry_after: int = 0
+
+
+class OrganizationRateLimiter:
+    """Sliding-window limiter keyed by organization."""
+
+    def __init__(self):
+        self.settings = get_settings()
+        self._script: Optional[redis.commands.core.Script] = None
+        self._limits: dict[UUID, tuple[int, float]] = {}
+
+    @property
+    def redis_client(self) -> Optional[redis.Redis]:
+        """Shared Redis client; None when Redis is unavailable (no limiting)."""
+        client = get_redis()
+        if client is not None and self._script is None:
+            self._script = client.register_script(SLIDING_WINDOW_SCRIPT)
+        return client
+
+    def tier_limits(self) -> dict[SubscriptionTier, int]:
+        """Requests per window for each subscription tier."""
+        return {
+            SubscriptionTier.TRIAL: self.settings.RATE_LIMIT_TRIAL,
+            SubscriptionTier.BASIC: self.settings.RATE_LIMIT_BASIC,
+            SubscriptionTier.PROFESSIONAL: self.settings.RATE_LIMIT_PROFESSIONAL,
+        }
+
+    def overrides(self) -> dict[str, int]:
+        """Per-organization limits that replace the tier limit."""
+        return json.loads(self.settings.RATE_LIMIT_ORG_OVERRIDES)
+
+    def limit_for(self, organization_id: UUID, db: Session) -> int:
+        """Get an organization's limit, re-reading its tier at most once a minute."""
+        cached = self._limits.get(organization_id)
+        now = time.monotonic()
+        if cached and cached[1] > now:
+            return cached[0]
+
+        override = self.overrides().get(str(organization_id))
+        if override is not None:
+            limit = int(override)
+        else:
+            tier = (
+                db.query(Organization.subscription_tier)
+                .filter(Organization.id == organization_id)
+                .scalar()
+            )
+            limit = self.tier_limits()[tier or SubscriptionTier.TRIAL]
+
+        self._limits[organization_id] = (limit, now + LIMIT_CACHE_SECONDS)
+        return limit
+
+    def hit(self, organization_id: UUID, limit: int) -> RateLimitDecision:
+        """Count one request against the organization's limit."""
+        window = self.settings.RATE_LIMIT_WINDOW_SECONDS
+        if limit <= 0:
+            # An override of 0 suspends the organization's API access
+            return RateLimitDecision(allowed=False, limit=0, count=0, retry_after=window)
+        if not self.redis_client:
+            return RateLimitDecision(allowed=True, limit=limit, count=0)
+
+        now = time.time()
+        index = int(now // window)
+        try:
+            allowed, count, retry_after = self._script(
+                keys=[
+                    f"{KEY_PREFIX}{organization_id}:{index}",
+                    f"{KEY_PREFIX}{organization_id}:{index - 1}",
+                    METRICS_KEY,
+                ],
+                args=[limit, window, now - index * window, str(organization_id)],
+            )
+        except redis.RedisError:
+            # Never turn a cache outage into an API outage
+            return RateLimitDecision(allowed=True, limit=limit, count=0)
+
+        return RateLimitDecision(
+            allowed=bool(allowed),
+            limit=limit,
+            count=int(count),
+            retry_after=max(1, math.ceil(float(retry_after))) if not allowed else 0,
+        )
+
+    def metrics(self, organization_id: UUID) -> dict[str, int]:
+        """Allowed and limited request counts for an organization."""
+        if not self.redis_client:
+            return {"allowed": 0, "limited": 0}
+
+        allowed, limited = self.redis_client.hmget(
+            METRICS_KEY, f"{organization_id}:allowed", f"{organization_id}:limited"
+        )
+        return {"allowed": int(allowed or 0), "limited": int(limited or 0)}
+
+
+rate_limiter = OrganizationRateLimiter()
@@ -0,0 +1,47 @@
+"""Shared Redis client.
+
+Every component in a worker process uses one client and so one connection
+pool, which startup can pre-warm. The client is created on first successful
+connection; while Redis is unreachable, callers get None and carry on
+without caching.
+"""
+
+from typing import Optional
+
+import redis
+
+from app.config import get_settings
+
+_client: Optional[redis.Redis] = None
+
+
+def get_redis() -> Optional[redis.Redis]:
+    """Get the process-wide Redis client, or None if Redis is unavailable."""
+    global _client
+    if _client is None:
+        # Raw bytes: cached payloads are decoded by orjson directly
+        client = redis.from_url(get_settings().REDIS_URL)
+        try:
+            client.ping()
+        except redis.ConnectionError:
+            client.close()
+            return None
+        _client = client
+    return _client
+
+
+def warm_up(connections: int) -> int:
+    """Open ``connections`` pooled connections ahead of traffic.
+
+    Returns:
+        Number of connections opened
+    """
+    client = get_redis()
+    if client is None:
+        return 0
+
+    pool = client.connection_pool
+    opened = [pool.get_connection("PING") for _ in range(connections)]
+    for connection in opened:
+        pool.release(connection)
+    return len(opened)
@@ -0,0 +1,279 @@
+"""Eligibility cache sharded over several Redis nodes.
+
+With ``REDIS_CACHE_URLS`` set, cached payloads (``eligibility:*`` keys) are
+spread over those nodes by consistent hashing: each node owns
+``REDIS_CACHE_VNODES`` points on a hash ring and a key lives on the node
+owning the first point at or after the key's hash. Adding or removing a
+node only moves the keys between its points and their predecessors,
+about 1/N of the keyspace, and many virtual nodes keep the shares even.
+
+Nodes are pinged every ``REDIS_CACHE_HEALTH_INTERVAL_S``. A node that
+fails a ping or a command leaves the ring, so its keys fall to the next
+nodes (cold misses rather than errors), and rejoins once it answers again.
+Entries it kept while out may be older than ones written elsewhere
+meanwhile; they are bounded by their TTLs like any cached result.
+
+Everything else (rate limits, locks, sticky reads, pub/sub) stays on
+``REDIS_URL``.
+"""
+
+import bisect
+import hashlib
+import json
+import threading
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Optional, Union
+
+import redis
+
+from app.config import get_settings
+from app.core.redis_pool import get_redis
+
+# Failures that take a node out of the ring; other errors are bugs and propagate
+NODE_ERRORS = (redis.ConnectionError, redis.TimeoutError)
+
+
+def _hash(value: Union[str, bytes]) -> int:
+    if isinstance(value, str):
+        value = value.encode()
+    return int.from_bytes(hashlib.blake2b(value, digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """Consistent hash ring with virtual nodes."""
+
+    def __init__(self, nodes: Iterable[str] = (), vnodes: int = 160):
+        self.vnodes = vnodes
+        self._points: list[int] = []
+        self._owners: list[str] = []
+        self.nodes: set[str] = set()
+        for node in nodes:
+            self.add(node)
+
+    def _rebuild(self, nodes: set[str]) -> None:
+        ring = sorted(
+            (_hash(f"{node}#{index}"), node) for node in nodes for index in range(self.vnodes)
+        )
+        # Swap both lists at once so concurrent lookups see a consistent ring
+        self._points, self._owners = [point for point, _ in ring], [node for _, node in ring]
+        self.nodes = nodes
+
+    def add(self, node: str) -> None:
+        if node not in self.nodes:
+            self._rebuild(self.nodes | {node})
+
+    def remove(self, node: str) -> None:
+        if node in self.nodes:
+            self._rebuild(self.nodes - {node})
+
+    def node_for(self, key: Union[str, bytes]) -> Optional[str]:
+        """Get the node owning ``key``, or None when the ring is empty."""
+        points, owners = self._points, self._owners
+        if not points:
+            return None
+        index = bisect.bisect(points, _hash(key))
+        return owners[index % len(owners)]
+
+    def shares(self) -> dict[str, float]:
+        """Fraction of the hash space owned by each node."""
+        points, owners = self._points, self._owners
+        shares = dict.fromkeys(self.nodes, 0.0)
+        for index, point in enumerate(points):
+            previous = points[index - 1] if index else points[-1] - 2**64
+            shares[owners[index]] += (point - previous) / 2**64
+        return shares
+
+
+@dataclass
+class CacheShard:
+    """A cache node and its last observed state."""
+
+    name: str
+    client: redis.Redis
+    healthy: bool = False
+    checked_at: float = float("-inf")  # monotonic; never checked yet
+
+
+class ShardedRedis:
+    """Redis client subset used for cached payloads, routed per key.
+
+    Supports ``get``, ``mget``, ``set``, ``setex``, ``delete`` and
+    non-transactional pipelines of those. Commands for a node that is down
+    behave like misses: reads return None and writes are dropped.
+    """
+
+    def __init__(
+        self,
+        urls: list[str],
+        vnodes: int = 160,
+        health_interval_s: float = 5.0,
+        socket_timeout_s: Optional[float] = None,
+    ):
+        self.shards: dict[str, CacheShard] = {}
+        for url in urls:
+            client = redis.from_url(
+                url, socket_timeout=socket_timeout_s, socket_connect_timeout=socket_timeout_s
+            )
+            kwargs = client.connection_pool.connection_kwargs
+            name = f"{kwargs.get('host', 'localhost')}:{kwargs.get('port', 6379)}/{kwargs.get('db', 0)}"
+            self.shards[name] = CacheShard(name=name, client=client)
+        self.ring = HashRing(vnodes=vnodes)
+        self.health_interval_s = health_interval_s
+        self._refresh_lock = threading.Lock()
+        self._refresh()
+
+    def _check(self, shard: CacheShard) -> None:
+        try:
+            shard.client.ping()
+            shard.healthy = True
+        except NODE_ERRORS:
+            shard.healthy = False
+        shard.checked_at = time.monotonic()
+
+    def _refresh(self) -> None:
+        """Re-ping nodes whose health is stale and update the ring."""
+        stale_before = time.monotonic() - self.health_interval_s
+        if not any(shard.checked_at < stale_before for shard in self.shards.values()):
+            return
+        if not self._refresh_lock.acquire(blocking=False):
+            return
+        try:
+            for shard in self.shards.values():
+                if shard.checked_at < stale_before:
+                    self._check(shard)
+                if shard.healthy:
+                    self.ring.add(shard.name)
+                else:
+                    self.ring.remove(shard.name)
+        finally:
+            self._refresh_lock.release()
+
+    def _mark_down(self, shard: CacheShard) -> None:
+        shard.healthy = False
+        shard.checked_at = time.monotonic()
+        self.ring.remove(shard.name)
+
+    def shard_for(self, key: Union[str, bytes]) -> Optional[CacheShard]:
+        """Get the healthy node holding ``key``, or None when all are down."""
+        self._refresh()
+        name = self.ring.node_for(key)
+        return self.shards[name] if name is not None else None
+
+    def _call(self, key: Union[str, bytes], command: str, *args, **kwargs):
+        shard = self.shard_for(key)
+        if shard is None:
+            return None
+        try:
+            return getattr(shard.client, command)(key, *args, **kwargs)
+        except NODE_ERRORS:
+            self._mark_down(shard)
+            return None
+
+    def get(self, key: Union[str, bytes]) -> Optional[bytes]:
+        return self._call(key, "get")
+
+    def set(self, key: Union[str, bytes], value, **kwargs) -> Optional[bool]:
+        return self._call(key, "set", value, **kwargs)
+
+    def setex(self, key: Union[str, bytes], ttl: int, value) -> Optional[bool]:
+        return self._call(key, "setex", ttl, value)
+
+    def delete(self, key: Union[str, bytes]) -> int:
+        return self._call(key, "delete") or 0
+
+    def mget(self, *keys: Union[str, bytes]) -> list[Optional[bytes]]:
+        """Get many keys with one MGET per node."""
+        pipe = self.pipeline()
+        for key in keys:
+            pipe.get(key)
+        return pipe.execute()
+
+    def pipeline(self, transaction: bool = False) -> "ShardedPipeline":
+        if transaction:
+            raise ValueError("Transactions cannot span cache shards")
+        return ShardedPipeline(self)
+
+    def status(self) -> list[dict]:
+        """Health and hash space share of each node."""
+        self._refresh()
+        shares = self.ring.shares()
+        return [
+            {"name": name, "healthy": shard.healthy, "share": round(shares.get(name, 0.0), 4)}
+            for name, shard in self.shards.items()
+        ]
+
+
+class ShardedPipeline:
+    """Commands buffered per node and sent as one pipeline per node."""
+
+    def __init__(self, sharded: ShardedRedis):
+        self.sharded = sharded
+        self._commands: list[tuple[str, Union[str, bytes], tuple, dict]] = []
+
+    def _add(self, command: str, key: Union[str, bytes], *args, **kwargs) -> "ShardedPipeline":
+        self._commands.append((command, key, args, kwargs))
+        return self
+
+    def get(self, key: Union[str, bytes]) -> "ShardedPipeline":
+        return self._add("get", key)
+
+    def set(self, key: Union[str, bytes], value, **kwargs) -> "ShardedPipeline":
+        return self._add("set", key, value, **kwargs)
+
+    def setex(self, key: Union[str, bytes], ttl: int, value) -> "ShardedPipeline":
+        return self._add("setex", key, ttl, value)
+
+    def delete(self, key: Union[str, bytes]) -> "ShardedPipeline":
+        return self._add("delete", key)
+
+    def execute(self) -> list:
+        """Run the commands; results are in command order, None for down nodes."""
+        commands, self._commands = self._commands, []
+        results: list = [None] * len(commands)
+
+        by_shard: dict[str, list[int]] = {}
+        for index, (_, key, _, _) in enumerate(commands):
+            shard = self.sharded.shard_for(key)
+            if shard is not None:
+                by_shard.setdefault(shard.name, []).append(index)
+
+        for name, indexes in by_shard.items():
+            shard = self.sharded.shards[name]
+            gets = all(commands[index][0] == "get" for index in indexes)
+            try:
+                if gets:
+                    replies = shard.client.mget([commands[index][1] for index in indexes])
+                else:
+                    pipe = shard.client.pipeline(transaction=False)
+                    for index in indexes:
+                        command, key, args, kwargs = commands[index]
+                        getattr(pipe, command)(key, *args, **kwargs)
+                    replies = pipe.execute()
+            except NODE_ERRORS:
+                self.sharded._mark_down(shard)
+                continue
+            for index, reply in zip(indexes, replies):
+                results[index] = reply
+        return results
+
+
+@lru_cache()
+def get_cache_shards() -> Optional[ShardedRedis]:
+    """Get the process-wide sharded cache, or None when not configured."""
+    settings = get_settings()
+    urls = json.loads(settings.REDIS_CACHE_URLS)
+    if not urls:
+        return None
+    return ShardedRedis(
+        urls,
+        vnodes=settings.REDIS_CACHE_VNODES,
+        health_interval_s=settings.REDIS_CACHE_HEALTH_INTERVAL_S,
+        socket_timeout_s=settings.REDIS_CACHE_SOCKET_TIMEOUT_MS / 1000,
+    )
+
+
+def get_cache_redis() -> Optional[Union[ShardedRedis, redis.Redis]]:
+    """Get the client for cached payloads: the shards, else ``REDIS_URL``."""
+    return get_cache_shards() or get_redis()
@@ -0,0 +1,81 @@
+"""Fast JSON serialization for trusted internal data.
+
+Eligibility payloads come from our own provider layer, cache and database,
+so responses built from them skip pydantic validation and are encoded
+straight to bytes with orjson. Output matches the corresponding response
+schemas field for field.
+"""
+
+from typing import Any, Optional
+
+import orjson
+from fastapi.responses import Response
+
+from app.models.eligibility import EligibilityCheck, EligibilityStatus
+from app.schemas.eligibility import CoverageInfo, SubscriberInfo
+
+COVERAGE_FIELDS = tuple(CoverageInfo.model_fields)
+SUBSCRIBER_FIELDS = tuple(SubscriberInfo.model_fields)
+
+
+class JSONBytesResponse(Response):
+    """Response for a body that is already encoded JSON."""
+
+    media_type = "application/json"
+
+
+def dumps(content: Any) -> bytes:
+    """Encode ``content`` as compact JSON bytes."""
+    return orjson.dumps(content)
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode JSON bytes or text."""
+    return orjson.loads(data)
+
+
+def _project(data: Optional[dict], fields: tuple[str, ...]) -> Optional[dict]:
+    """Keep only schema fields, as pydantic would when building the model."""
+    if not data:
+        return None
+    return {name: data.get(name) for name in fields}
+
+
+def _result_status(check: EligibilityCheck) -> str:
+    """Provider status of a check, or "pending" while it is in flight."""
+    if check.status == EligibilityStatus.PENDING:
+        return "pending"
+    return check.response_data.get("status", "error") if check.response_data else "error"
+
+
+def check_response_content(check: EligibilityCheck) -> dict[str, Any]:
+    """Build an ``EligibilityCheckResponse``-shaped dict from a check record."""
+    response_data = check.response_data or {}
+    return {
+        "id": check.id,
+        "status": _result_status(check),
+        "coverage": _project(response_data.get("coverage"), COVERAGE_FIELDS),
+        "subscriber": _project(response_data.get("subscriber"), SUBSCRIBER_FIELDS),
+        "error_message": check.error_message,
+        "response_time_ms": check.response_time_ms,
+        "created_at": check.created_at,
+    }
+
+
+def history_item_content(check: EligibilityCheck) -> dict[str, Any]:
+    """Build an ``EligibilityHistoryItem``-shaped dict from a check record."""
+    response_data = check.response_data
+    return {
+        "id": check.id,
+        "patient_first_name": check.patient_first_name,
+        "patient_last_name": check.patient_last_name,
+        "patient_dob": check.patient_dob,
+        "insurance_company": check.insurance_company,
+        "member_id": check.member_id,
+        "group_number": check.group_number,
+        "status": _result_status(check),
+        "response_data": response_data,
+        "error_message": check.error_message,
+        "response_time_ms": check.response_time_ms,
+        "created_at": check.created_at,
+    }
@@ -0,0 +1,95 @@
+"""Worker warm-up and startup time reporting.
+
+Schema changes are applied by Alembic before the server starts, so worker
+startup only opens connections the first requests would otherwise pay for.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+from sqlalchemy import text
+
+from app import IMPORT_STARTED
+from app.config import get_settings
+from app.core import logs, redis_pool
+from app.database import engine
+from app.insurance import get_insurance_provider
+from app.services.check_events import check_events
+
+logger = logs.get_logger("startup")
+
+_imported_at: Optional[float] = None
+
+
+@dataclass
+class StartupReport:
+    """Startup timings of one worker, in milliseconds."""
+
+    pid: int
+    import_ms: float
+    warm_up_ms: dict[str, float] = field(default_factory=dict)
+    ready_ms: float = 0.0
+
+    def log(self) -> None:
+        steps = ", ".join(f"{name} {ms:.0f} ms" for name, ms in self.warm_up_ms.items())
+        logger.info(
+            "Worker %d ready in %.0f ms (import %.0f ms; warm-up: %s)",
+            self.pid,
+            self.ready_ms,
+            self.import_ms,
+            steps,
+        )
+
+
+def mark_imported() -> None:
+    """Record that the application modules have finished importing."""
+    global _imported_at
+    _imported_at = time.perf_counter()
+
+
+def warm_up_database(connections: int) -> int:
+    """Fill the SQLAlchemy pool with ``connections`` live connections."""
+    opened = [engine.connect() for _ in range(connections)]
+    for connection in opened:
+        connection.execute(text("SELECT 1"))
+    for connection in opened:
+        connection.close()
+    return len(opened)
+
+
+@contextmanager
+def _step(report: StartupReport, name: str) -> Iterator[None]:
+    """Time one warm-up step; a failed step is logged, not raised."""
+    started = time.perf_counter()
+    try:
+        yield
+    except Exception as exc:
+        # A cold dependency only slows the first requests; do not fail startup
+        logger.warning("Warm-up step %s failed: %s", name, exc)
+    report.warm_up_ms[name] = (time.perf_counter() - started) * 1000
+
+
+async def warm_up() -> StartupReport:
+    """Warm the DB and Redis pools and the provider client.
+
+    Returns:
+        Timings for this worker
+    """
+    settings = get_settings()
+    imported_at = _imported_at or time.perf_counter()
+    report = StartupReport(pid=os.getpid(), import_ms=(imported_at - IMPORT_STARTED) * 1000)
+
+    with _step(report, "database"):
+        warm_up_database(settings.DB_POOL_WARM_CONNECTIONS)
+    with _step(report, "redis"):
+        redis_pool.warm_up(settings.REDIS_POOL_WARM_CONNECTIONS)
+    with _step(report, "events"):
+        await check_events.connect()
+    with _step(report, "provider"):
+        await get_insurance_provider().warm_up()
+
+    report.ready_ms = (time.perf_counter() - IMPORT_STARTED) * 1000
+    return report
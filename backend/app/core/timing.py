@@ -0,0 +1,147 @@
+"""Per-request phase timing and SQL query accounting.
+
+``ServerTimingMiddleware`` starts a ``RequestTiming`` for each request.
+Code on the request path wraps its phases in ``phase("auth")``,
+``phase("cache")`` or ``phase("provider")``, and SQLAlchemy event hooks
+add each statement's duration to ``db``. The totals can be returned in a
+``Server-Timing`` header, which browser dev tools show next to the
+request.
+
+Phases may overlap: the auth lookup is also ``db`` time, and the checks of
+a batch run concurrently, so the phases can add up to more than ``total``.
+
+The hooks also count how often each statement and each lazy relationship
+load ran. A statement or lazy load repeated ``N_PLUS_ONE_THRESHOLD`` times
+in one request is almost always a query in a loop (N+1).
+"""
+
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.database import engine, replica_router
+
+# Order of the phases in the header; others follow in first-seen order
+PHASES = ("auth", "cache", "provider", "db")
+# Statements are shortened to this many characters in logs
+STATEMENT_PREVIEW_CHARS = 200
+
+current_timing: ContextVar[Optional["RequestTiming"]] = ContextVar(
+    "request_timing", default=None
+)
+
+
+@dataclass
+class RequestTiming:
+    """Time spent per phase and the SQL run while handling one request."""
+
+    started: float = field(default_factory=time.perf_counter)
+    phases: dict[str, float] = field(default_factory=dict)  # seconds
+    queries: int = 0
+    statements: Counter = field(default_factory=Counter)
+    lazy_loads: Counter = field(default_factory=Counter)  # keyed by relationship, e.g. User.organization
+    # Statements also run in worker threads (to_thread, sync dependencies)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def record_query(self, statement: str, seconds: float) -> None:
+        with self._lock:
+            self.phases["db"] = self.phases.get("db", 0.0) + seconds
+            self.queries += 1
+            self.statements[statement] += 1
+
+    def record_lazy_load(self, relationship: str) -> None:
+        with self._lock:
+            self.lazy_loads[relationship] += 1
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+    def phases_ms(self) -> dict[str, float]:
+        """Phase durations in milliseconds, in header order."""
+        names = [name for name in PHASES if name in self.phases]
+        names += [name for name in self.phases if name not in PHASES]
+        return {name: round(self.phases[name] * 1000, 1) for name in names}
+
+    def repeated(self, threshold: int) -> list[dict]:
+        """Statements and lazy loads that ran at least ``threshold`` times."""
+        if threshold <= 0:
+            return []
+        flagged = [
+            {"relationship": relationship, "count": count}
+            for relationship, count in self.lazy_loads.items()
+            if count >= threshold
+        ]
+        flagged += [
+            {"statement": " ".join(statement.split())[:STATEMENT_PREVIEW_CHARS], "count": count}
+            for statement, count in self.statements.most_common()
+            if count >= threshold
+        ]
+        return flagged
+
+    def server_timing(self) -> str:
+        """Value of the ``Server-Timing`` header."""
+        metrics = []
+        for name, duration in self.phases_ms().items():
+            metric = f"{name};dur={duration}"
+            if name == "db":
+                noun = "query" if self.queries == 1 else "queries"
+                metric += f';desc="{self.queries} {noun}"'
+            metrics.append(metric)
+        metrics.append(f"total;dur={round(self.elapsed_ms(), 1)}")
+        return ", ".join(metrics)
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Add the time spent in the block to the current request's ``name`` phase."""
+    timing = current_timing.get()
+    if timing is None:
+        yield
+        return
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timing.add(name, time.perf_counter() - started)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if current_timing.get() is not None:
+        context._timing_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    timing = current_timing.get()
+    started = getattr(context, "_timing_started", None)
+    if timing is not None and started is not None:
+        timing.record_query(statement, time.perf_counter() - started)
+
+
+def _on_orm_execute(state: ORMExecuteState) -> None:
+    timing = current_timing.get()
+    if timing is not None and state.lazy_loaded_from is not None:
+        timing.record_lazy_load(str(state.loader_strategy_path[-1]))
+
+
+def install() -> None:
+    """Hook query accounting into the primary and replica engines; safe to call again."""
+    engines: list[Engine] = [engine] + [replica.engine for replica in replica_router.replicas]
+    for target in engines:
+        if not event.contains(target, "before_cursor_execute", _before_cursor_execute):
+            event.listen(target, "before_cursor_execute", _before_cursor_execute)
+            event.listen(target, "after_cursor_execute", _after_cursor_execute)
+    if not event.contains(Session, "do_orm_execute", _on_orm_execute):
+        event.listen(Session, "do_orm_execute", _on_orm_execute)
@@ -1,18 +1,38 @@
 """Database connection and session management."""
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+import itertools
+import json
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+import orjson
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
 
 from app.config import get_settings
+from app.core.redis_pool import get_redis
 
 settings = get_settings()
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
-)
+
+def _create_engine(url: str, pool_size: int, max_overflow: int) -> Engine:
+    return create_engine(
+        url,
+        pool_pre_ping=True,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        # JSONB columns are encoded and decoded with orjson
+        json_serializer=lambda obj: orjson.dumps(obj).decode(),
+        json_deserializer=orjson.loads,
+    )
+
+
+engine = _create_engine(settings.DATABASE_URL, pool_size=10, max_overflow=20)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -26,3 +46,153 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# Seconds behind the primary; 0 when fully replayed (an idle standby has an
+# old replay timestamp but nothing left to replay) or not a standby at all
+REPLICA_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() IS NOT DISTINCT FROM pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+
+
+@dataclass
+class Replica:
+    """A read replica and its last observed state."""
+
+    engine: Engine
+    lag_seconds: float = 0.0
+    healthy: bool = True
+    checked_at: float = float("-inf")  # monotonic; never measured yet
+
+
+class ReplicaRouter:
+    """Routes read-only sessions to replicas that are up and caught up.
+
+    Replica lag is re-measured at most every ``REPLICA_LAG_CHECK_INTERVAL_S``.
+    Replicas that are down or lag more than ``REPLICA_MAX_LAG_SECONDS`` are
+    skipped, and reads fall back to the primary when none qualify. Users who
+    wrote within ``READ_YOUR_WRITES_SECONDS`` read from the primary so they
+    always see their own changes.
+    """
+
+    STICKY_KEY = "db:sticky:{user_id}"
+
+    def __init__(self, urls: list[str]):
+        self.replicas = [
+            Replica(engine=_create_engine(url, pool_size=5, max_overflow=10)) for url in urls
+        ]
+        self._next = itertools.count()
+        self._refresh_lock = threading.Lock()
+        # Used when Redis is unavailable; only covers this worker
+        self._local_sticky: dict[UUID, float] = {}
+
+    def mark_write(self, user_id: UUID) -> None:
+        """Pin the user's reads to the primary for the read-your-writes window."""
+        if not self.replicas:
+            return
+
+        window = settings.READ_YOUR_WRITES_SECONDS
+        redis_client = get_redis()
+        if redis_client is not None:
+            redis_client.set(self.STICKY_KEY.format(user_id=user_id), 1, px=int(window * 1000))
+        else:
+            self._local_sticky[user_id] = time.monotonic() + window
+
+    def is_sticky(self, user_id: UUID) -> bool:
+        """Whether the user wrote recently enough to need the primary."""
+        redis_client = get_redis()
+        if redis_client is not None:
+            return bool(redis_client.exists(self.STICKY_KEY.format(user_id=user_id)))
+        return self._local_sticky.get(user_id, 0.0) > time.monotonic()
+
+    def _measure(self, replica: Replica) -> None:
+        try:
+            with replica.engine.connect() as connection:
+                replica.lag_seconds = float(connection.execute(REPLICA_LAG_QUERY).scalar())
+            replica.healthy = True
+        except SQLAlchemyError:
+            replica.healthy = False
+        replica.checked_at = time.monotonic()
+
+    def _refresh(self) -> None:
+        """Re-measure stale replicas; other threads keep using the last values."""
+        if not self._refresh_lock.acquire(blocking=False):
+            return
+        try:
+            stale_before = time.monotonic() - settings.REPLICA_LAG_CHECK_INTERVAL_S
+            for replica in self.replicas:
+                if replica.checked_at < stale_before:
+                    self._measure(replica)
+        finally:
+            self._refresh_lock.release()
+
+    def available(self) -> list[Replica]:
+        """Replicas that are up and within the lag budget."""
+        self._refresh()
+        return [
+            replica
+            for replica in self.replicas
+            if replica.healthy and replica.lag_seconds <= settings.REPLICA_MAX_LAG_SECONDS
+        ]
+
+    def pick_engine(self, user_id: Optional[UUID] = None) -> Engine:
+        """Choose the database for a reader's queries.
+
+        Args:
+            user_id: Reader, for read-your-writes stickiness
+
+        Returns:
+            A usable replica's engine, or the primary's when none is usable
+        """
+        if user_id is not None and self.is_sticky(user_id):
+            return engine
+
+        candidates = self.available()
+        start = next(self._next)
+        for offset in range(len(candidates)):
+            replica = candidates[(start + offset) % len(candidates)]
+            try:
+                # Probe before any statement runs, so a dead replica fails over cleanly
+                replica.engine.connect().close()
+                return replica.engine
+            except SQLAlchemyError:
+                replica.healthy = False
+                replica.checked_at = time.monotonic()
+
+        return engine
+
+    def session(self, user_id: Optional[UUID] = None) -> Session:
+        """Open a session for read-only queries.
+
+        The database is picked on the session's first query, so a request
+        that is served from cache holds no replica connection.
+
+        Args:
+            user_id: Reader, for read-your-writes stickiness
+        """
+        if not self.replicas:
+            return SessionLocal()
+        return ReadSession(self, user_id)
+
+
+class ReadSession(Session):
+    """Session bound to the database its router picks when first used."""
+
+    def __init__(self, router: ReplicaRouter, user_id: Optional[UUID]):
+        super().__init__(autoflush=False)
+        self._router = router
+        self._user_id = user_id
+        self._picked: Optional[Engine] = None
+
+    def get_bind(self, mapper=None, **kwargs) -> Engine:
+        if self._picked is None:
+            self._picked = self._router.pick_engine(self._user_id)
+        return self._picked
+
+
+replica_router = ReplicaRouter(json.loads(settings.DATABASE_REPLICA_URLS))
@@ -1,6 +1,6 @@
 """Insurance integration layer."""
 
-from app.insurance.base import InsuranceProvider, EligibilityResult
+from app.insurance.base import InsuranceProvider, EligibilityQuery, EligibilityResult
 from app.insurance.factory import get_insurance_provider
 
-__all__ = ["InsuranceProvider", "EligibilityResult", "get_insurance_provider"]
+__all__ = ["InsuranceProvider", "EligibilityQuery", "EligibilityResult", "get_insurance_provider"]
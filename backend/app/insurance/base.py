@@ -1,9 +1,10 @@
 """Abstract base class for insurance providers."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import date
-from typing import Optional, Any
+from typing import Optional, Any, Sequence
 
 
 @dataclass
@@ -17,14 +18,32 @@ class EligibilityResult:
     response_time_ms: int = 0
 
 
+@dataclass(frozen=True)
+class EligibilityQuery:
+    """One member to check, as passed to check_eligibility_batch."""
+
+    patient_first_name: str
+    patient_last_name: str
+    patient_dob: date
+    insurance_company: str
+    member_id: str
+    group_number: Optional[str] = None
+
+
 class InsuranceProvider(ABC):
     """Abstract base class for insurance providers.
 
     This interface allows easy swapping between mock and real providers.
     To add a real provider (e.g., Availity), create a new class that
     inherits from this base class and implements check_eligibility.
+    Providers whose API accepts multi-subscriber submissions should also
+    override check_eligibility_batch and raise max_batch_size.
     """
 
+    # Largest batch worth sending in one submission; 1 means batches are
+    # only fanned out, so callers gain nothing from grouping requests
+    max_batch_size: int = 1
+
     @abstractmethod
     async def check_eligibility(
         self,
@@ -50,7 +69,50 @@ class InsuranceProvider(ABC):
         """
         pass
 
+    async def check_eligibility_batch(
+        self, queries: Sequence[EligibilityQuery]
+    ) -> list[EligibilityResult]:
+        """Check several members, in one submission where the API allows it.
+
+        The default runs check_eligibility for every query concurrently.
+
+        Args:
+            queries: Members to check
+
+        Returns:
+            One EligibilityResult per query, in the same order. A failure
+            affecting one member is reported as its "error" result rather
+            than raised.
+        """
+        results = await asyncio.gather(
+            *(
+                self.check_eligibility(
+                    patient_first_name=query.patient_first_name,
+                    patient_last_name=query.patient_last_name,
+                    patient_dob=query.patient_dob,
+                    insurance_company=query.insurance_company,
+                    member_id=query.member_id,
+                    group_number=query.group_number,
+                )
+                for query in queries
+            ),
+            return_exceptions=True,
+        )
+        return [
+            EligibilityResult(status="error", error_message="Eligibility check failed")
+            if isinstance(result, Exception)
+            else result
+            for result in results
+        ]
+
     @abstractmethod
     def get_supported_insurers(self) -> list[str]:
         """Get list of supported insurance companies."""
         pass
+
+    async def warm_up(self) -> None:
+        """Prepare for traffic, e.g. open connections to the payer API.
+
+        Called once per worker at startup. The default does nothing.
+        """
+        pass
@@ -5,6 +5,7 @@ from functools import lru_cache
 from app.config import get_settings
 from app.insurance.base import InsuranceProvider
 from app.insurance.mock_provider import MockInsuranceProvider
+from app.insurance.mock_x12 import X12MockInsuranceProvider
 
 
 @lru_cache()
@@ -14,6 +15,7 @@ def get_insurance_provider() -> InsuranceProvider:
     The provider type is determined by the INSURANCE_PROVIDER environment variable.
     Currently supported:
     - "mock": MockInsuranceProvider for testing and demos
+    - "mock_x12": the mock behind an X12 270/271 exchange
 
     Future providers (post-MVP):
     - "availity": AvailityProvider for real eligibility checks
@@ -27,6 +29,8 @@ def get_insurance_provider() -> InsuranceProvider:
 
     if provider_type == "mock":
         return MockInsuranceProvider()
+    if provider_type == "mock_x12":
+        return X12MockInsuranceProvider()
 
     # Future: Add real provider implementations here
     # elif provider_type == "availity":
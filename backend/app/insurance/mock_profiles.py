@@ -0,0 +1,171 @@
+"""Latency, fault and outage profiles for the mock insurance provider.
+
+A profile file is JSON of the form::
+
+    {
+      "default": {"latency": {"median_ms": 900, "sigma": 0.35}},
+      "insurers": {
+        "Евразия": {"latency": {"median_ms": 1400, "sigma": 0.5,
+                               "tail_probability": 0.03, "tail_multiplier": 5}}
+      },
+      "windows": [
+        {"type": "outage", "insurers": ["Amanat"], "daily": "03:00-03:30"},
+        {"type": "brownout", "daily": "09:00-10:00",
+         "latency_multiplier": 3, "error_rate": 0.1},
+        {"type": "error_burst", "insurers": ["Kompetenz"],
+         "start": "2026-11-01T12:00:00", "end": "2026-11-01T12:05:00",
+         "error_rate": 0.6}
+      ]
+    }
+
+Windows without ``insurers`` apply to every insurer. ``daily`` windows are
+in UTC and may wrap past midnight; ``start``/``end`` are absolute UTC times.
+"""
+
+import json
+import math
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, time
+from pathlib import Path
+from typing import Optional
+
+WINDOW_TYPES = ("outage", "brownout", "error_burst")
+
+
+@dataclass
+class LatencyProfile:
+    """Lognormal latency with an optional heavy tail, in milliseconds."""
+
+    median_ms: float = 1200.0
+    sigma: float = 0.4
+    tail_probability: float = 0.0
+    tail_multiplier: float = 4.0
+    min_ms: float = 0.0
+    max_ms: float = 30000.0
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw one latency in milliseconds."""
+        if self.median_ms <= 0:
+            return 0.0
+        delay = rng.lognormvariate(math.log(self.median_ms), self.sigma)
+        if self.tail_probability and rng.random() < self.tail_probability:
+            delay *= self.tail_multiplier
+        return min(max(delay, self.min_ms), self.max_ms)
+
+
+@dataclass
+class InsurerProfile:
+    """Behaviour of a single insurer outside any fault window."""
+
+    latency: LatencyProfile = field(default_factory=LatencyProfile)
+    error_rate: float = 0.0  # transient errors on top of the deterministic mix
+
+
+@dataclass
+class FaultWindow:
+    """A period during which an insurer is down, degraded or flaky."""
+
+    type: str
+    insurers: Optional[list[str]] = None
+    daily: Optional[str] = None
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+    latency_multiplier: float = 1.0
+    error_rate: float = 0.0
+    latency_ms: float = 0.0  # outages only: time until the failure is reported
+
+    def __post_init__(self):
+        if self.type not in WINDOW_TYPES:
+            raise ValueError(f"Unknown window type: {self.type}")
+        if self.type == "outage":
+            self.error_rate = 1.0
+        self._daily = _parse_daily(self.daily) if self.daily else None
+
+    def applies_to(self, insurer: str) -> bool:
+        return self.insurers is None or insurer in self.insurers
+
+    def is_active(self, now: datetime) -> bool:
+        if self._daily:
+            begin, finish = self._daily
+            current = now.time()
+            if begin <= finish:
+                return begin <= current < finish
+            return current >= begin or current < finish
+        return (self.start is None or self.start <= now) and (
+            self.end is None or now < self.end
+        )
+
+
+@dataclass
+class MockConditions:
+    """Effective behaviour for one request at one point in time."""
+
+    latency: LatencyProfile
+    latency_multiplier: float = 1.0
+    error_rate: float = 0.0
+    outage: Optional[FaultWindow] = None
+
+
+@dataclass
+class MockProfile:
+    """Per-insurer latency profiles plus scheduled fault windows."""
+
+    default: InsurerProfile = field(default_factory=InsurerProfile)
+    insurers: dict[str, InsurerProfile] = field(default_factory=dict)
+    windows: list[FaultWindow] = field(default_factory=list)
+
+    def conditions(self, insurer: str, now: datetime) -> MockConditions:
+        """Resolve the latency and error behaviour for ``insurer`` at ``now``."""
+        profile = self.insurers.get(insurer, self.default)
+        conditions = MockConditions(
+            latency=profile.latency,
+            error_rate=profile.error_rate,
+        )
+
+        for window in self.windows:
+            if not window.applies_to(insurer) or not window.is_active(now):
+                continue
+            if window.type == "outage":
+                conditions.outage = window
+                break
+            conditions.latency_multiplier *= window.latency_multiplier
+            # Independent failure sources combine as 1 - P(no failure)
+            conditions.error_rate = 1 - (1 - conditions.error_rate) * (1 - window.error_rate)
+
+        return conditions
+
+
+def _parse_daily(spec: str) -> tuple[time, time]:
+    begin, _, finish = spec.partition("-")
+    return time.fromisoformat(begin.strip()), time.fromisoformat(finish.strip())
+
+
+def _parse_insurer(data: dict) -> InsurerProfile:
+    return InsurerProfile(
+        latency=LatencyProfile(**data.get("latency", {})),
+        error_rate=data.get("error_rate", 0.0),
+    )
+
+
+def _parse_window(data: dict) -> FaultWindow:
+    data = dict(data)
+    for key in ("start", "end"):
+        if data.get(key):
+            data[key] = datetime.fromisoformat(data[key])
+    return FaultWindow(**data)
+
+
+def load_profile(path: str | Path) -> MockProfile:
+    """Load a mock profile from a JSON file."""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+
+    return MockProfile(
+        default=_parse_insurer(data.get("default", {})),
+        insurers={
+            name: _parse_insurer(insurer)
+            for name, insurer in data.get("insurers", {}).items()
+        },
+        windows=[_parse_window(window) for window in data.get("windows", [])],
+    )
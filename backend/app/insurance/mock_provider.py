@@ -2,13 +2,15 @@
 
 import asyncio
 import hashlib
+import logging
 import random
-import time
 from datetime import date, timedelta
-from typing import Optional
+from typing import Optional, Sequence
 
 from app.config import get_settings
-from app.insurance.base import InsuranceProvider, EligibilityResult
+from app.core import logs
+from app.core.clock import Clock, get_clock
+from app.insurance.base import InsuranceProvider, EligibilityQuery, EligibilityResult
 from app.insurance.mock_data import (
     INSURANCE_COMPANIES,
     PLAN_TYPES,
@@ -24,6 +26,9 @@ from app.insurance.mock_data import (
     FIRST_NAMES,
     LAST_NAMES,
 )
+from app.insurance.mock_profiles import MockConditions, MockProfile, load_profile
+
+logger = logs.get_logger("provider")
 
 
 class MockInsuranceProvider(InsuranceProvider):
@@ -34,10 +39,26 @@ class MockInsuranceProvider(InsuranceProvider):
     - Configurable response delays to simulate real API latency
     - Configurable error rate for testing error handling
     - Realistic coverage data with variety
+    - Optional profile file with per-insurer lognormal latency, outages,
+      brownouts and error bursts (see mock_profiles)
+    - Optional virtual clock so simulated delays cost no real time
+    - Batch submissions answered after a single delay
     """
 
-    def __init__(self):
+    max_batch_size = 100
+
+    def __init__(
+        self,
+        profile: Optional[MockProfile] = None,
+        clock: Optional[Clock] = None,
+    ):
         self.settings = get_settings()
+        self.clock = clock or get_clock()
+        self.rng = random.Random(self.settings.MOCK_RANDOM_SEED)
+
+        if profile is None and self.settings.MOCK_PROFILE_PATH:
+            profile = load_profile(self.settings.MOCK_PROFILE_PATH)
+        self.profile = profile
 
     def _get_deterministic_seed(self, member_id: str, insurance_company: str) -> int:
         """Generate a deterministic seed from member ID and insurance company.
@@ -148,12 +169,13 @@ class MockInsuranceProvider(InsuranceProvider):
         # Use a different part of the seed to determine errors
         error_roll = (seed >> 8) % 1000  # 0-999
 
-        # 3% chance of "not found"
-        if error_roll < 30:
+        # MOCK_ERROR_RATE is split 60/40 between "not found" and
+        # "service unavailable" (3% and 2% at the default 5%)
+        error_threshold = round(self.settings.MOCK_ERROR_RATE * 1000)
+        if error_roll < round(error_threshold * 0.6):
             return True, "not_found"
 
-        # 2% chance of "service unavailable"
-        if error_roll < 50:
+        if error_roll < error_threshold:
             return True, "service_unavailable"
 
         return False, None
@@ -163,14 +185,56 @@ class MockInsuranceProvider(InsuranceProvider):
         inactive_roll = (seed >> 16) % 100
         return inactive_roll < 5
 
-    async def _simulate_delay(self) -> int:
-        """Simulate API latency and return delay in milliseconds."""
-        min_delay = self.settings.MOCK_API_MIN_DELAY_MS
-        max_delay = self.settings.MOCK_API_MAX_DELAY_MS
-        delay_ms = random.randint(min_delay, max_delay)
-        await asyncio.sleep(delay_ms / 1000)
+    def _get_conditions(self, insurance_company: str) -> Optional[MockConditions]:
+        """Resolve profile conditions for the insurer at the current time."""
+        if self.profile is None:
+            return None
+        return self.profile.conditions(insurance_company, self.clock.now())
+
+    async def _simulate_delay(self, conditions: Optional[MockConditions] = None) -> int:
+        """Simulate API latency and return delay in milliseconds.
+
+        Without a profile the delay is uniform between MOCK_API_MIN_DELAY_MS
+        and MOCK_API_MAX_DELAY_MS.
+        """
+        if conditions is None:
+            min_delay = self.settings.MOCK_API_MIN_DELAY_MS
+            max_delay = self.settings.MOCK_API_MAX_DELAY_MS
+            delay_ms = self.rng.randint(min_delay, max_delay)
+        else:
+            delay_ms = round(
+                conditions.latency.sample(self.rng) * conditions.latency_multiplier
+            )
+        await self.clock.sleep(delay_ms / 1000)
         return delay_ms
 
+    @staticmethod
+    def _log_answer(insurance_company: str, results: list[EligibilityResult]) -> None:
+        """Log one payer round trip (a single check or a batch submission)."""
+        errors = sum(result.status == "error" for result in results)
+        logger.log(
+            logging.WARNING if errors == len(results) else logging.INFO,
+            "%s answered %d members (%d errors) in %d ms",
+            insurance_company,
+            len(results),
+            errors,
+            results[0].response_time_ms or 0,
+            extra={
+                "insurance_company": insurance_company,
+                "members": len(results),
+                "errors": errors,
+                "response_time_ms": results[0].response_time_ms,
+            },
+        )
+
+    def _service_unavailable(self, response_time_ms: int) -> EligibilityResult:
+        """Build a transient payer failure."""
+        return EligibilityResult(
+            status="error",
+            error_message=self.rng.choice(ERROR_MESSAGES["service_unavailable"]),
+            response_time_ms=response_time_ms,
+        )
+
     async def check_eligibility(
         self,
         patient_first_name: str,
@@ -185,11 +249,87 @@ class MockInsuranceProvider(InsuranceProvider):
         Returns deterministic results based on member_id to ensure
         consistent behavior for demos and testing.
         """
-        start_time = time.time()
+        conditions = self._get_conditions(insurance_company)
 
-        # Simulate API delay
-        simulated_delay = await self._simulate_delay()
+        # Scheduled outage: the payer fails every request
+        if conditions and conditions.outage:
+            outage_delay = round(conditions.outage.latency_ms)
+            await self.clock.sleep(outage_delay / 1000)
+            result = self._service_unavailable(outage_delay)
+        else:
+            # Simulate API delay
+            simulated_delay = await self._simulate_delay(conditions)
+
+            # Transient failures from the profile (brownouts, error bursts)
+            if conditions and conditions.error_rate and self.rng.random() < conditions.error_rate:
+                result = self._service_unavailable(simulated_delay)
+            else:
+                result = self.generate_result(
+                    patient_first_name,
+                    patient_last_name,
+                    insurance_company,
+                    member_id,
+                    response_time_ms=simulated_delay,
+                )
+
+        self._log_answer(insurance_company, [result])
+        return result
+
+    async def check_eligibility_batch(
+        self, queries: Sequence[EligibilityQuery]
+    ) -> list[EligibilityResult]:
+        """Check several members as one submission per insurer.
+
+        Each insurer's members share one simulated delay (and one outage,
+        if scheduled); transient faults are still drawn per member.
+        """
+        by_insurer: dict[str, list[int]] = {}
+        for index, query in enumerate(queries):
+            by_insurer.setdefault(query.insurance_company, []).append(index)
+
+        results: list[Optional[EligibilityResult]] = [None] * len(queries)
+
+        async def submit(insurance_company: str, indexes: list[int]) -> None:
+            conditions = self._get_conditions(insurance_company)
+            if conditions and conditions.outage:
+                outage_delay = round(conditions.outage.latency_ms)
+                await self.clock.sleep(outage_delay / 1000)
+                for index in indexes:
+                    results[index] = self._service_unavailable(outage_delay)
+                self._log_answer(insurance_company, [results[index] for index in indexes])
+                return
+
+            simulated_delay = await self._simulate_delay(conditions)
+            for index in indexes:
+                query = queries[index]
+                if conditions and conditions.error_rate and self.rng.random() < conditions.error_rate:
+                    results[index] = self._service_unavailable(simulated_delay)
+                    continue
+                results[index] = self.generate_result(
+                    query.patient_first_name,
+                    query.patient_last_name,
+                    insurance_company,
+                    query.member_id,
+                    response_time_ms=simulated_delay,
+                )
+            self._log_answer(insurance_company, [results[index] for index in indexes])
+
+        await asyncio.gather(*(submit(name, indexes) for name, indexes in by_insurer.items()))
+        return results
+
+    def generate_result(
+        self,
+        patient_first_name: str,
+        patient_last_name: str,
+        insurance_company: str,
+        member_id: str,
+        response_time_ms: int = 0,
+    ) -> EligibilityResult:
+        """Build the deterministic result for a member without any delay.
 
+        Used by check_eligibility and by bulk data generation, so synthetic
+        datasets match what the mock API would have returned.
+        """
         # Get deterministic seed
         seed = self._get_deterministic_seed(member_id, insurance_company)
 
@@ -202,7 +342,7 @@ class MockInsuranceProvider(InsuranceProvider):
             return EligibilityResult(
                 status="error" if error_type == "service_unavailable" else "not_found",
                 error_message=error_msg,
-                response_time_ms=simulated_delay,
+                response_time_ms=response_time_ms,
             )
 
         # Check for inactive policy
@@ -220,7 +360,7 @@ class MockInsuranceProvider(InsuranceProvider):
                 subscriber=self._generate_subscriber_data(
                     seed, member_id, patient_first_name, patient_last_name
                 ),
-                response_time_ms=simulated_delay,
+                response_time_ms=response_time_ms,
             )
 
         # Generate successful response
@@ -233,7 +373,7 @@ class MockInsuranceProvider(InsuranceProvider):
             status="active",
             coverage=coverage,
             subscriber=subscriber,
-            response_time_ms=simulated_delay,
+            response_time_ms=response_time_ms,
         )
 
     def get_supported_insurers(self) -> list[str]:
@@ -0,0 +1,184 @@
+"""Mock insurance provider that speaks X12 270/271.
+
+Behaves like ``MockInsuranceProvider`` (same members, latency and faults),
+but every check goes through the X12 codec the way a clearinghouse
+integration would: a 270 is built, the mock payer reads it and answers with
+a 271, and the 271 is parsed back in small chunks. Batches are sent as one
+multi-subscriber 270 per insurer. Enable it with
+``INSURANCE_PROVIDER=mock_x12`` to exercise and profile the codec under load.
+"""
+
+import asyncio
+import itertools
+from datetime import date, datetime
+from typing import Awaitable, Callable, Optional, Sequence
+
+from app.insurance.base import EligibilityQuery, EligibilityResult
+from app.insurance.mock_data import PLAN_TYPES
+from app.insurance.mock_provider import MockInsuranceProvider
+from app.insurance.x12 import (
+    EligibilityInquiry,
+    Envelope,
+    Party,
+    X12Error,
+    build_270,
+    encode_271,
+    parse_270,
+    parse_271,
+)
+
+PROVIDER = Party("CARELINK CLINIC", "1234567893")
+SENDER_ID = "CARELINK"
+RECEIVER_ID = "MOCKPAYER"
+
+# The mock's plan tiers have no standard insurance type codes
+MOCK_INSURANCE_TYPES = {f"Z{index}": name for index, name in enumerate(PLAN_TYPES)}
+
+# Size of the pieces the 271 is parsed in, like reads from a socket
+CHUNK_SIZE = 512
+
+
+class X12MockInsuranceProvider(MockInsuranceProvider):
+    """Mock provider that round-trips every check through X12."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._control_numbers = itertools.count(1)
+
+    async def _exchange(
+        self,
+        insurance_company: str,
+        queries: Sequence[EligibilityQuery],
+        answer: Callable[[list[EligibilityQuery]], Awaitable[list[EligibilityResult]]],
+    ) -> list[EligibilityResult]:
+        """Send one 270 for ``queries`` and parse the payer's 271.
+
+        Args:
+            insurance_company: Payer all queries are addressed to
+            queries: Members to ask about
+            answer: Mock payer producing results for the members it read
+                from the 270
+
+        Returns:
+            Results in query order
+        """
+        control_number = next(self._control_numbers) % 1_000_000_000
+        payer = Party(insurance_company, RECEIVER_ID)
+        now = datetime.utcnow()
+
+        request = build_270(
+            [
+                EligibilityInquiry(
+                    trace_number=f"{control_number}-{index}",
+                    patient_first_name=query.patient_first_name,
+                    patient_last_name=query.patient_last_name,
+                    patient_dob=query.patient_dob,
+                    member_id=query.member_id,
+                    group_number=query.group_number,
+                )
+                for index, query in enumerate(queries)
+            ],
+            Envelope(SENDER_ID, RECEIVER_ID, control_number),
+            payer,
+            PROVIDER,
+            now,
+        )
+
+        # Payer side: read the inquiries and answer them
+        inquiries = list(parse_270([request]))
+        results = await answer(
+            [
+                EligibilityQuery(
+                    patient_first_name=inquiry.patient_first_name,
+                    patient_last_name=inquiry.patient_last_name,
+                    patient_dob=inquiry.patient_dob,
+                    insurance_company=insurance_company,
+                    member_id=inquiry.member_id,
+                    group_number=inquiry.group_number,
+                )
+                for inquiry in inquiries
+            ]
+        )
+        response = encode_271(
+            zip(inquiries, results),
+            Envelope(RECEIVER_ID, SENDER_ID, control_number),
+            payer,
+            PROVIDER,
+            now,
+            insurance_types=MOCK_INSURANCE_TYPES,
+        )
+
+        answers: dict[str, EligibilityResult] = {}
+        chunks = (response[i : i + CHUNK_SIZE] for i in range(0, len(response), CHUNK_SIZE))
+        for parsed in parse_271(chunks, insurance_types=MOCK_INSURANCE_TYPES):
+            answers[parsed.trace_number] = parsed.result
+
+        ordered = []
+        for inquiry, result in zip(inquiries, results):
+            parsed_result = answers.get(inquiry.trace_number) or answers.get(None)
+            if parsed_result is None:
+                raise X12Error(f"271 has no answer for trace {inquiry.trace_number}")
+            parsed_result.response_time_ms = result.response_time_ms
+            ordered.append(parsed_result)
+        return ordered
+
+    async def check_eligibility(
+        self,
+        patient_first_name: str,
+        patient_last_name: str,
+        patient_dob: date,
+        insurance_company: str,
+        member_id: str,
+        group_number: Optional[str] = None,
+    ) -> EligibilityResult:
+        """Check eligibility through a 270/271 exchange with the mock payer."""
+        parent = super()
+
+        async def answer(queries: list[EligibilityQuery]) -> list[EligibilityResult]:
+            query = queries[0]
+            return [
+                await parent.check_eligibility(
+                    patient_first_name=query.patient_first_name,
+                    patient_last_name=query.patient_last_name,
+                    patient_dob=query.patient_dob,
+                    insurance_company=query.insurance_company,
+                    member_id=query.member_id,
+                    group_number=query.group_number,
+                )
+            ]
+
+        query = EligibilityQuery(
+            patient_first_name=patient_first_name,
+            patient_last_name=patient_last_name,
+            patient_dob=patient_dob,
+            insurance_company=insurance_company,
+            member_id=member_id,
+            group_number=group_number,
+        )
+        return (await self._exchange(insurance_company, [query], answer))[0]
+
+    async def check_eligibility_batch(
+        self, queries: Sequence[EligibilityQuery]
+    ) -> list[EligibilityResult]:
+        """Check members with one multi-subscriber 270 per insurer."""
+        by_insurer: dict[str, list[int]] = {}
+        for index, query in enumerate(queries):
+            by_insurer.setdefault(query.insurance_company, []).append(index)
+
+        parent = super()
+        exchanges = await asyncio.gather(
+            *(
+                self._exchange(
+                    name,
+                    [queries[index] for index in indexes],
+                    parent.check_eligibility_batch,
+                )
+                for name, indexes in by_insurer.items()
+            )
+        )
+
+        results: list[Optional[EligibilityResult]] = [None] * len(queries)
+        for indexes, exchange in zip(by_insurer.values(), exchanges):
+            for index, result in zip(indexes, exchange):
+                results[index] = result
+        return results
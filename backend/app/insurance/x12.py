@@ -0,0 +1,773 @@
+"""ASC X12 005010X279A1 eligibility codec (270 inquiry / 271 response).
+
+Payer clearinghouses such as Availity and Change Healthcare exchange
+eligibility as X12 interchanges. This module builds 270 inquiries and
+parses 271 responses into the ``EligibilityResult`` coverage and subscriber
+shapes the rest of the application uses.
+
+Parsing is push-based and streaming: ``Reader271.feed`` takes chunks as they
+arrive from the network and returns the members completed so far, so a 271
+with thousands of subscribers is processed in memory proportional to one
+chunk plus one member. Segments are only split into elements when their
+tag is one the parser needs, and elements are only decoded when read.
+
+The encoder side of 271 and the parser side of 270 exist for the mock X12
+provider and the benchmark (``python -m benchmarks.x12``), which play the
+payer.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import AsyncIterable, Iterable, Iterator, Optional
+
+from app.insurance.base import EligibilityResult
+
+ISA_LENGTH = 106
+IMPLEMENTATION_GUIDE = "005010X279A1"
+
+# EB01 eligibility or benefit information codes
+ACTIVE_CODES = {"1", "2", "3", "4", "5"}
+INACTIVE_CODES = {"6", "7", "8"}
+COINSURANCE = "A"
+COPAYMENT = "B"
+DEDUCTIBLE = "C"
+OUT_OF_POCKET = "G"
+
+# EB06 time period qualifiers
+PERIOD_TOTALS = {"22", "23", "25", "26", "27"}  # service/calendar/contract year, episode, visit
+PERIOD_YEAR_TO_DATE = "24"
+PERIOD_REMAINING = "29"
+
+# EB03 service types reported as copays
+COPAY_SERVICE_TYPES = {
+    "98": "copay_primary_care",  # Professional (physician) visit - office
+    "3": "copay_specialist",  # Consultation
+    "UC": "copay_urgent_care",
+    "86": "copay_emergency",
+}
+
+# EB04 insurance type codes
+INSURANCE_TYPES = {
+    "C1": "Commercial",
+    "EP": "EPO",
+    "HM": "HMO",
+    "HN": "HMO - Medicare Risk",
+    "MA": "Medicare Part A",
+    "MB": "Medicare Part B",
+    "MC": "Medicaid",
+    "PR": "PPO",
+    "PS": "POS",
+}
+
+# INS02 individual relationship codes
+RELATIONSHIPS = {"18": "Self", "01": "Spouse", "19": "Child", "53": "Domestic Partner"}
+RELATIONSHIP_CODES = {name: code for code, name in RELATIONSHIPS.items()}
+
+# AAA03 reject reasons; the first two mean the member does not exist
+NOT_FOUND_REASONS = {"67", "75"}
+REJECT_REASONS = {
+    "04": "Authorized quantity exceeded",
+    "41": "Authorization/access restrictions",
+    "42": "Unable to respond at current time",
+    "43": "Invalid/missing provider identification",
+    "58": "Invalid/missing date of birth",
+    "62": "Date of service not within allowable inquiry period",
+    "67": "Patient not found",
+    "72": "Invalid/missing subscriber/insured ID",
+    "73": "Invalid/missing subscriber/insured name",
+    "75": "Subscriber/insured not found",
+    "76": "Duplicate subscriber/insured ID number",
+    "79": "Invalid participant identification",
+    "80": "No response received - transaction terminated",
+}
+
+COVERAGE_FIELDS = (
+    "effective_date",
+    "termination_date",
+    "plan_name",
+    "plan_type",
+    "copay_primary_care",
+    "copay_specialist",
+    "copay_urgent_care",
+    "copay_emergency",
+    "deductible_individual",
+    "deductible_family",
+    "deductible_met",
+    "out_of_pocket_max",
+    "out_of_pocket_max_family",
+    "out_of_pocket_met",
+    "coinsurance",
+)
+
+
+# Byte forms of the codes above, for matching without decoding
+_ACTIVE_CODES = {code.encode() for code in ACTIVE_CODES}
+_INACTIVE_CODES = {code.encode() for code in INACTIVE_CODES}
+_STATUS_CODES = _ACTIVE_CODES | _INACTIVE_CODES
+_COINSURANCE = COINSURANCE.encode()
+_COPAYMENT = COPAYMENT.encode()
+_COPAY_FIELDS = {code.encode(): name for code, name in COPAY_SERVICE_TYPES.items()}
+
+
+def _amount_keys() -> dict[tuple[bytes, bool, bytes], str]:
+    """Map (EB01, is family, EB06) of amount benefits to what they report."""
+    keys = {}
+    for code, prefix in ((DEDUCTIBLE, "deductible"), (OUT_OF_POCKET, "out_of_pocket")):
+        code = code.encode()
+        for period in PERIOD_TOTALS:
+            keys[code, False, period.encode()] = f"{prefix}_individual"
+            keys[code, True, period.encode()] = f"{prefix}_family"
+        keys[code, False, PERIOD_YEAR_TO_DATE.encode()] = f"{prefix}_met"
+        keys[code, False, PERIOD_REMAINING.encode()] = f"{prefix}_remaining"
+    return keys
+
+
+_AMOUNT_KEYS = _amount_keys()
+
+
+class X12Error(ValueError):
+    """Malformed or unexpected X12 data."""
+
+
+@dataclass(frozen=True)
+class Delimiters:
+    """Separators of an interchange, declared by its ISA segment."""
+
+    element: bytes = b"*"
+    repetition: bytes = b"^"
+    component: bytes = b":"
+    segment: bytes = b"~"
+
+    @classmethod
+    def from_isa(cls, isa: bytes) -> "Delimiters":
+        """Read the separators from the fixed-width ISA segment."""
+        if len(isa) < ISA_LENGTH or not isa.startswith(b"ISA"):
+            raise X12Error("Interchange does not start with an ISA segment")
+        return cls(
+            element=isa[3:4],
+            repetition=isa[82:83],
+            component=isa[104:105],
+            segment=isa[105:106],
+        )
+
+
+@dataclass(frozen=True)
+class Party:
+    """Payer or provider named in the 2100A/2100B loops."""
+
+    name: str
+    identifier: str  # payer ID (PI) or NPI (XX)
+
+
+@dataclass(frozen=True)
+class Envelope:
+    """Interchange and functional group addressing."""
+
+    sender_id: str
+    receiver_id: str
+    control_number: int = 1
+    production: bool = True
+
+
+@dataclass
+class EligibilityInquiry:
+    """One subscriber in a 270 inquiry."""
+
+    trace_number: str
+    patient_first_name: str
+    patient_last_name: str
+    patient_dob: date
+    member_id: str
+    group_number: Optional[str] = None
+
+
+@dataclass
+class EligibilityResponse:
+    """One member's 271 answer.
+
+    ``trace_number`` echoes the inquiry's TRN so batch responses can be
+    matched to requests; it is None for a rejection of the whole request
+    (e.g. payer unavailable).
+    """
+
+    trace_number: Optional[str]
+    result: EligibilityResult
+
+
+class SegmentReader:
+    """Splits a chunked byte stream into segments."""
+
+    def __init__(self):
+        self.delimiters: Optional[Delimiters] = None
+        self._tail = b""
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """Return the segments completed by ``chunk``, without terminators."""
+        data = self._tail + chunk if self._tail else chunk
+        if self.delimiters is None:
+            data = data.lstrip()
+            if len(data) < ISA_LENGTH:
+                self._tail = data
+                return []
+            self.delimiters = Delimiters.from_isa(data[:ISA_LENGTH])
+
+        terminator = self.delimiters.segment
+        segments = []
+        start = 0
+        end = data.find(terminator)
+        while end >= 0:
+            # Line breaks after terminators are common and not part of the data
+            segment = data[start:end].strip(b"\r\n")
+            if segment:
+                segments.append(segment)
+            start = end + 1
+            end = data.find(terminator, start)
+        self._tail = data[start:]
+        return segments
+
+    def close(self) -> None:
+        """Check that the stream ended on a segment boundary."""
+        if self._tail.strip():
+            raise X12Error("Interchange ends inside a segment")
+
+
+def _text(value: bytes) -> str:
+    return value.decode("utf-8").strip()
+
+
+def _element(elements: list[bytes], index: int) -> str:
+    return _text(elements[index]) if len(elements) > index else ""
+
+
+def _parse_date(value: str) -> Optional[str]:
+    """Convert a D8 (CCYYMMDD) date to ISO format."""
+    try:
+        return date(int(value[:4]), int(value[4:6]), int(value[6:8])).isoformat()
+    except ValueError:
+        return None
+
+
+def _parse_amount(value: str) -> Optional[Decimal]:
+    try:
+        return Decimal(value)
+    except InvalidOperation:
+        return None
+
+
+@dataclass
+class _Member:
+    """Accumulates one 2000C/2000D loop of a 271."""
+
+    trace_number: Optional[str] = None
+    first_name: str = ""
+    last_name: str = ""
+    member_id: Optional[str] = None
+    relationship: str = "Self"
+    subscriber: Optional["_Member"] = None
+    has_dependents: bool = False
+    benefit_codes: set[bytes] = field(default_factory=set)
+    rejects: list[str] = field(default_factory=list)
+    coverage: dict[str, Optional[str]] = field(default_factory=dict)
+    amounts: dict[str, Decimal] = field(default_factory=dict)
+
+
+class Reader271:
+    """Push parser that turns 271 interchanges into eligibility results.
+
+    Call ``feed`` with each chunk, then ``close``. Both return the
+    ``EligibilityResponse`` objects completed so far, in document order.
+    Members with dependents (HL child code 1) only supply subscriber data;
+    the result is reported for each dependent.
+    """
+
+    def __init__(self, currency: str = "₸", insurance_types: Optional[dict[str, str]] = None):
+        self.currency = currency
+        self.insurance_types = insurance_types or INSURANCE_TYPES
+        self._segments = SegmentReader()
+        self._handlers = {
+            b"ST": self._start_transaction,
+            b"SE": self._end_transaction,
+            b"HL": self._start_level,
+            b"TRN": self._trace,
+            b"NM1": self._name,
+            b"INS": self._relationship,
+            b"DTP": self._date,
+            b"EB": self._benefit,
+            b"AAA": self._reject,
+        }
+        self._completed: list[EligibilityResponse] = []
+        self._segment_count = 0
+        self._control_number = b""
+        self._level = b""
+        self._member: Optional[_Member] = None
+        self._subscriber: Optional[_Member] = None
+        self._source_rejects: list[str] = []
+        self._members_in_transaction = 0
+
+    def feed(self, chunk: bytes) -> list[EligibilityResponse]:
+        """Parse a chunk and return the members it completed."""
+        element_separator = None
+        for segment in self._segments.feed(chunk):
+            if element_separator is None:
+                element_separator = self._segments.delimiters.element
+            self._segment_count += 1
+            cut = segment.find(element_separator)
+            handler = self._handlers.get(segment[:cut] if cut > 0 else segment)
+            if handler is not None:
+                handler(segment.split(element_separator))
+
+        completed, self._completed = self._completed, []
+        return completed
+
+    def close(self) -> list[EligibilityResponse]:
+        """Finish parsing; raises X12Error if the stream was cut short."""
+        self._segments.close()
+        if self._control_number:
+            raise X12Error("Transaction set is missing its SE segment")
+        completed, self._completed = self._completed, []
+        return completed
+
+    def _start_transaction(self, elements: list[bytes]) -> None:
+        if elements[1] != b"271":
+            raise X12Error(f"Expected a 271 transaction set, got {_element(elements, 1)}")
+        self._segment_count = 1
+        self._control_number = elements[2]
+        self._source_rejects = []
+        self._members_in_transaction = 0
+
+    def _end_transaction(self, elements: list[bytes]) -> None:
+        self._finish_member()
+        if elements[2] != self._control_number:
+            raise X12Error("SE control number does not match ST")
+        if int(elements[1]) != self._segment_count:
+            raise X12Error(
+                f"SE reports {int(elements[1])} segments, transaction set has {self._segment_count}"
+            )
+        if self._source_rejects and not self._members_in_transaction:
+            # The payer or receiver was rejected, so no member loops follow
+            self._completed.append(
+                EligibilityResponse(None, self._error_result(self._source_rejects))
+            )
+        self._control_number = b""
+        self._subscriber = None
+
+    def _start_level(self, elements: list[bytes]) -> None:
+        self._finish_member()
+        self._level = elements[3]
+        has_children = _element(elements, 4) == "1"
+        if self._level == b"22":
+            self._member = self._subscriber = _Member(has_dependents=has_children)
+        elif self._level == b"23":
+            self._member = _Member(subscriber=self._subscriber)
+
+    def _trace(self, elements: list[bytes]) -> None:
+        if self._member is not None:
+            self._member.trace_number = _element(elements, 2)
+
+    def _name(self, elements: list[bytes]) -> None:
+        member = self._member
+        if member is None or elements[1] not in (b"IL", b"03"):
+            return
+        member.last_name = _element(elements, 3)
+        member.first_name = _element(elements, 4)
+        if _element(elements, 8) == "MI":
+            member.member_id = _element(elements, 9)
+
+    def _relationship(self, elements: list[bytes]) -> None:
+        if self._member is not None:
+            code = _element(elements, 2)
+            self._member.relationship = RELATIONSHIPS.get(code, code)
+
+    def _date(self, elements: list[bytes]) -> None:
+        if self._member is None:
+            return
+        qualifier, value = _element(elements, 1), _element(elements, 3)
+        coverage = self._member.coverage
+        if qualifier == "346":  # Plan begin
+            coverage["effective_date"] = _parse_date(value)
+        elif qualifier == "347":  # Plan end
+            coverage["termination_date"] = _parse_date(value)
+        elif qualifier == "291" and _element(elements, 2) == "RD8":  # Plan period
+            begin, _, end = value.partition("-")
+            coverage.setdefault("effective_date", _parse_date(begin))
+            coverage.setdefault("termination_date", _parse_date(end))
+
+    def _benefit(self, elements: list[bytes]) -> None:
+        member = self._member
+        if member is None:
+            return
+        if len(elements) < 9:
+            elements += [b""] * (9 - len(elements))
+
+        # Compared as bytes; only values that are kept get decoded
+        code = elements[1]
+        member.benefit_codes.add(code)
+        coverage = member.coverage
+
+        if code in _STATUS_CODES:
+            if elements[5] and "plan_name" not in coverage:
+                coverage["plan_name"] = _text(elements[5])
+            if elements[4] and "plan_type" not in coverage:
+                insurance_type = _text(elements[4])
+                coverage["plan_type"] = self.insurance_types.get(insurance_type, insurance_type)
+            return
+
+        if code == _COINSURANCE:
+            percent = _parse_amount(elements[8].decode())
+            if percent is not None and "coinsurance" not in coverage:
+                coverage["coinsurance"] = f"{percent * 100:.0f}%"
+            return
+
+        if code == _COPAYMENT:
+            repetition = self._segments.delimiters.repetition
+            names = [
+                _COPAY_FIELDS[service_type]
+                for service_type in elements[3].split(repetition)
+                if service_type in _COPAY_FIELDS and _COPAY_FIELDS[service_type] not in coverage
+            ]
+            amount = _parse_amount(elements[7].decode()) if names else None
+            if amount is not None:
+                for name in names:
+                    coverage[name] = self._format_amount(amount)
+            return
+
+        key = _AMOUNT_KEYS.get((code, elements[2] == b"FAM", elements[6]))
+        if key is not None and key not in member.amounts:
+            amount = _parse_amount(elements[7].decode())
+            if amount is not None:
+                member.amounts[key] = amount
+
+    def _reject(self, elements: list[bytes]) -> None:
+        reason = _element(elements, 3)
+        if self._level in (b"22", b"23") and self._member is not None:
+            self._member.rejects.append(reason)
+        else:
+            self._source_rejects.append(reason)
+
+    def _format_amount(self, amount: Decimal) -> str:
+        return f"{self.currency}{amount:,.0f}"
+
+    def _error_result(self, rejects: list[str]) -> EligibilityResult:
+        reason = rejects[0]
+        return EligibilityResult(
+            status="not_found" if reason in NOT_FOUND_REASONS else "error",
+            error_message=REJECT_REASONS.get(reason, f"Request rejected by payer (reason {reason})"),
+        )
+
+    def _finish_member(self) -> None:
+        member, self._member = self._member, None
+        if member is None or member.has_dependents:
+            return
+
+        self._members_in_transaction += 1
+        subscriber = member.subscriber or member
+        if member.rejects or subscriber.rejects:
+            result = self._error_result(member.rejects or subscriber.rejects)
+        else:
+            result = self._coverage_result(member, subscriber)
+        self._completed.append(
+            EligibilityResponse(member.trace_number or subscriber.trace_number, result)
+        )
+
+    def _coverage_result(self, member: _Member, subscriber: _Member) -> EligibilityResult:
+        if member.benefit_codes & _ACTIVE_CODES:
+            status = "active"
+        elif member.benefit_codes & _INACTIVE_CODES:
+            status = "inactive"
+        else:
+            return EligibilityResult(
+                status="error", error_message="No eligibility information in response"
+            )
+
+        amounts = member.amounts
+        for prefix in ("deductible", "out_of_pocket"):
+            # Payers report either the amount met or the amount remaining
+            total = amounts.get(f"{prefix}_individual")
+            remaining = amounts.get(f"{prefix}_remaining")
+            if total is not None and remaining is not None:
+                amounts.setdefault(f"{prefix}_met", total - remaining)
+
+        coverage = dict.fromkeys(COVERAGE_FIELDS)
+        coverage.update(member.coverage)
+        for name, key in (
+            ("deductible_individual", "deductible_individual"),
+            ("deductible_family", "deductible_family"),
+            ("deductible_met", "deductible_met"),
+            ("out_of_pocket_max", "out_of_pocket_individual"),
+            ("out_of_pocket_max_family", "out_of_pocket_family"),
+            ("out_of_pocket_met", "out_of_pocket_met"),
+        ):
+            if key in amounts:
+                coverage[name] = self._format_amount(amounts[key])
+
+        return EligibilityResult(
+            status=status,
+            coverage=coverage,
+            subscriber={
+                "name": f"{subscriber.first_name} {subscriber.last_name}".strip(),
+                "relationship": member.relationship,
+                "member_id": member.member_id or subscriber.member_id,
+            },
+        )
+
+
+def parse_271(chunks: Iterable[bytes], **options) -> Iterator[EligibilityResponse]:
+    """Parse a 271 from an iterable of byte chunks, yielding each member."""
+    reader = Reader271(**options)
+    for chunk in chunks:
+        yield from reader.feed(chunk)
+    yield from reader.close()
+
+
+async def aparse_271(chunks: AsyncIterable[bytes], **options):
+    """Parse a 271 from an async byte stream, e.g. ``response.aiter_bytes()``."""
+    reader = Reader271(**options)
+    async for chunk in chunks:
+        for response in reader.feed(chunk):
+            yield response
+    for response in reader.close():
+        yield response
+
+
+class _Writer:
+    """Accumulates segments of one interchange."""
+
+    def __init__(self, delimiters: Delimiters):
+        self.delimiters = delimiters
+        self._element = delimiters.element.decode()
+        self._segment = delimiters.segment.decode()
+        reserved = (delimiters.element + delimiters.segment + delimiters.component
+                    + delimiters.repetition).decode()
+        # X12 has no escaping, so separators in data are blanked out
+        self._clean = str.maketrans({char: " " for char in reserved})
+        self.parts: list[str] = []
+        self.count = 0
+
+    def add(self, *elements: object) -> None:
+        """Append a segment; trailing empty elements are dropped."""
+        values = ["" if value is None else str(value).translate(self._clean) for value in elements]
+        while values and values[-1] == "":
+            values.pop()
+        self.parts.append(self._element.join(values) + self._segment)
+        self.count += 1
+
+    def raw(self, *elements: str) -> None:
+        """Append a segment whose elements are already valid X12."""
+        self.parts.append(self._element.join(elements) + self._segment)
+        self.count += 1
+
+    def encode(self) -> bytes:
+        return "".join(self.parts).encode("utf-8")
+
+
+def _begin_interchange(
+    writer: _Writer, envelope: Envelope, functional_id: str, now: datetime
+) -> None:
+    d = writer.delimiters
+    control = f"{envelope.control_number:09d}"
+    writer.raw(
+        "ISA", "00", " " * 10, "00", " " * 10,
+        "ZZ", f"{envelope.sender_id:<15.15}",
+        "ZZ", f"{envelope.receiver_id:<15.15}",
+        f"{now:%y%m%d}", f"{now:%H%M}", d.repetition.decode(), "00501", control, "0",
+        "P" if envelope.production else "T", d.component.decode(),
+    )
+    writer.add(
+        "GS", functional_id, envelope.sender_id, envelope.receiver_id,
+        f"{now:%Y%m%d}", f"{now:%H%M}", envelope.control_number, "X", IMPLEMENTATION_GUIDE,
+    )
+
+
+def _end_interchange(writer: _Writer, envelope: Envelope) -> None:
+    writer.add("GE", 1, envelope.control_number)
+    writer.add("IEA", 1, f"{envelope.control_number:09d}")
+
+
+def _split_name(name: str) -> tuple[str, str]:
+    """Split "First Last" into (first, last)."""
+    first, _, last = name.rpartition(" ")
+    return (first, last) if first else ("", name)
+
+
+def _amount(value: Optional[str]) -> Optional[str]:
+    """Turn a display amount such as "₸12,500" back into an X12 decimal."""
+    if not value:
+        return None
+    digits = "".join(char for char in value if char.isdigit() or char == ".")
+    return digits or None
+
+
+def build_270(
+    inquiries: Iterable[EligibilityInquiry],
+    envelope: Envelope,
+    payer: Party,
+    provider: Party,
+    now: Optional[datetime] = None,
+    delimiters: Delimiters = Delimiters(),
+) -> bytes:
+    """Build a 270 interchange asking about each inquiry's subscriber.
+
+    Each inquiry becomes a 2000C loop with its own trace number, so a
+    single interchange can carry a batch.
+
+    Args:
+        inquiries: Subscribers to ask about
+        envelope: Interchange addressing and control number
+        payer: Information source (2100A)
+        provider: Information receiver (2100B)
+        now: Interchange timestamp; also the date of service
+        delimiters: Separators to use
+
+    Returns:
+        The encoded interchange
+    """
+    now = now or datetime.utcnow()
+    writer = _Writer(delimiters)
+    _begin_interchange(writer, envelope, "HS", now)
+
+    start = writer.count
+    writer.add("ST", "270", "0001", IMPLEMENTATION_GUIDE)
+    writer.add("BHT", "0022", "13", f"{envelope.control_number}", f"{now:%Y%m%d}", f"{now:%H%M}")
+    writer.add("HL", 1, "", 20, 1)
+    writer.add("NM1", "PR", 2, payer.name, "", "", "", "", "PI", payer.identifier)
+    writer.add("HL", 2, 1, 21, 1)
+    writer.add("NM1", "1P", 2, provider.name, "", "", "", "", "XX", provider.identifier)
+
+    for number, inquiry in enumerate(inquiries, start=3):
+        writer.add("HL", number, 2, 22, 0)
+        writer.add("TRN", 1, inquiry.trace_number, f"9{envelope.sender_id}")
+        writer.add(
+            "NM1", "IL", 1, inquiry.patient_last_name, inquiry.patient_first_name,
+            "", "", "", "MI", inquiry.member_id,
+        )
+        if inquiry.group_number:
+            writer.add("REF", "6P", inquiry.group_number)
+        writer.add("DMG", "D8", f"{inquiry.patient_dob:%Y%m%d}")
+        writer.add("DTP", "291", "D8", f"{now:%Y%m%d}")
+        writer.add("EQ", 30)
+
+    writer.add("SE", writer.count - start + 1, "0001")
+    _end_interchange(writer, envelope)
+    return writer.encode()
+
+
+def parse_270(chunks: Iterable[bytes]) -> Iterator[EligibilityInquiry]:
+    """Parse the subscribers of a 270, as a payer would."""
+    segments = SegmentReader()
+    inquiry: Optional[EligibilityInquiry] = None
+    for chunk in chunks:
+        for segment in segments.feed(chunk):
+            elements = segment.split(segments.delimiters.element)
+            tag = elements[0]
+            if tag == b"HL" or tag == b"SE":
+                if inquiry is not None:
+                    yield inquiry
+                    inquiry = None
+                if tag == b"HL" and elements[3] in (b"22", b"23"):
+                    inquiry = EligibilityInquiry("", "", "", date.min, "")
+            elif inquiry is None:
+                continue
+            elif tag == b"TRN":
+                inquiry.trace_number = _element(elements, 2)
+            elif tag == b"NM1":
+                inquiry.patient_last_name = _element(elements, 3)
+                inquiry.patient_first_name = _element(elements, 4)
+                inquiry.member_id = _element(elements, 9)
+            elif tag == b"REF" and elements[1] == b"6P":
+                inquiry.group_number = _element(elements, 2)
+            elif tag == b"DMG":
+                inquiry.patient_dob = datetime.strptime(_element(elements, 2), "%Y%m%d").date()
+    segments.close()
+
+
+def encode_271(
+    responses: Iterable[tuple[EligibilityInquiry, EligibilityResult]],
+    envelope: Envelope,
+    payer: Party,
+    provider: Party,
+    now: Optional[datetime] = None,
+    delimiters: Delimiters = Delimiters(),
+    insurance_types: Optional[dict[str, str]] = None,
+) -> bytes:
+    """Encode results as the 271 a payer would return for the inquiries.
+
+    Dependents (subscriber relationship other than Self) get a 2000D loop
+    under a subscriber loop. Errors become AAA rejections; ``not_found``
+    is reason 75, anything else reason 42.
+    """
+    now = now or datetime.utcnow()
+    type_codes = {label: code for code, label in (insurance_types or INSURANCE_TYPES).items()}
+    copay_codes = {name: code for code, name in COPAY_SERVICE_TYPES.items()}
+    writer = _Writer(delimiters)
+    _begin_interchange(writer, envelope, "HB", now)
+
+    start = writer.count
+    writer.add("ST", "271", "0001", IMPLEMENTATION_GUIDE)
+    writer.add("BHT", "0022", "11", f"{envelope.control_number}", f"{now:%Y%m%d}", f"{now:%H%M}")
+    writer.add("HL", 1, "", 20, 1)
+    writer.add("NM1", "PR", 2, payer.name, "", "", "", "", "PI", payer.identifier)
+    writer.add("HL", 2, 1, 21, 1)
+    writer.add("NM1", "1P", 2, provider.name, "", "", "", "", "XX", provider.identifier)
+
+    number = 2
+    for inquiry, result in responses:
+        subscriber = result.subscriber or {}
+        relationship = subscriber.get("relationship", "Self")
+        rejected = result.status in ("error", "not_found")
+        dependent = relationship != "Self" and not rejected
+        number += 1
+        subscriber_level = number
+        writer.add("HL", number, 2, 22, 1 if dependent else 0)
+        writer.add("TRN", 2, inquiry.trace_number, f"9{envelope.receiver_id}")
+
+        first, last = _split_name(subscriber.get("name") or "")
+        if not dependent:
+            first, last = inquiry.patient_first_name, inquiry.patient_last_name
+        writer.add(
+            "NM1", "IL", 1, last, first, "", "", "", "MI",
+            subscriber.get("member_id") or inquiry.member_id,
+        )
+        if result.status == "not_found":
+            writer.add("AAA", "N", "", "75", "C")  # Not found; correct and resubmit
+            continue
+        if rejected:
+            writer.add("AAA", "Y", "", "42", "R")  # Unable to respond; resubmit
+            continue
+
+        if dependent:
+            number += 1
+            writer.add("HL", number, subscriber_level, 23, 0)
+            writer.add("TRN", 2, inquiry.trace_number, f"9{envelope.receiver_id}")
+            writer.add("NM1", "03", 1, inquiry.patient_last_name, inquiry.patient_first_name)
+            writer.add("INS", "N", RELATIONSHIP_CODES.get(relationship, "G8"))
+
+        coverage = result.coverage or {}
+        for qualifier, key in (("346", "effective_date"), ("347", "termination_date")):
+            if coverage.get(key):
+                writer.add("DTP", qualifier, "D8", coverage[key].replace("-", ""))
+
+        writer.add(
+            "EB", "1" if result.status == "active" else "6", "IND", 30,
+            type_codes.get(coverage.get("plan_type"), ""), coverage.get("plan_name"),
+        )
+        for name, code in copay_codes.items():
+            if _amount(coverage.get(name)):
+                writer.add("EB", COPAYMENT, "IND", code, "", "", 27, _amount(coverage[name]))
+        for code, level, period, key in (
+            (DEDUCTIBLE, "IND", "23", "deductible_individual"),
+            (DEDUCTIBLE, "FAM", "23", "deductible_family"),
+            (DEDUCTIBLE, "IND", PERIOD_YEAR_TO_DATE, "deductible_met"),
+            (OUT_OF_POCKET, "IND", "23", "out_of_pocket_max"),
+            (OUT_OF_POCKET, "FAM", "23", "out_of_pocket_max_family"),
+            (OUT_OF_POCKET, "IND", PERIOD_YEAR_TO_DATE, "out_of_pocket_met"),
+        ):
+            if _amount(coverage.get(key)):
+                writer.add("EB", code, level, 30, "", "", period, _amount(coverage[key]))
+        if coverage.get("coinsurance"):
+            percent = Decimal(coverage["coinsurance"].rstrip("%")) / 100
+            writer.add("EB", COINSURANCE, "IND", 30, "", "", "", "", f"{percent:g}")
+
+    writer.add("SE", writer.count - start + 1, "0001")
+    _end_interchange(writer, envelope)
+    return writer.encode()
@@ -1,15 +1,21 @@
 """CareLink API - Main application entry point."""
 
 from contextlib import asynccontextmanager
+from dataclasses import asdict
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from app.config import get_settings
-from app.database import engine, Base
 from app.api import api_router
+from app.api.eligibility import get_insurers_payload
+from app.core import logs, startup, timing
+from app.core.admission import admission_controller
 from app.core.exceptions import CareLinkeException
+from app.middleware import CompressionMiddleware, RequestIdMiddleware, ServerTimingMiddleware
+from app.services.audit import audit_writer
+from app.services.reverification import reverification_scheduler
 
 settings = get_settings()
 
@@ -17,10 +23,22 @@ settings = get_settings()
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler for startup/shutdown events."""
-    # Startup: Create database tables
-    Base.metadata.create_all(bind=engine)
+    # Startup: the schema is managed by Alembic (alembic upgrade head), so
+    # workers only warm connections and caches before serving traffic
+    logs.start()
+    if settings.REQUEST_TIMING_ENABLED:
+        timing.install()
+    get_insurers_payload()
+    app.state.startup = await startup.warm_up()
+    app.state.startup.log()
+    await audit_writer.start()
+    if settings.REVERIFY_ENABLED:
+        reverification_scheduler.start()
     yield
-    # Shutdown: Cleanup if needed
+    # Shutdown: Stop background jobs
+    await reverification_scheduler.stop()
+    await audit_writer.stop()
+    logs.stop()
 
 
 app = FastAPI(
@@ -28,6 +46,7 @@ app = FastAPI(
     description="Healthcare Insurance Eligibility Verification Platform",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -39,6 +58,22 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Response compression (brotli when installed, else gzip)
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MIN_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    )
+
+# Phase timing includes compression; inside request IDs so its logs carry them
+if settings.REQUEST_TIMING_ENABLED:
+    app.add_middleware(ServerTimingMiddleware, header=settings.server_timing_header)
+
+# Outermost: request IDs cover every other middleware and the access log times them
+app.add_middleware(RequestIdMiddleware)
+
 
 # Exception handlers
 @app.exception_handler(CareLinkeException)
@@ -68,6 +103,24 @@ async def health_check():
     return {"status": "healthy", "version": "1.0.0"}
 
 
+@app.get("/ready")
+async def readiness_check():
+    """Readiness probe: 503 while this worker is saturated.
+
+    Load balancers should stop routing to a worker that answers 503 here
+    and retry it after ``Retry-After``.
+    """
+    stats = admission_controller.stats()
+    content = {"status": "ready" if stats.ready else "saturated", **asdict(stats)}
+    if stats.ready:
+        return content
+    return ORJSONResponse(
+        content,
+        status_code=503,
+        headers={"Retry-After": str(admission_controller.retry_after())},
+    )
+
+
 @app.get("/")
 async def root():
     """Root endpoint with API information."""
@@ -76,4 +129,8 @@ async def root():
         "version": "1.0.0",
         "docs": "/docs",
         "health": "/health",
+        "ready": "/ready",
     }
+
+
+startup.mark_imported()
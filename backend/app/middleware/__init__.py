@@ -1 +1,7 @@
 """Middleware components."""
+
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.request_id import RequestIdMiddleware
+from app.middleware.server_timing import ServerTimingMiddleware
+
+__all__ = ["CompressionMiddleware", "RequestIdMiddleware", "ServerTimingMiddleware"]
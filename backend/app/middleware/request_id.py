@@ -0,0 +1,77 @@
+"""Request ID propagation and access logging."""
+
+import logging
+import re
+import time
+import uuid
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core import logs
+
+REQUEST_ID_HEADER = "X-Request-ID"
+# Client-supplied IDs are kept only if they are short and log-safe
+VALID_REQUEST_ID = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
+
+access_logger = logs.get_logger("access")
+
+
+class RequestIdMiddleware:
+    """Give each request an ID, echo it in the response and log the request.
+
+    An ``X-Request-ID`` from the client (or a proxy) is reused so logs can be
+    joined across services; otherwise one is generated. The ID and the
+    request's sampling decision are set in context for every log record
+    emitted while handling it, including background tasks.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        supplied = Headers(scope=scope).get(REQUEST_ID_HEADER, "")
+        request_id = supplied if VALID_REQUEST_ID.match(supplied) else uuid.uuid4().hex
+        logs.request_id.set(request_id)
+        logs.sample_request()
+
+        started = time.perf_counter()
+        status_code = 500
+        logged = False
+
+        def log_request() -> None:
+            nonlocal logged
+            logged = True
+            access_logger.log(
+                logging.WARNING if status_code >= 500 else logging.INFO,
+                "%s %s %d",
+                scope["method"],
+                scope["path"],
+                status_code,
+                extra={
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "status": status_code,
+                    "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+                },
+            )
+
+        async def send_with_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = request_id
+            await send(message)
+            # Logged when the response is complete, not after background tasks
+            if message["type"] == "http.response.body" and not message.get("more_body"):
+                log_request()
+
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            if not logged:
+                log_request()
@@ -0,0 +1,95 @@
+"""Per-request timing: Server-Timing header, slow-request and N+1 logs."""
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import get_settings
+from app.core import logs
+from app.core.timing import RequestTiming, current_timing
+
+timing_logger = logs.get_logger("timing")
+
+
+class ServerTimingMiddleware:
+    """Account each request's phases and SQL, and report them.
+
+    With ``header`` set, responses carry a ``Server-Timing`` header with the
+    time spent in auth, cache, provider and database work. Requests slower
+    than ``SLOW_REQUEST_MS`` are logged with that breakdown, and statements
+    or lazy loads repeated ``N_PLUS_ONE_THRESHOLD`` times are logged as
+    likely N+1 queries. Event streams are not reported as slow.
+    """
+
+    def __init__(self, app: ASGIApp, header: bool = True):
+        self.app = app
+        self.header = header
+        settings = get_settings()
+        self.slow_request_ms = settings.SLOW_REQUEST_MS
+        self.n_plus_one_threshold = settings.N_PLUS_ONE_THRESHOLD
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timing = RequestTiming()
+        token = current_timing.set(timing)
+        status_code = 500
+        streaming = False
+        reported = False
+
+        def report() -> None:
+            nonlocal reported
+            reported = True
+            self._report(scope, timing, status_code, streaming)
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code, streaming
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                streaming = headers.get("content-type", "").startswith("text/event-stream")
+                if self.header:
+                    headers.append("Server-Timing", timing.server_timing())
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body"):
+                report()
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            if not reported:
+                report()
+            current_timing.reset(token)
+
+    def _report(self, scope: Scope, timing: RequestTiming, status_code: int, streaming: bool) -> None:
+        fields = {
+            "method": scope["method"],
+            "path": scope["path"],
+            "status": status_code,
+            "duration_ms": round(timing.elapsed_ms(), 1),
+            "phases_ms": timing.phases_ms(),
+            "queries": timing.queries,
+        }
+
+        repeated = timing.repeated(self.n_plus_one_threshold)
+        if repeated:
+            timing_logger.warning(
+                "Possible N+1 in %s %s",
+                scope["method"],
+                scope["path"],
+                extra={**fields, "repeated": repeated},
+            )
+
+        if (
+            self.slow_request_ms > 0
+            and not streaming
+            and fields["duration_ms"] > self.slow_request_ms
+        ):
+            timing_logger.warning(
+                "Slow request %s %s took %.0f ms",
+                scope["method"],
+                scope["path"],
+                fields["duration_ms"],
+                extra={**fields, "lazy_loads": dict(timing.lazy_loads)},
+            )
@@ -2,7 +2,7 @@
 
 from app.models.organization import Organization
 from app.models.user import User
-from app.models.eligibility import EligibilityCheck
+from app.models.eligibility import EligibilityCheck, MemberEligibilityLatest
 from app.models.audit import AuditLog
 
-__all__ = ["Organization", "User", "EligibilityCheck", "AuditLog"]
+__all__ = ["Organization", "User", "EligibilityCheck", "MemberEligibilityLatest", "AuditLog"]
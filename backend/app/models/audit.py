@@ -3,7 +3,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 
@@ -11,22 +11,36 @@ from app.database import Base
 
 
 class AuditLog(Base):
-    """Audit log model for tracking user actions."""
+    """Audit log model for tracking user actions.
+
+    The table is range-partitioned by month on ``created_at`` (partitions
+    are created ahead of time by the audit writer), so the partition key is
+    part of the primary key. Rows are written in batches by
+    ``app.services.audit``.
+    """
 
     __tablename__ = "audit_logs"
+    __table_args__ = (
+        Index("ix_audit_logs_user_id_created_at", "user_id", "created_at"),
+        Index(
+            "ix_audit_logs_resource_created_at",
+            "resource_type",
+            "resource_id",
+            "created_at",
+        ),
+        # Rows arrive in time order, so a BRIN index serves time ranges cheaply
+        Index("ix_audit_logs_created_at", "created_at", postgresql_using="brin"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(
-        UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True
-    )
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     action = Column(String(100), nullable=False)
     resource_type = Column(String(50), nullable=False)
     resource_id = Column(UUID(as_uuid=True), nullable=True)
     ip_address = Column(String(45), nullable=True)
     extra_data = Column(JSONB, nullable=True)
-    created_at = Column(
-        DateTime, default=datetime.utcnow, nullable=False, index=True
-    )
+    created_at = Column(DateTime, default=datetime.utcnow, primary_key=True)
 
     # Relationships
     user = relationship("User", back_populates="audit_logs")
@@ -4,7 +4,7 @@ import enum
 import uuid
 from datetime import datetime, date
 
-from sqlalchemy import Column, String, Text, Integer, Date, Enum, DateTime, ForeignKey
+from sqlalchemy import Column, String, Text, Integer, Date, Enum, DateTime, ForeignKey, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 
@@ -59,3 +59,54 @@ class EligibilityCheck(Base):
 
     def __repr__(self) -> str:
         return f"<EligibilityCheck {self.member_id} - {self.status}>"
+
+
+class MemberEligibilityLatest(Base):
+    """Most recent conclusive eligibility result per member and organization.
+
+    Upserted in the same transaction as each completed check, so "what is
+    this member's coverage now?" is a primary key lookup instead of a
+    search through eligibility_checks.
+    """
+
+    __tablename__ = "member_eligibility_latest"
+
+    organization_id = Column(
+        UUID(as_uuid=True), ForeignKey("organizations.id"), primary_key=True
+    )
+    insurance_company = Column(String(255), primary_key=True)
+    member_id = Column(String(50), primary_key=True)
+    patient_dob = Column(Date, primary_key=True)
+
+    status = Column(String(20), nullable=False)  # active, inactive, not_found
+    response_data = Column(JSONB, nullable=False)
+    check_id = Column(
+        UUID(as_uuid=True), ForeignKey("eligibility_checks.id"), nullable=False
+    )
+    checked_at = Column(DateTime, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<MemberEligibilityLatest {self.member_id} - {self.status}>"
+
+
+# Fills member_eligibility_latest from checks loaded in bulk (migration 0003,
+# the synthetic dataset), with the same rules as the per-check upsert
+BACKFILL_MEMBER_ELIGIBILITY_LATEST = text(
+    """
+    INSERT INTO member_eligibility_latest
+    SELECT DISTINCT ON (organization_id, insurance_company, member_id, patient_dob)
+        organization_id, insurance_company, member_id, patient_dob,
+        response_data->>'status', response_data, id, created_at
+    FROM eligibility_checks
+    WHERE status = 'SUCCESS'
+        AND error_message IS NULL
+        AND response_data->>'status' IN ('active', 'inactive', 'not_found')
+    ORDER BY organization_id, insurance_company, member_id, patient_dob, created_at DESC
+    ON CONFLICT (organization_id, insurance_company, member_id, patient_dob) DO UPDATE
+    SET status = excluded.status,
+        response_data = excluded.response_data,
+        check_id = excluded.check_id,
+        checked_at = excluded.checked_at
+    WHERE member_eligibility_latest.checked_at < excluded.checked_at
+    """
+)
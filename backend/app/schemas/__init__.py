@@ -15,7 +15,11 @@ from app.schemas.user import (
 from app.schemas.eligibility import (
     EligibilityCheckRequest,
     EligibilityCheckResponse,
+    EligibilityCheckAcceptedResponse,
     EligibilityHistoryResponse,
+    EligibilityHistorySummaryResponse,
+    MemberEligibilityLookupRequest,
+    MemberEligibilityLookupResponse,
     CoverageInfo,
     SubscriberInfo,
 )
@@ -36,7 +40,11 @@ __all__ = [
     "UserInDB",
     "EligibilityCheckRequest",
     "EligibilityCheckResponse",
+    "EligibilityCheckAcceptedResponse",
     "EligibilityHistoryResponse",
+    "EligibilityHistorySummaryResponse",
+    "MemberEligibilityLookupRequest",
+    "MemberEligibilityLookupResponse",
     "CoverageInfo",
     "SubscriberInfo",
     "PaginationParams",
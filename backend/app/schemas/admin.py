@@ -0,0 +1,104 @@
+"""Admin and diagnostics schemas."""
+
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class AllocationStat(BaseModel):
+    """Allocation site in a tracemalloc snapshot."""
+
+    location: str
+    size_bytes: int
+    count: int
+
+
+class AllocationDiff(BaseModel):
+    """Allocation site growth between two tracemalloc snapshots."""
+
+    location: str
+    size_bytes: int
+    size_diff_bytes: int
+    count: int
+    count_diff: int
+
+
+class MemorySnapshotResponse(BaseModel):
+    """Result of taking a tracemalloc snapshot."""
+
+    snapshot_id: int
+    pid: int
+    traced_current_bytes: int
+    traced_peak_bytes: int
+    top: list[AllocationStat]
+
+
+class ReverificationReportResponse(BaseModel):
+    """Outcome of a re-verification run."""
+
+    started_at: datetime
+    finished_at: Optional[datetime] = None
+    panel_size: int
+    refreshed: int
+    failed: int
+    skipped: int
+    by_status: dict[str, int]
+
+    class Config:
+        from_attributes = True
+
+
+class MemoryDiffResponse(BaseModel):
+    """Difference between two tracemalloc snapshots."""
+
+    base_id: int
+    target_id: int
+    pid: int
+    diff: list[AllocationDiff]
+
+
+class RateLimitStatsResponse(BaseModel):
+    """An organization's rate limit and request counts since metrics began."""
+
+    organization_id: UUID
+    limit: int
+    window_seconds: int
+    allowed: int
+    limited: int
+
+
+class CacheShardStatus(BaseModel):
+    """A cache node's health and share of the hash ring."""
+
+    name: str
+    healthy: bool
+    share: float  # fraction of keys routed to it; 0 while down
+
+
+class LaneQueueStats(BaseModel):
+    """Queue counters of one priority lane since startup."""
+
+    queued: int
+    started: int
+    promoted: int  # served ahead of its turn by the starvation guard
+    wait_avg_ms: float
+    wait_max_ms: float
+
+
+class PrioritySchedulerStats(BaseModel):
+    """Slot use and per-lane queue waits of one priority scheduler."""
+
+    slots: int
+    in_use: int
+    lanes: dict[str, LaneQueueStats]
+
+
+class LoggingStatsResponse(BaseModel):
+    """Depth of the log queue and records not written since startup."""
+
+    queued: int
+    capacity: int
+    dropped: int  # lost because the queue was full
+    sampled_out: int  # INFO records of unsampled requests
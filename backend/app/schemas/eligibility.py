@@ -49,7 +49,7 @@ class EligibilityCheckResponse(BaseModel):
     """Response schema for eligibility check."""
 
     id: UUID
-    status: str  # active, inactive, error
+    status: str  # active, inactive, error, pending
     coverage: Optional[CoverageInfo] = None
     subscriber: Optional[SubscriberInfo] = None
     error_message: Optional[str] = None
@@ -60,6 +60,13 @@ class EligibilityCheckResponse(BaseModel):
         from_attributes = True
 
 
+class EligibilityCheckAcceptedResponse(BaseModel):
+    """Response schema for a check accepted for asynchronous processing."""
+
+    id: UUID
+    status: str  # pending
+
+
 class EligibilityHistoryItem(BaseModel):
     """Single item in eligibility history."""
 
@@ -80,6 +87,18 @@ class EligibilityHistoryItem(BaseModel):
         from_attributes = True
 
 
+class EligibilityHistorySummaryItem(BaseModel):
+    """Slim history item returned by ``view=summary`` (no coverage payload)."""
+
+    id: UUID
+    patient_first_name: str
+    patient_last_name: str
+    insurance_company: str
+    member_id: str
+    status: str
+    created_at: datetime
+
+
 class PaginationInfo(BaseModel):
     """Pagination metadata."""
 
@@ -94,3 +113,44 @@ class EligibilityHistoryResponse(BaseModel):
 
     data: list[EligibilityHistoryItem]
     pagination: PaginationInfo
+
+
+class EligibilityHistorySummaryResponse(BaseModel):
+    """Response schema for eligibility history with ``view=summary``."""
+
+    data: list[EligibilityHistorySummaryItem]
+    pagination: PaginationInfo
+
+
+class MemberLookupItem(BaseModel):
+    """Member identified for a latest-status lookup."""
+
+    insurance_company: str = Field(min_length=1, max_length=255)
+    member_id: str = Field(min_length=1, max_length=50)
+    patient_dob: date
+
+
+class MemberEligibilityLookupRequest(BaseModel):
+    """Request schema for a bulk latest-status lookup."""
+
+    members: list[MemberLookupItem] = Field(min_length=1, max_length=500)
+
+
+class MemberEligibilityItem(BaseModel):
+    """A member's latest conclusive result; status is null if never checked."""
+
+    insurance_company: str
+    member_id: str
+    patient_dob: date
+    status: Optional[str] = None  # active, inactive, not_found
+    coverage: Optional[CoverageInfo] = None
+    subscriber: Optional[SubscriberInfo] = None
+    check_id: Optional[UUID] = None
+    checked_at: Optional[datetime] = None
+    fresh: bool = False  # still within the cache policy's TTL
+
+
+class MemberEligibilityLookupResponse(BaseModel):
+    """Response schema for a bulk latest-status lookup, in request order."""
+
+    data: list[MemberEligibilityItem]
@@ -6,17 +6,23 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from alembic import command
+from alembic.config import Config
 from sqlalchemy.orm import Session
-from app.database import engine, SessionLocal, Base
+from app.database import SessionLocal
 from app.models.organization import Organization, OrganizationType, SubscriptionTier
 from app.models.user import User, UserRole
 from app.core.security import get_password_hash
 
 
+def upgrade_schema() -> None:
+    """Bring the schema up to date with Alembic (``alembic upgrade head``)."""
+    command.upgrade(Config(str(Path(__file__).parent.parent / "alembic.ini")), "head")
+
+
 def seed_database():
     """Create initial seed data."""
-    # Create tables
-    Base.metadata.create_all(bind=engine)
+    upgrade_schema()
 
     db: Session = SessionLocal()
 
@@ -0,0 +1,398 @@
+"""Generate a large synthetic dataset for performance testing.
+
+Creates organizations, users and eligibility checks at realistic scale and
+loads them with PostgreSQL ``COPY``. Check results come from the mock
+provider's deterministic generator, so they match what the mock API would
+return for the same members. ``member_eligibility_latest`` is then filled
+from the loaded checks. Usage:
+
+    python -m app.seed_synthetic --organizations 2000 --checks 5000000
+    python -m app.seed_synthetic --checks 200000 --days 90 --random-seed 7 --jobs 4
+"""
+
+import argparse
+import csv
+import io
+import json
+import math
+import multiprocessing
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.database import engine
+from app.core.security import get_password_hash
+from app.insurance.mock_data import FIRST_NAMES, INSURANCE_COMPANIES, LAST_NAMES
+from app.insurance.mock_provider import MockInsuranceProvider
+from app.models.eligibility import BACKFILL_MEMBER_ELIGIBILITY_LATEST, EligibilityStatus
+from app.models.organization import OrganizationType, SubscriptionTier
+from app.models.user import UserRole
+from app.seed import upgrade_schema
+
+SYNTHETIC_PASSWORD = "CareLink2024!"
+DOB_EPOCH = date(1940, 1, 1)
+
+# Share of checks by insurer; the mandatory fund dominates real traffic
+INSURER_WEIGHTS = {name: 1.0 for name in INSURANCE_COMPANIES}
+INSURER_WEIGHTS["ФСМС (ОСМС)"] = 12.0
+INSURER_WEIGHTS["Халық-Қазақстан"] = 3.0
+INSURER_WEIGHTS["Евразия"] = 2.5
+
+TIER_WEIGHTS = {
+    SubscriptionTier.TRIAL: 0.35,
+    SubscriptionTier.BASIC: 0.45,
+    SubscriptionTier.PROFESSIONAL: 0.20,
+}
+TYPE_WEIGHTS = {
+    OrganizationType.CLINIC: 0.75,
+    OrganizationType.URGENT_CARE: 0.15,
+    OrganizationType.HOSPITAL: 0.10,
+}
+ROLE_WEIGHTS = {UserRole.ADMIN: 0.1, UserRole.STAFF: 0.75, UserRole.VIEWER: 0.15}
+
+# Check volume by hour of day (UTC+5 clinic hours peak mid-morning)
+HOURLY_WEIGHTS = [
+    0.2, 0.1, 0.1, 0.1, 0.2, 0.5, 1.0, 2.5, 5.0, 7.0, 7.5, 7.0,
+    5.5, 6.0, 6.5, 6.0, 5.0, 3.5, 2.0, 1.2, 0.8, 0.5, 0.4, 0.3,
+]
+WEEKDAY_WEIGHTS = [1.0, 1.0, 1.0, 1.0, 0.95, 0.45, 0.15]
+
+ORGANIZATION_COLUMNS = (
+    "id", "name", "type", "npi_number", "address", "phone",
+    "subscription_tier", "created_at", "updated_at",
+)
+USER_COLUMNS = (
+    "id", "email", "password_hash", "full_name", "role",
+    "organization_id", "is_active", "created_at", "last_login",
+)
+CHECK_COLUMNS = (
+    "id", "user_id", "organization_id", "patient_first_name", "patient_last_name",
+    "patient_dob", "insurance_company", "member_id", "group_number", "status",
+    "response_data", "error_message", "response_time_ms", "created_at",
+)
+
+
+def random_uuid(rng: random.Random) -> uuid.UUID:
+    """Reproducible UUID4 drawn from ``rng``."""
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+def copy_rows(cursor, table: str, columns: tuple[str, ...], rows: list[tuple]) -> None:
+    """Stream rows into ``table`` with a single COPY."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows(rows)
+    buffer.seek(0)
+    cursor.copy_expert(
+        f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv, NULL '')",
+        buffer,
+    )
+
+
+class SyntheticDataGenerator:
+    """Reproducible generator for organizations, users and checks."""
+
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.rng = random.Random(args.random_seed)
+        self.provider = MockInsuranceProvider()
+        self.now = datetime.utcnow().replace(microsecond=0)
+        self.password_hash = get_password_hash(SYNTHETIC_PASSWORD)
+
+        # Members recur across checks, so their encoded results are reused
+        self.result_cache: dict[tuple[str, str], tuple[str, str, str | None]] = {}
+
+        self.organizations: list[uuid.UUID] = []
+        self.org_users: list[list[uuid.UUID]] = []
+        self.org_weights: list[float] = []
+
+        # Patients keep one insurer; a 1000-slot table maps identities to insurers
+        total_weight = sum(INSURER_WEIGHTS.values())
+        self.insurer_slots = [
+            name
+            for name, weight in INSURER_WEIGHTS.items()
+            for _ in range(round(1000 * weight / total_weight))
+        ]
+        # Precompute the minute-of-week distribution once for all checks
+        self.minute_of_week_cum_weights = list(
+            _accumulate(
+                WEEKDAY_WEIGHTS[minute // 1440] * HOURLY_WEIGHTS[(minute % 1440) // 60]
+                for minute in range(7 * 1440)
+            )
+        )
+        # Week 0 starts at the most recent Monday so weekdays line up
+        self.monday = (self.now - timedelta(days=self.now.weekday())).replace(
+            hour=0, minute=0, second=0
+        )
+        # Week 0 covers at most the last 7 days, so one more week reaches the earliest day
+        self.weeks = math.ceil(args.days / 7) + 1
+        self.earliest = self.now - timedelta(days=args.days)
+
+    def organization_rows(self) -> list[tuple]:
+        rows = []
+        tiers, tier_weights = zip(*TIER_WEIGHTS.items())
+        types, type_weights = zip(*TYPE_WEIGHTS.items())
+        for index in range(self.args.organizations):
+            org_id = random_uuid(self.rng)
+            created_at = self.now - timedelta(days=self.rng.randint(30, 3 * 365))
+            rows.append((
+                org_id,
+                f"Synthetic Clinic {index:07d}",
+                self.rng.choices(types, type_weights)[0].name,
+                None,
+                f"{self.rng.randint(1, 300)} Abay Ave, Almaty",
+                f"+7 7{self.rng.randint(0, 99):02d} {self.rng.randint(0, 9999999):07d}",
+                self.rng.choices(tiers, tier_weights)[0].name,
+                created_at,
+                created_at,
+            ))
+            self.organizations.append(org_id)
+            # Clinic activity is heavy-tailed: a few large customers dominate
+            self.org_weights.append(self.rng.paretovariate(1.2))
+        return rows
+
+    def user_rows(self) -> list[tuple]:
+        rows = []
+        roles, role_weights = zip(*ROLE_WEIGHTS.items())
+        serial = 0
+        for org_index, org_id in enumerate(self.organizations):
+            # Bigger customers have more staff
+            size = min(
+                self.args.max_users_per_org,
+                max(1, round(self.org_weights[org_index] * self.args.users_per_org)),
+            )
+            users = []
+            for position in range(size):
+                user_id = random_uuid(self.rng)
+                role = UserRole.ADMIN if position == 0 else self.rng.choices(roles, role_weights)[0]
+                created_at = self.now - timedelta(days=self.rng.randint(1, 700))
+                rows.append((
+                    user_id,
+                    f"user{serial:08d}@synthetic.carelink.demo",
+                    self.password_hash,
+                    f"{self.rng.choice(FIRST_NAMES)} {self.rng.choice(LAST_NAMES)}",
+                    role.name,
+                    org_id,
+                    self.rng.random() > 0.03,
+                    created_at,
+                    self.now - timedelta(minutes=self.rng.randint(0, 60 * 24 * 30)),
+                ))
+                users.append(user_id)
+                serial += 1
+            self.org_users.append(users)
+        return rows
+
+    def created_at_batch(self, count: int) -> list[datetime]:
+        """Draw check timestamps following weekly and daily traffic patterns."""
+        timestamps = []
+        while len(timestamps) < count:
+            minutes = self.rng.choices(
+                range(7 * 1440), cum_weights=self.minute_of_week_cum_weights, k=count
+            )
+            for minute in minutes:
+                created_at = self.monday + timedelta(
+                    weeks=-self.rng.randrange(self.weeks),
+                    minutes=minute,
+                    seconds=self.rng.randrange(60),
+                )
+                # Drop draws in the future or beyond the history span
+                if self.earliest <= created_at <= self.now:
+                    timestamps.append(created_at)
+        return timestamps[:count]
+
+    def member_result(
+        self,
+        insurance_company: str,
+        member_id: str,
+        first_name: str,
+        last_name: str,
+    ) -> tuple[str, str, str | None]:
+        """Get (db status, encoded response_data, error) for a member."""
+        key = (insurance_company, member_id)
+        cached = self.result_cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = self.provider.generate_result(
+            first_name, last_name, insurance_company, member_id
+        )
+        status = (
+            EligibilityStatus.ERROR if result.status == "error" else EligibilityStatus.SUCCESS
+        )
+        response_data = {
+            "status": result.status,
+            "coverage": result.coverage,
+            "subscriber": result.subscriber,
+        }
+        encoded = (status.name, json.dumps(response_data, ensure_ascii=False), result.error_message)
+
+        if len(self.result_cache) >= 1_000_000:
+            self.result_cache.clear()
+        self.result_cache[key] = encoded
+        return encoded
+
+    def check_rows(self, count: int, org_cum_weights: list[float]) -> list[tuple]:
+        """Generate one batch of eligibility check rows."""
+        rows = []
+        org_indexes = self.rng.choices(
+            range(len(self.organizations)), cum_weights=org_cum_weights, k=count
+        )
+
+        created_ats = self.created_at_batch(count)
+        patients = [self.rng.randrange(self.args.patients_per_org) for _ in range(count)]
+        cached_flags = [self.rng.random() < self.args.cache_hit_ratio for _ in range(count)]
+
+        for org_index, patient, cached, created_at in zip(
+            org_indexes, patients, cached_flags, created_ats
+        ):
+            # Each clinic sees a bounded patient panel, so members recur.
+            # Identity is derived from (org, patient) so it is stable.
+            identity = org_index * 1_000_003 + patient
+            first_name = FIRST_NAMES[identity % len(FIRST_NAMES)]
+            last_name = LAST_NAMES[(identity // len(FIRST_NAMES)) % len(LAST_NAMES)]
+            dob = DOB_EPOCH + timedelta(days=(identity * 7919) % 30000)
+            insurance_company = self.insurer_slots[(identity * 104729) % len(self.insurer_slots)]
+            member_id = f"KZ{org_index:06d}{patient:06d}"
+
+            status, response_data, error_message = self.member_result(
+                insurance_company, member_id, first_name, last_name
+            )
+            response_time_ms = 0 if cached else round(self.rng.lognormvariate(7.0, 0.35))
+
+            rows.append((
+                random_uuid(self.rng),
+                self.rng.choice(self.org_users[org_index]),
+                self.organizations[org_index],
+                first_name,
+                last_name,
+                dob,
+                insurance_company,
+                member_id,
+                None,
+                status,
+                response_data,
+                error_message,
+                response_time_ms,
+                created_at,
+            ))
+        return rows
+
+    def load_checks(self, worker: int, count: int) -> int:
+        """Generate and COPY ``count`` checks on a dedicated connection."""
+        # Each worker draws its own reproducible stream
+        self.rng = random.Random(f"{self.args.random_seed}:{worker}")
+        if multiprocessing.parent_process() is not None:
+            # Forked children must not reuse the parent's pooled connections
+            engine.dispose(close=False)
+        connection = engine.raw_connection()
+        try:
+            cursor = connection.cursor()
+            org_cum_weights = _accumulate(self.org_weights)
+            loaded = 0
+            started = time.perf_counter()
+            while loaded < count:
+                batch = min(self.args.batch_size, count - loaded)
+                copy_rows(
+                    cursor,
+                    "eligibility_checks",
+                    CHECK_COLUMNS,
+                    self.check_rows(batch, org_cum_weights),
+                )
+                connection.commit()
+                loaded += batch
+                elapsed = time.perf_counter() - started
+                print(f"  [worker {worker}] {loaded:,} checks ({loaded / elapsed:,.0f} rows/s)", flush=True)
+            return loaded
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
+
+    def run(self) -> None:
+        upgrade_schema()
+        started = time.perf_counter()
+
+        connection = engine.raw_connection()
+        try:
+            cursor = connection.cursor()
+            copy_rows(cursor, "organizations", ORGANIZATION_COLUMNS, self.organization_rows())
+            copy_rows(cursor, "users", USER_COLUMNS, self.user_rows())
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
+
+        user_count = sum(len(users) for users in self.org_users)
+        print(f"Loaded {len(self.organizations):,} organizations and {user_count:,} users")
+
+        # Workers are forked so they inherit the organizations and users
+        jobs = max(1, self.args.jobs)
+        shares = [self.args.checks // jobs + (1 if i < self.args.checks % jobs else 0) for i in range(jobs)]
+        if jobs == 1:
+            loaded = self.load_checks(0, shares[0])
+        else:
+            context = multiprocessing.get_context("fork")
+            with context.Pool(jobs) as pool:
+                loaded = sum(pool.starmap(self.load_checks, enumerate(shares)))
+
+        # COPY bypasses the per-check upsert, so derive the latest results once
+        with engine.begin() as conn:
+            members = conn.execute(BACKFILL_MEMBER_ELIGIBILITY_LATEST).rowcount
+        print(f"Filled member_eligibility_latest for {members:,} members")
+
+        if self.args.analyze:
+            with engine.begin() as conn:
+                conn.exec_driver_sql(
+                    "ANALYZE organizations, users, eligibility_checks, member_eligibility_latest"
+                )
+
+        elapsed = time.perf_counter() - started
+        total = len(self.organizations) + user_count + loaded
+        print(f"\nLoaded {total:,} rows in {elapsed:.1f}s ({total / elapsed:,.0f} rows/s)")
+        print(f"Synthetic users log in with password {SYNTHETIC_PASSWORD}")
+
+
+def _accumulate(values) -> list[float]:
+    total = 0.0
+    result = []
+    for value in values:
+        total += value
+        result.append(total)
+    return result
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--organizations", type=int, default=1000)
+    parser.add_argument("--users-per-org", type=float, default=4, help="Typical users per organization")
+    parser.add_argument("--max-users-per-org", type=int, default=200)
+    parser.add_argument("--checks", type=int, default=1_000_000)
+    parser.add_argument("--patients-per-org", type=int, default=5000)
+    parser.add_argument("--days", type=_positive_int, default=365, help="History span to spread checks over")
+    parser.add_argument("--cache-hit-ratio", type=float, default=0.3)
+    parser.add_argument("--batch-size", type=int, default=50_000)
+    parser.add_argument("--jobs", type=int, default=min(8, os.cpu_count() or 1), help="Parallel loader processes")
+    parser.add_argument("--random-seed", type=int, default=2024)
+    parser.add_argument("--no-analyze", dest="analyze", action="store_false")
+    SyntheticDataGenerator(parser.parse_args()).run()
+
+
+if __name__ == "__main__":
+    main()
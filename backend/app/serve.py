@@ -0,0 +1,132 @@
+"""Preforking server launcher.
+
+Usage:
+    python -m app.serve --workers 4
+    python -m app.serve --host 0.0.0.0 --port 8000 --workers 8
+
+The parent process imports the application once, binds the listening socket,
+collects garbage and freezes the GC heap, then forks the workers. Workers
+start with every module already imported and share those pages with the
+parent copy-on-write; ``gc.freeze()`` keeps the collector from touching (and
+so copying) the shared objects. Each worker runs its own lifespan, so
+database and Redis connections are opened after the fork. Workers that exit
+unexpectedly are replaced.
+
+Run ``alembic upgrade head`` before starting the server.
+"""
+
+import argparse
+import asyncio
+import gc
+import logging
+import os
+import signal
+import sys
+import time
+
+import uvicorn
+
+# The pre-fork parent never starts app.core.logs, so it logs like uvicorn does
+logger = logging.getLogger("uvicorn.error")
+
+# A worker that dies sooner than this after starting is crash-looping
+MIN_WORKER_UPTIME_S = 5.0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        help="Worker processes (default: WEB_CONCURRENCY or CPU count)",
+    )
+    parser.add_argument("--log-level", default="info")
+    return parser.parse_args()
+
+
+class WorkerServer(uvicorn.Server):
+    """Uvicorn server that shuts down on SIGTERM from the parent only.
+
+    Ctrl+C reaches the whole process group; if workers also reacted to it,
+    the parent's SIGTERM would arrive as a second signal and force-exit them
+    without running shutdown.
+    """
+
+    def install_signal_handlers(self) -> None:
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        asyncio.get_event_loop().add_signal_handler(
+            signal.SIGTERM, self.handle_exit, signal.SIGTERM, None
+        )
+
+
+def run_worker(config: uvicorn.Config, sock) -> None:
+    """Serve on the inherited socket until told to stop."""
+    # Drop the parent's handlers, which would signal sibling workers
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    WorkerServer(config).run(sockets=[sock])
+
+
+def main() -> None:
+    args = parse_args()
+    started = time.perf_counter()
+
+    from app.main import app  # Import once, before forking
+
+    config = uvicorn.Config(app, host=args.host, port=args.port, log_level=args.log_level)
+    sock = config.bind_socket()
+
+    gc.collect()
+    gc.freeze()
+    logger.info(
+        "Imported application in %.0f ms; forking %d workers",
+        (time.perf_counter() - started) * 1000,
+        args.workers,
+    )
+
+    workers: dict[int, float] = {}
+    stopping = False
+
+    def spawn() -> None:
+        pid = os.fork()
+        if pid == 0:
+            try:
+                run_worker(config, sock)
+            finally:
+                os._exit(0)
+        workers[pid] = time.monotonic()
+
+    def stop(signum, frame) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in workers:
+            os.kill(pid, signal.SIGTERM)
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    for _ in range(args.workers):
+        spawn()
+
+    while workers:
+        pid, status = os.wait()
+        started_at = workers.pop(pid, None)
+        if stopping or started_at is None:
+            continue
+
+        logger.warning("Worker %d exited with status %d; replacing it", pid, status)
+        if time.monotonic() - started_at < MIN_WORKER_UPTIME_S:
+            # Do not spin if every new worker dies during startup
+            time.sleep(MIN_WORKER_UPTIME_S)
+        if not stopping:
+            spawn()
+
+    sock.close()
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,376 @@
+"""Batched audit logging of PHI access.
+
+Request handlers call ``audit_writer.record(...)``, which only appends to a
+bounded in-memory queue. A background flusher drains the queue and bulk
+inserts up to ``AUDIT_BATCH_SIZE`` rows per statement into the partitioned
+``audit_logs`` table, so auditing adds no database round-trip to requests.
+
+When the queue is full, or the database rejects a batch after retries,
+events are appended to a JSONL spool file under ``AUDIT_SPOOL_DIR``.
+Spool writes are fsynced, so while the event loop is serving requests they
+run in a thread. If the spool cannot be written, the events are inserted
+directly instead; only when both fail are they dropped, logged and counted
+in ``dropped``. On shutdown the queue is drained into the database, or into
+the spool if the database is unavailable. Spool files are replayed into the
+database when a worker starts.
+"""
+
+import asyncio
+import os
+import threading
+import time
+import uuid
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.config import get_settings
+from app.core import logs, serialization
+from app.database import engine
+from app.models.audit import AuditLog
+from app.models.user import User
+
+logger = logs.get_logger("audit")
+
+# Serializes partition creation across workers
+PARTITION_LOCK_ID = 0x6175646974  # "audit"
+
+
+def _add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def ensure_partitions(months_ahead: int) -> None:
+    """Create monthly audit_logs partitions through ``months_ahead`` months.
+
+    Rows that landed in ``audit_logs_default`` because a month's partition
+    was missing are moved into the new partition; Postgres refuses to
+    create a partition whose range the default partition still holds.
+    """
+    this_month = datetime.utcnow().date().replace(day=1)
+    with engine.begin() as connection:
+        connection.execute(text("SELECT pg_advisory_xact_lock(:id)"), {"id": PARTITION_LOCK_ID})
+        for offset in range(months_ahead + 1):
+            start = _add_months(this_month, offset)
+            end = _add_months(this_month, offset + 1)
+            name = f"audit_logs_p{start:%Y%m}"
+            if connection.execute(text("SELECT to_regclass(:name)"), {"name": name}).scalar():
+                continue
+
+            # Build the partition detached, move its rows out of the default
+            # partition, then attach it (which checks the default is clear)
+            connection.execute(
+                text(f"CREATE TABLE {name} (LIKE audit_logs INCLUDING DEFAULTS INCLUDING CONSTRAINTS)")
+            )
+            connection.execute(
+                text(
+                    f"WITH moved AS (DELETE FROM audit_logs_default "
+                    f"WHERE created_at >= :start AND created_at < :end RETURNING *) "
+                    f"INSERT INTO {name} SELECT * FROM moved"
+                ),
+                {"start": start, "end": end},
+            )
+            connection.execute(
+                text(
+                    f"ALTER TABLE audit_logs ATTACH PARTITION {name} "
+                    f"FOR VALUES FROM ('{start}') TO ('{end}')"
+                )
+            )
+
+
+def _process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _parse_spooled(line: bytes) -> dict:
+    """Decode a spooled row back into insert parameters."""
+    row = serialization.loads(line)
+    row["id"] = UUID(row["id"])
+    row["user_id"] = UUID(row["user_id"])
+    if row["resource_id"]:
+        row["resource_id"] = UUID(row["resource_id"])
+    row["created_at"] = datetime.fromisoformat(row["created_at"])
+    return row
+
+
+class AuditWriter:
+    """Bounded queue of audit rows with a batching flusher task."""
+
+    def __init__(self):
+        self.settings = get_settings()
+        self.spool_dir = Path(self.settings.AUDIT_SPOOL_DIR)
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        # Batch being written, so a timed-out shutdown can spool it
+        self._in_flight: list[dict] = []
+        # Monotonic time of the last successful partition check; None forces one
+        self._partitions_checked: Optional[float] = None
+        # Rows that did not fit in the queue, waiting for a spool thread
+        self._overflow: list[dict] = []
+        self._overflow_task: Optional[asyncio.Task] = None
+        # Guards the spool file and the counters updated from threads
+        self._spool_lock = threading.Lock()
+        self.written = 0
+        self.spooled = 0
+        self.dropped = 0  # neither spooled nor inserted
+
+    def record(
+        self,
+        user: User,
+        action: str,
+        resource_type: str,
+        resource_id: Optional[UUID] = None,
+        ip_address: Optional[str] = None,
+        extra_data: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """Queue an audit event without blocking.
+
+        Args:
+            user: User performing the action
+            action: What was done, e.g. "eligibility.view"
+            resource_type: Kind of resource accessed
+            resource_id: Accessed record, if a single one
+            ip_address: Client address
+            extra_data: Query parameters and other context
+        """
+        if not self.settings.AUDIT_ENABLED:
+            return
+
+        row = {
+            "id": uuid.uuid4(),
+            "user_id": user.id,
+            "action": action,
+            "resource_type": resource_type,
+            "resource_id": resource_id,
+            "ip_address": ip_address,
+            "extra_data": extra_data,
+            "created_at": datetime.utcnow(),
+        }
+
+        if self._task is None:
+            # Not running (scripts, shutdown): persist through the spool
+            self._spool_or_insert([row])
+            return
+        try:
+            self._queue.put_nowait(row)
+        except asyncio.QueueFull:
+            self._overflow.append(row)
+            if self._overflow_task is None or self._overflow_task.done():
+                self._overflow_task = asyncio.create_task(self._spool_overflow())
+
+    async def _spool_overflow(self) -> None:
+        """Spool rows that did not fit in the queue, off the event loop."""
+        while self._overflow:
+            rows, self._overflow = self._overflow, []
+            await asyncio.to_thread(self._spool_or_insert, rows)
+
+    def _ensure_partitions(self) -> None:
+        """Create upcoming partitions on the first insert and then once a day.
+
+        A failure is logged and retried on the next batch; meanwhile rows go
+        to the default partition and are moved once the partition exists.
+        """
+        now = time.monotonic()
+        if self._partitions_checked is not None and now - self._partitions_checked < 86400:
+            return
+        try:
+            ensure_partitions(self.settings.AUDIT_PARTITION_MONTHS_AHEAD)
+        except SQLAlchemyError as exc:
+            logger.warning("Audit partition check failed: %s", exc)
+            return
+        self._partitions_checked = now
+
+    def _insert(self, rows: list[dict]) -> None:
+        """Bulk insert rows, creating upcoming partitions once a day.
+
+        Rows already present (a spooled batch whose insert did complete) are
+        skipped.
+        """
+        self._ensure_partitions()
+
+        with engine.begin() as connection:
+            connection.execute(insert(AuditLog).on_conflict_do_nothing(), rows)
+
+    async def _write(self, rows: list[dict]) -> None:
+        """Insert a batch, retrying with backoff before spooling it."""
+        self._in_flight = rows
+        for attempt in range(self.settings.AUDIT_MAX_RETRIES + 1):
+            try:
+                await asyncio.to_thread(self._insert, rows)
+                self.written += len(rows)
+                self._in_flight = []
+                return
+            except SQLAlchemyError as exc:
+                if attempt == self.settings.AUDIT_MAX_RETRIES:
+                    logger.warning("Audit batch of %d spooled after error: %s", len(rows), exc)
+                    break
+                await asyncio.sleep(min(2**attempt * 0.1, 5.0))
+        await asyncio.to_thread(self._spool_or_insert, rows)
+        self._in_flight = []
+
+    def _spool(self, rows: list[dict]) -> None:
+        """Append rows to this worker's spool file."""
+        self.spool_dir.mkdir(parents=True, exist_ok=True)
+        path = self.spool_dir / f"audit-{os.getpid()}.jsonl"
+        with self._spool_lock, open(path, "ab") as f:
+            for row in rows:
+                f.write(serialization.dumps(row) + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+            self.spooled += len(rows)
+
+    def _spool_or_insert(self, rows: list[dict]) -> None:
+        """Spool rows, or insert them directly if the spool cannot be written."""
+        try:
+            self._spool(rows)
+        except OSError as spool_error:
+            try:
+                self._insert(rows)
+            except SQLAlchemyError as insert_error:
+                with self._spool_lock:
+                    self.dropped += len(rows)
+                logger.error(
+                    "Dropped %d audit events: spool failed (%s), insert failed (%s)",
+                    len(rows),
+                    spool_error,
+                    insert_error,
+                )
+                return
+            with self._spool_lock:
+                self.written += len(rows)
+            logger.warning(
+                "Audit spool failed (%s); inserted %d events directly", spool_error, len(rows)
+            )
+
+    def replay_spool(self) -> int:
+        """Insert spooled rows left by any worker, then delete their files.
+
+        Files of workers that are still running are left alone. Each file
+        is claimed by renaming it, so concurrent workers never replay the
+        same file; a failed replay puts it back for the next start. Inserts
+        skip rows already present, so a partly replayed file is safe to
+        replay again.
+
+        Returns:
+            Number of rows replayed
+        """
+        if not self.spool_dir.exists():
+            return 0
+
+        # Release claims of workers that died mid-replay
+        for claimed in self.spool_dir.glob("audit-*.replaying-*"):
+            if not _process_alive(int(claimed.suffix.rsplit("-", 1)[1])):
+                claimed.rename(claimed.with_suffix(".jsonl"))
+
+        replayed = 0
+        for path in sorted(self.spool_dir.glob("audit-*.jsonl")):
+            owner = int(path.stem.split("-", 1)[1])
+            if owner != os.getpid() and _process_alive(owner):
+                continue
+
+            claimed = path.with_suffix(f".replaying-{os.getpid()}")
+            try:
+                path.rename(claimed)
+            except FileNotFoundError:
+                continue
+
+            try:
+                rows = [_parse_spooled(line) for line in claimed.read_bytes().splitlines() if line]
+                batch_size = self.settings.AUDIT_BATCH_SIZE
+                for index in range(0, len(rows), batch_size):
+                    self._insert(rows[index : index + batch_size])
+            except Exception:
+                claimed.rename(path)
+                raise
+            claimed.unlink()
+            replayed += len(rows)
+        return replayed
+
+    async def _run(self) -> None:
+        """Flush batches of up to AUDIT_BATCH_SIZE, at least every interval.
+
+        Exits after writing everything queued before the ``None`` sentinel.
+        """
+        interval = self.settings.AUDIT_FLUSH_INTERVAL_MS / 1000
+        batch_size = self.settings.AUDIT_BATCH_SIZE
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            row = await self._queue.get()
+            if row is None:
+                break
+            rows = [row]
+            deadline = loop.time() + interval
+            while len(rows) < batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    row = await asyncio.wait_for(self._queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                if row is None:
+                    stopping = True
+                    break
+                rows.append(row)
+            try:
+                await self._write(rows)
+            except Exception:
+                # Keep the flusher alive whatever happens to one batch
+                logger.exception("Audit batch of %d failed", len(rows))
+
+    async def start(self) -> None:
+        """Replay spooled events and start the flusher."""
+        if not self.settings.AUDIT_ENABLED or self._task is not None:
+            return
+
+        try:
+            replayed = await asyncio.to_thread(self.replay_spool)
+            if replayed:
+                logger.info("Replayed %d spooled audit events", replayed)
+        except (SQLAlchemyError, OSError) as exc:
+            logger.warning("Audit spool replay failed: %s", exc)
+
+        self._queue = asyncio.Queue(maxsize=self.settings.AUDIT_QUEUE_MAX)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Persist every queued event, then stop the flusher.
+
+        Waits up to AUDIT_SHUTDOWN_TIMEOUT_S for the database; whatever is
+        not written by then is spooled.
+        """
+        if self._task is None:
+            return
+
+        task, self._task = self._task, None  # New events now go to the spool
+        await self._queue.put(None)
+        try:
+            await asyncio.wait_for(task, self.settings.AUDIT_SHUTDOWN_TIMEOUT_S)
+        except asyncio.TimeoutError:
+            rows = self._in_flight
+            while not self._queue.empty():
+                row = self._queue.get_nowait()
+                if row is not None:
+                    rows.append(row)
+            await asyncio.to_thread(self._spool_or_insert, rows)
+            logger.warning("Audit flush timed out; spooled %d events", len(rows))
+        if self._overflow_task is not None:
+            await self._overflow_task
+            self._overflow_task = None
+        self._queue = None
+
+
+audit_writer = AuditWriter()
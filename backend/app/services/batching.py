@@ -0,0 +1,109 @@
+"""Micro-batching of provider calls.
+
+Cache misses for the same insurer that arrive within
+``ELIGIBILITY_BATCH_WINDOW_MS`` of each other are sent as one
+``check_eligibility_batch`` submission, so N concurrent misses cost one
+payer round-trip instead of N. A batch is sent early once it reaches the
+batch size. Identical queries in a window share one slot in the batch.
+
+Batching only applies to providers with a native batch API
+(``max_batch_size > 1``); for the others it would only add latency.
+"""
+
+import asyncio
+from functools import lru_cache
+from typing import Optional
+
+from app.config import get_settings
+from app.insurance import (
+    EligibilityQuery,
+    EligibilityResult,
+    InsuranceProvider,
+    get_insurance_provider,
+)
+
+
+class _PendingBatch:
+    """Queries collected for one insurer during the current window."""
+
+    def __init__(self):
+        self.waiters: dict[EligibilityQuery, list[asyncio.Future]] = {}
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class ProviderBatcher:
+    """Groups concurrent provider calls per insurer into batch submissions."""
+
+    def __init__(self, provider: InsuranceProvider, window_s: float, max_size: int):
+        self.provider = provider
+        self.window_s = window_s
+        self.max_size = max(1, min(max_size, provider.max_batch_size))
+        self._pending: dict[str, _PendingBatch] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self.batches = 0
+        self.queries = 0
+
+    async def check(self, query: EligibilityQuery) -> EligibilityResult:
+        """Get the provider's result for ``query`` as part of a batch."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        batch = self._pending.get(query.insurance_company)
+        if batch is None:
+            batch = self._pending[query.insurance_company] = _PendingBatch()
+            batch.timer = loop.call_later(self.window_s, self._flush, query.insurance_company)
+        batch.waiters.setdefault(query, []).append(future)
+        if len(batch.waiters) >= self.max_size:
+            self._flush(query.insurance_company)
+
+        # Cancelling this wait (e.g. a request deadline) leaves the batch alone
+        return await future
+
+    def _flush(self, insurance_company: str) -> None:
+        batch = self._pending.pop(insurance_company, None)
+        if batch is None:
+            return
+        batch.timer.cancel()
+
+        # Skip queries whose callers all gave up during the window
+        waiters = {
+            query: futures
+            for query, futures in batch.waiters.items()
+            if not all(future.done() for future in futures)
+        }
+        if waiters:
+            task = asyncio.create_task(self._submit(waiters))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _submit(self, waiters: dict[EligibilityQuery, list[asyncio.Future]]) -> None:
+        queries = list(waiters)
+        self.batches += 1
+        self.queries += len(queries)
+        try:
+            results = await self.provider.check_eligibility_batch(queries)
+        except Exception as exc:
+            for futures in waiters.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(exc)
+            return
+
+        for query, result in zip(queries, results):
+            for future in waiters[query]:
+                if not future.done():
+                    future.set_result(result)
+
+
+@lru_cache()
+def get_provider_batcher() -> Optional[ProviderBatcher]:
+    """Get the process-wide batcher, or None when batching does not apply."""
+    settings = get_settings()
+    provider = get_insurance_provider()
+    if settings.ELIGIBILITY_BATCH_WINDOW_MS <= 0 or provider.max_batch_size <= 1:
+        return None
+    return ProviderBatcher(
+        provider,
+        window_s=settings.ELIGIBILITY_BATCH_WINDOW_MS / 1000,
+        max_size=settings.ELIGIBILITY_BATCH_MAX_SIZE,
+    )
@@ -0,0 +1,169 @@
+"""TTL policy for cached eligibility results.
+
+How long a result stays fresh depends on the insurer and on what the result
+says. A policy file is JSON of the form::
+
+    {
+      "default": {"active": 3600, "inactive": 21600, "not_found": 0},
+      "insurers": {
+        "ФСМС (ОСМС)": {"active": 604800, "inactive": 86400,
+                        "clamp_to_month_end": true}
+      },
+      "min_ttl": 60
+    }
+
+A TTL of 0 means the status is not cached; error results never are. Every
+TTL is clamped so the entry expires when coverage starts or ends (the day
+after ``termination_date``) and, where configured, at month end, when
+contribution-based coverage is re-evaluated. Boundaries are local midnights
+in ``COVERAGE_TIMEZONE``.
+"""
+
+import json
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+from zoneinfo import ZoneInfo
+
+from app.config import get_settings
+
+# Mandatory Social Health Insurance Fund: membership changes with monthly contributions
+OSMS_INSURER = "ФСМС (ОСМС)"
+
+
+@dataclass
+class StatusTTLs:
+    """Cache lifetimes in seconds for each cacheable result status."""
+
+    active: int = 3600
+    inactive: int = 3600
+    not_found: int = 0
+    clamp_to_month_end: bool = False
+
+    def for_status(self, status: str) -> int:
+        """TTL for a result status; 0 when it must not be cached."""
+        if status in ("active", "inactive", "not_found"):
+            return getattr(self, status)
+        return 0
+
+
+@dataclass
+class CachePolicy:
+    """Per-insurer TTLs with coverage-boundary clamping."""
+
+    default: StatusTTLs = field(default_factory=StatusTTLs)
+    insurers: dict[str, StatusTTLs] = field(default_factory=dict)
+    min_ttl: int = 60
+    timezone: str = "Asia/Almaty"
+
+    def rules_for(self, insurance_company: str) -> StatusTTLs:
+        """TTLs for an insurer, falling back to the default."""
+        return self.insurers.get(insurance_company, self.default)
+
+    def ttl_for(
+        self,
+        insurance_company: str,
+        result: dict,
+        now: datetime,
+        ttl: Optional[int] = None,
+    ) -> int:
+        """Get the TTL to cache ``result`` with, or 0 to skip caching.
+
+        Args:
+            insurance_company: Insurer the result came from
+            result: Cached payload (status, coverage, subscriber)
+            now: Current time, naive UTC
+            ttl: Base TTL overriding the status rule for cacheable
+                statuses (still clamped)
+
+        Returns:
+            TTL in seconds
+        """
+        rules = self.rules_for(insurance_company)
+        status_ttl = rules.for_status(result.get("status"))
+        if status_ttl <= 0:
+            return 0
+        if ttl is None:
+            ttl = status_ttl
+
+        for boundary in self._boundaries(result, now, rules):
+            ttl = min(ttl, int((boundary - now).total_seconds()))
+
+        # A boundary this close would expire the entry before it is reused
+        return ttl if ttl >= self.min_ttl else 0
+
+    def _boundaries(self, result: dict, now: datetime, rules: StatusTTLs) -> list[datetime]:
+        """Upcoming instants at which the result may change, in naive UTC."""
+        tz = ZoneInfo(self.timezone)
+        local_today = now.replace(tzinfo=timezone.utc).astimezone(tz).date()
+
+        def local_midnight(day: date) -> datetime:
+            midnight = datetime.combine(day, time(), tzinfo=tz)
+            return midnight.astimezone(timezone.utc).replace(tzinfo=None)
+
+        days = []
+        coverage = result.get("coverage") or {}
+        if coverage.get("effective_date"):
+            days.append(date.fromisoformat(coverage["effective_date"]))
+        if coverage.get("termination_date"):
+            # Coverage runs through the termination date itself
+            days.append(date.fromisoformat(coverage["termination_date"]) + timedelta(days=1))
+        if rules.clamp_to_month_end:
+            days.append((local_today.replace(day=1) + timedelta(days=32)).replace(day=1))
+
+        return [local_midnight(day) for day in days if day > local_today]
+
+
+def _parse_ttls(data: dict, base: StatusTTLs) -> StatusTTLs:
+    return StatusTTLs(
+        active=data.get("active", base.active),
+        inactive=data.get("inactive", base.inactive),
+        not_found=data.get("not_found", base.not_found),
+        clamp_to_month_end=data.get("clamp_to_month_end", base.clamp_to_month_end),
+    )
+
+
+def load_policy(path: str | Path, coverage_timezone: str = "Asia/Almaty") -> CachePolicy:
+    """Load a cache policy from a JSON file.
+
+    Insurer entries inherit unspecified values from ``default``.
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+
+    default = _parse_ttls(data.get("default", {}), StatusTTLs())
+    return CachePolicy(
+        default=default,
+        insurers={
+            name: _parse_ttls(ttls, default)
+            for name, ttls in data.get("insurers", {}).items()
+        },
+        min_ttl=data.get("min_ttl", 60),
+        timezone=coverage_timezone,
+    )
+
+
+@lru_cache()
+def get_cache_policy() -> CachePolicy:
+    """Get the configured cache policy."""
+    settings = get_settings()
+    if settings.ELIGIBILITY_CACHE_POLICY_PATH:
+        return load_policy(settings.ELIGIBILITY_CACHE_POLICY_PATH, settings.COVERAGE_TIMEZONE)
+
+    default = StatusTTLs(
+        active=settings.ELIGIBILITY_CACHE_TTL,
+        inactive=settings.ELIGIBILITY_CACHE_TTL,
+    )
+    return CachePolicy(
+        default=default,
+        insurers={
+            OSMS_INSURER: StatusTTLs(
+                active=7 * 86400,
+                inactive=86400,
+                clamp_to_month_end=True,
+            ),
+        },
+        timezone=settings.COVERAGE_TIMEZONE,
+    )
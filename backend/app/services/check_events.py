@@ -0,0 +1,137 @@
+"""Completion events for asynchronous eligibility checks.
+
+Events are published on one Redis pub/sub channel per organization so that
+whichever API worker completes a check can reach subscribers connected to
+any other worker. Without Redis, events are delivered to subscribers in this
+process only.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+from uuid import UUID
+
+import redis
+import redis.asyncio as aioredis
+
+from app.config import get_settings
+from app.core import serialization
+
+CHANNEL_PREFIX = "eligibility:events:"
+
+# Events buffered per local subscriber before new ones are dropped
+LOCAL_QUEUE_SIZE = 100
+
+
+class CheckEventSubscription:
+    """Stream of events for one organization."""
+
+    def __init__(
+        self,
+        pubsub: Optional[aioredis.client.PubSub] = None,
+        queue: Optional[asyncio.Queue] = None,
+    ):
+        self._pubsub = pubsub
+        self._queue = queue
+
+    async def get(self, timeout: float) -> Optional[dict[str, Any]]:
+        """Wait up to ``timeout`` seconds for the next event."""
+        if self._pubsub is not None:
+            message = await self._pubsub.get_message(
+                ignore_subscribe_messages=True, timeout=timeout
+            )
+            if message is None or message["type"] != "message":
+                return None
+            return serialization.loads(message["data"])
+
+        try:
+            payload = await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        return serialization.loads(payload)
+
+
+class CheckEventBroker:
+    """Publishes and subscribes to check completion events."""
+
+    def __init__(self):
+        self._local: dict[UUID, set[asyncio.Queue]] = {}
+        self._async_redis: Optional[aioredis.Redis] = None
+
+    @staticmethod
+    def channel(organization_id: UUID) -> str:
+        """Pub/sub channel for an organization's events."""
+        return f"{CHANNEL_PREFIX}{organization_id}"
+
+    def publish(
+        self,
+        redis_client: Optional[redis.Redis],
+        organization_id: UUID,
+        event: dict[str, Any],
+    ) -> None:
+        """Publish an event to every subscriber of the organization.
+
+        Args:
+            redis_client: Synchronous client used by the caller, or None
+                when Redis is unavailable
+            organization_id: Organization the event belongs to
+            event: JSON-serializable event
+        """
+        payload = serialization.dumps(event)
+        if redis_client is not None:
+            try:
+                redis_client.publish(self.channel(organization_id), payload)
+                return
+            except redis.RedisError:
+                pass
+
+        for queue in self._local.get(organization_id, ()):
+            try:
+                queue.put_nowait(payload)
+            except asyncio.QueueFull:
+                # A subscriber that stopped reading must not block publishers
+                pass
+
+    async def connect(self) -> Optional[aioredis.Redis]:
+        """Connect the shared asyncio client used for subscriptions.
+
+        Returns None while Redis is unavailable.
+        """
+        if self._async_redis is None:
+            client = aioredis.from_url(get_settings().REDIS_URL)
+            try:
+                await client.ping()
+            except redis.RedisError:
+                await client.aclose()
+                return None
+            self._async_redis = client
+        return self._async_redis
+
+    @asynccontextmanager
+    async def subscribe(
+        self, organization_id: UUID
+    ) -> AsyncIterator[CheckEventSubscription]:
+        """Subscribe to an organization's events for the duration of the block."""
+        client = await self.connect()
+        if client is not None:
+            pubsub = client.pubsub()
+            await pubsub.subscribe(self.channel(organization_id))
+            try:
+                yield CheckEventSubscription(pubsub=pubsub)
+            finally:
+                await pubsub.unsubscribe()
+                await pubsub.aclose()
+            return
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=LOCAL_QUEUE_SIZE)
+        subscribers = self._local.setdefault(organization_id, set())
+        subscribers.add(queue)
+        try:
+            yield CheckEventSubscription(queue=queue)
+        finally:
+            subscribers.discard(queue)
+            if not subscribers:
+                del self._local[organization_id]
+
+
+check_events = CheckEventBroker()
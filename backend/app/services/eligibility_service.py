@@ -1,17 +1,57 @@
 """Eligibility check service with caching."""
 
-import json
-from datetime import date
-from typing import Optional
+import time
+from datetime import date, datetime
+from typing import Optional, Sequence, Union
 from uuid import UUID
 
 import redis
+from sqlalchemy import case, func, text, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session
 
 from app.config import get_settings
-from app.models.eligibility import EligibilityCheck, EligibilityStatus
+from app.core import logs, serialization, timing
+from app.core.clock import get_clock
+from app.core.deadline import Deadline, DeadlineExceeded
+from app.core.redis_pool import get_redis
+from app.core.redis_shards import ShardedRedis, get_cache_redis
+from app.database import replica_router
+from app.models.eligibility import (
+    EligibilityCheck,
+    EligibilityStatus,
+    MemberEligibilityLatest,
+)
 from app.models.user import User
-from app.insurance import get_insurance_provider, EligibilityResult
+from app.insurance import get_insurance_provider, EligibilityQuery, EligibilityResult
+from app.services.batching import get_provider_batcher
+from app.services.cache_policy import get_cache_policy
+from app.services.check_events import check_events
+from app.services.priority import db_write_scheduler, provider_scheduler
+
+logger = logs.get_logger("eligibility")
+
+# Columns selectable for sparse history views. "status" is the provider
+# status read out of response_data server-side, so the JSONB document
+# itself is only transferred and decoded when "response_data" is requested.
+HISTORY_COLUMNS = {
+    "id": EligibilityCheck.id,
+    "patient_first_name": EligibilityCheck.patient_first_name,
+    "patient_last_name": EligibilityCheck.patient_last_name,
+    "patient_dob": EligibilityCheck.patient_dob,
+    "insurance_company": EligibilityCheck.insurance_company,
+    "member_id": EligibilityCheck.member_id,
+    "group_number": EligibilityCheck.group_number,
+    "status": case(
+        (EligibilityCheck.status == EligibilityStatus.PENDING, "pending"),
+        else_=func.coalesce(EligibilityCheck.response_data["status"].astext, "error"),
+    ),
+    "response_data": EligibilityCheck.response_data,
+    "error_message": EligibilityCheck.error_message,
+    "response_time_ms": EligibilityCheck.response_time_ms,
+    "created_at": EligibilityCheck.created_at,
+}
 
 
 class EligibilityService:
@@ -21,23 +61,13 @@ class EligibilityService:
         self.db = db
         self.settings = get_settings()
         self.provider = get_insurance_provider()
-        self._redis: Optional[redis.Redis] = None
+        self.batcher = get_provider_batcher()
+        self.cache_policy = get_cache_policy()
 
     @property
-    def redis_client(self) -> Optional[redis.Redis]:
-        """Lazy initialization of Redis client."""
-        if self._redis is None:
-            try:
-                self._redis = redis.from_url(
-                    self.settings.REDIS_URL,
-                    decode_responses=True,
-                )
-                # Test connection
-                self._redis.ping()
-            except redis.ConnectionError:
-                # Redis not available, continue without caching
-                self._redis = None
-        return self._redis
+    def redis_client(self) -> Optional[Union[ShardedRedis, redis.Redis]]:
+        """Cache client, sharded when configured; None when Redis is unavailable."""
+        return get_cache_redis()
 
     def _get_cache_key(
         self,
@@ -48,22 +78,55 @@ class EligibilityService:
         """Generate cache key for eligibility check."""
         return f"eligibility:{insurance_company}:{member_id}:{patient_dob.isoformat()}"
 
+    def _get_stale_cache_key(
+        self,
+        insurance_company: str,
+        member_id: str,
+        patient_dob: date,
+    ) -> str:
+        """Generate cache key for the last known result of a member."""
+        return f"eligibility:stale:{insurance_company}:{member_id}:{patient_dob.isoformat()}"
+
+    def _get_response_cache_key(self, organization_id: UUID, check_id: UUID) -> str:
+        """Generate cache key for an encoded check response body."""
+        return f"eligibility:response:{organization_id}:{check_id}"
+
+    @staticmethod
+    def _serialize_result(result: dict) -> bytes:
+        """Encode a response payload for the cache."""
+        return serialization.dumps(result)
+
+    @staticmethod
+    def _deserialize_result(cached: bytes) -> dict:
+        """Decode a cached response payload."""
+        return serialization.loads(cached)
+
     def _get_cached_result(
         self,
         insurance_company: str,
         member_id: str,
         patient_dob: date,
-    ) -> Optional[dict]:
-        """Get cached eligibility result if available."""
+    ) -> Optional[tuple[dict, Optional[datetime]]]:
+        """Get cached eligibility result and when it was fetched, if available.
+
+        The fetch time is read from the stale copy in the same round trip;
+        it is None if that copy is gone.
+        """
         if not self.redis_client:
             return None
 
-        cache_key = self._get_cache_key(insurance_company, member_id, patient_dob)
-        cached = self.redis_client.get(cache_key)
+        with timing.phase("cache"):
+            cached, stale = self.redis_client.mget(
+                self._get_cache_key(insurance_company, member_id, patient_dob),
+                self._get_stale_cache_key(insurance_company, member_id, patient_dob),
+            )
+        if not cached:
+            return None
 
-        if cached:
-            return json.loads(cached)
-        return None
+        fetched_at = None
+        if stale:
+            fetched_at = datetime.fromisoformat(self._deserialize_result(stale)["cached_at"])
+        return self._deserialize_result(cached), fetched_at
 
     def _cache_result(
         self,
@@ -71,65 +134,220 @@ class EligibilityService:
         member_id: str,
         patient_dob: date,
         result: dict,
+        ttl: Optional[int] = None,
+        fetched_at: Optional[datetime] = None,
     ) -> None:
-        """Cache eligibility result."""
+        """Cache eligibility result for as long as the cache policy allows.
+
+        ``ttl`` overrides the policy's status TTL but is still clamped to
+        coverage boundaries. ``fetched_at`` is when the insurer returned the
+        result, if not just now.
+        """
         if not self.redis_client:
             return
 
-        cache_key = self._get_cache_key(insurance_company, member_id, patient_dob)
-        self.redis_client.setex(
-            cache_key,
-            self.settings.ELIGIBILITY_CACHE_TTL,
-            json.dumps(result),
+        now = get_clock().now()
+        ttl = self.cache_policy.ttl_for(insurance_company, result, now, ttl)
+        if ttl <= 0:
+            return
+
+        # The stale copy outlives the fresh entry but not the coverage period
+        stale_ttl = self.cache_policy.ttl_for(
+            insurance_company, result, now, max(ttl, self.settings.ELIGIBILITY_STALE_TTL)
         )
 
-    async def check_eligibility(
+        pipe = self.redis_client.pipeline(transaction=False)
+        pipe.setex(
+            self._get_cache_key(insurance_company, member_id, patient_dob),
+            ttl,
+            self._serialize_result(result),
+        )
+        pipe.setex(
+            self._get_stale_cache_key(insurance_company, member_id, patient_dob),
+            stale_ttl,
+            self._serialize_result({"cached_at": fetched_at or now, "result": result}),
+        )
+        with timing.phase("cache"):
+            pipe.execute()
+
+    def _get_stale_result(
         self,
-        user: User,
-        patient_first_name: str,
-        patient_last_name: str,
+        insurance_company: str,
+        member_id: str,
         patient_dob: date,
+    ) -> Optional[dict]:
+        """Get the last known result, with the naive UTC time it was cached."""
+        if not self.redis_client:
+            return None
+
+        with timing.phase("cache"):
+            cached = self.redis_client.get(
+                self._get_stale_cache_key(insurance_company, member_id, patient_dob)
+            )
+        return self._deserialize_result(cached) if cached else None
+
+    def _get_latest(
+        self,
+        organization_id: UUID,
         insurance_company: str,
         member_id: str,
-        group_number: Optional[str] = None,
-    ) -> EligibilityCheck:
-        """Perform eligibility check with caching.
+        patient_dob: date,
+    ) -> Optional[MemberEligibilityLatest]:
+        """Get the member's last conclusive result within an organization."""
+        return self.db.get(
+            MemberEligibilityLatest,
+            (organization_id, insurance_company, member_id, patient_dob),
+        )
+
+    def fresh_ttl(self, latest: MemberEligibilityLatest, now: datetime) -> int:
+        """Seconds ``latest`` stays fresh under the cache policy, or 0.
+
+        A row is fresh for as long as a cache entry written when it was
+        checked would have lived.
+        """
+        ttl = self.cache_policy.ttl_for(
+            latest.insurance_company, latest.response_data, latest.checked_at
+        )
+        return max(0, ttl - int((now - latest.checked_at).total_seconds()))
+
+    def lookup_latest(
+        self, user: User, members: Sequence[tuple[str, str, date]]
+    ) -> list[dict]:
+        """Get the latest status of many members in one indexed query.
 
         Args:
-            user: The user performing the check
-            patient_first_name: Patient's first name
-            patient_last_name: Patient's last name
-            patient_dob: Patient's date of birth
-            insurance_company: Insurance company name
-            member_id: Insurance member ID
-            group_number: Optional group number
+            user: The user whose organization's results are read
+            members: (insurance_company, member_id, patient_dob) keys
 
         Returns:
-            EligibilityCheck record with results
+            One item per distinct member, in request order; members never
+            checked have a null status
         """
-        # Check cache first
-        cached_result = self._get_cached_result(
-            insurance_company, member_id, patient_dob
+        members = list(dict.fromkeys(members))
+        rows = (
+            self.db.query(MemberEligibilityLatest)
+            .filter(
+                MemberEligibilityLatest.organization_id == user.organization_id,
+                tuple_(
+                    MemberEligibilityLatest.insurance_company,
+                    MemberEligibilityLatest.member_id,
+                    MemberEligibilityLatest.patient_dob,
+                ).in_(members),
+            )
+            .all()
         )
+        found = {(row.insurance_company, row.member_id, row.patient_dob): row for row in rows}
+
+        now = get_clock().now()
+        items = []
+        for insurance_company, member_id, patient_dob in members:
+            item = {
+                "insurance_company": insurance_company,
+                "member_id": member_id,
+                "patient_dob": patient_dob,
+                "status": None,
+                "coverage": None,
+                "subscriber": None,
+                "check_id": None,
+                "checked_at": None,
+                "fresh": False,
+            }
+            row = found.get((insurance_company, member_id, patient_dob))
+            if row is not None:
+                item.update(
+                    status=row.status,
+                    coverage=row.response_data.get("coverage"),
+                    subscriber=row.response_data.get("subscriber"),
+                    check_id=row.check_id,
+                    checked_at=row.checked_at,
+                    fresh=self.fresh_ttl(row, now) > 0,
+                )
+            items.append(item)
+        return items
 
-        if cached_result:
-            # Create record with cached data
-            eligibility_check = EligibilityCheck(
-                user_id=user.id,
-                organization_id=user.organization_id,
-                patient_first_name=patient_first_name,
-                patient_last_name=patient_last_name,
-                patient_dob=patient_dob,
-                insurance_company=insurance_company,
-                member_id=member_id,
-                group_number=group_number,
-                status=EligibilityStatus(cached_result["status"]),
-                response_data=cached_result,
-                response_time_ms=0,  # Cached response
+    def _record_latest(
+        self, eligibility_check: EligibilityCheck, checked_at: Optional[datetime]
+    ) -> None:
+        """Upsert the member's latest row in the check's transaction.
+
+        Only conclusive results with a known fetch time are recorded; errors
+        and stale fallbacks never replace a row, and neither does a result
+        older than the one already stored.
+        """
+        response_data = eligibility_check.response_data or {}
+        if (
+            checked_at is None
+            or eligibility_check.error_message
+            or response_data.get("status") not in ("active", "inactive", "not_found")
+        ):
+            return
+
+        self.db.flush()  # assigns the check's id
+        statement = insert(MemberEligibilityLatest).values(
+            organization_id=eligibility_check.organization_id,
+            insurance_company=eligibility_check.insurance_company,
+            member_id=eligibility_check.member_id,
+            patient_dob=eligibility_check.patient_dob,
+            status=response_data["status"],
+            response_data=response_data,
+            check_id=eligibility_check.id,
+            checked_at=checked_at,
+        )
+        self.db.execute(
+            statement.on_conflict_do_update(
+                index_elements=[
+                    MemberEligibilityLatest.organization_id,
+                    MemberEligibilityLatest.insurance_company,
+                    MemberEligibilityLatest.member_id,
+                    MemberEligibilityLatest.patient_dob,
+                ],
+                set_={
+                    "status": statement.excluded.status,
+                    "response_data": statement.excluded.response_data,
+                    "check_id": statement.excluded.check_id,
+                    "checked_at": statement.excluded.checked_at,
+                },
+                where=MemberEligibilityLatest.checked_at < statement.excluded.checked_at,
             )
-        else:
-            # Perform actual eligibility check
-            result: EligibilityResult = await self.provider.check_eligibility(
+        )
+
+    async def _query_provider(self, query: EligibilityQuery) -> EligibilityResult:
+        """Ask the provider, batched with concurrent misses when it supports batches.
+
+        Waits for a provider slot in the current priority lane first; the
+        wait counts as provider time.
+        """
+        with timing.phase("provider"):
+            async with provider_scheduler.slot():
+                if self.batcher is not None and self.batcher.provider is self.provider:
+                    return await self.batcher.check(query)
+
+                return await self.provider.check_eligibility(
+                    patient_first_name=query.patient_first_name,
+                    patient_last_name=query.patient_last_name,
+                    patient_dob=query.patient_dob,
+                    insurance_company=query.insurance_company,
+                    member_id=query.member_id,
+                    group_number=query.group_number,
+                )
+
+    async def refresh_cached_result(
+        self,
+        patient_first_name: str,
+        patient_last_name: str,
+        patient_dob: date,
+        insurance_company: str,
+        member_id: str,
+        group_number: Optional[str] = None,
+        ttl: Optional[int] = None,
+    ) -> EligibilityResult:
+        """Re-query the provider and repopulate the cache.
+
+        Used by background re-verification; no check record is written
+        because no user performed the check.
+        """
+        result: EligibilityResult = await self._query_provider(
+            EligibilityQuery(
                 patient_first_name=patient_first_name,
                 patient_last_name=patient_last_name,
                 patient_dob=patient_dob,
@@ -137,51 +355,376 @@ class EligibilityService:
                 member_id=member_id,
                 group_number=group_number,
             )
+        )
 
-            # Map result status to database enum
-            if result.status == "active":
-                db_status = EligibilityStatus.SUCCESS
-            elif result.status in ("inactive", "not_found"):
-                db_status = EligibilityStatus.SUCCESS  # Still a successful check
-            else:
-                db_status = EligibilityStatus.ERROR
-
-            # Build response data
-            response_data = {
+        self._cache_result(
+            insurance_company,
+            member_id,
+            patient_dob,
+            {
                 "status": result.status,
                 "coverage": result.coverage,
                 "subscriber": result.subscriber,
-            }
+            },
+            ttl=ttl,
+        )
+
+        return result
+
+    @staticmethod
+    def _map_status(result_status: str) -> EligibilityStatus:
+        """Map a provider result status to the database enum."""
+        # inactive and not_found are still successful checks
+        if result_status in ("active", "inactive", "not_found"):
+            return EligibilityStatus.SUCCESS
+        return EligibilityStatus.ERROR
+
+    async def _resolve_result(
+        self,
+        organization_id: UUID,
+        patient_first_name: str,
+        patient_last_name: str,
+        patient_dob: date,
+        insurance_company: str,
+        member_id: str,
+        group_number: Optional[str] = None,
+        force_refresh: bool = False,
+        deadline: Optional[Deadline] = None,
+    ) -> tuple[dict, Optional[datetime]]:
+        """Get result columns for a check from the cache or the provider.
+
+        When Redis has no entry, the organization's latest row for the
+        member is used if the cache policy still considers it fresh, and
+        Redis is re-warmed from it. ``force_refresh`` skips both reads; the
+        fresh result still repopulates the cache. A provider call that would
+        overrun ``deadline`` is cancelled and the member's last known result
+        is used instead.
+
+        Returns:
+            The result columns, and when the insurer returned the result
+            if it should be recorded as the member's latest (None
+            otherwise)
 
-            # Create eligibility check record
-            eligibility_check = EligibilityCheck(
-                user_id=user.id,
-                organization_id=user.organization_id,
+        Raises:
+            DeadlineExceeded: The deadline passed and there is no last
+                known result
+        """
+        if deadline:
+            deadline.check("cache lookup")
+
+        # Check cache first, then the latest table when Redis is cold
+        cached = latest = None
+        if not force_refresh:
+            cached = self._get_cached_result(insurance_company, member_id, patient_dob)
+            if cached is None:
+                latest = self._get_latest(
+                    organization_id, insurance_company, member_id, patient_dob
+                )
+                ttl = self.fresh_ttl(latest, get_clock().now()) if latest else 0
+                if ttl > 0:
+                    self._cache_result(
+                        insurance_company,
+                        member_id,
+                        patient_dob,
+                        latest.response_data,
+                        ttl=ttl,
+                        fetched_at=latest.checked_at,
+                    )
+                    # Already this organization's latest row; nothing to record
+                    cached = (latest.response_data, None)
+
+        if cached:
+            cached_result, fetched_at = cached
+            return {
+                "status": self._map_status(cached_result["status"]),
+                "response_data": cached_result,
+                "error_message": None,
+                "response_time_ms": 0,  # Cached response
+            }, fetched_at
+
+        # Perform actual eligibility check
+        provider_call = self._query_provider(
+            EligibilityQuery(
                 patient_first_name=patient_first_name,
                 patient_last_name=patient_last_name,
                 patient_dob=patient_dob,
                 insurance_company=insurance_company,
                 member_id=member_id,
                 group_number=group_number,
-                status=db_status,
-                response_data=response_data,
-                error_message=result.error_message,
-                response_time_ms=result.response_time_ms,
             )
-
-            # Cache successful results
-            if result.status in ("active", "inactive"):
-                self._cache_result(
+        )
+        if deadline is None:
+            result: EligibilityResult = await provider_call
+        else:
+            started = time.monotonic()
+            try:
+                result = await deadline.run(
+                    provider_call,
+                    "insurer request",
+                    reserve_s=self.settings.REQUEST_DEADLINE_RESERVE_MS / 1000,
+                )
+            except DeadlineExceeded:
+                stale = self._get_stale_result(insurance_company, member_id, patient_dob)
+                if stale is not None:
+                    stale_result = stale["result"]
+                    cached_at = datetime.fromisoformat(stale["cached_at"])
+                elif latest is not None:
+                    stale_result, cached_at = latest.response_data, latest.checked_at
+                else:
+                    logger.warning(
+                        "%s missed the deadline; no last known result",
+                        insurance_company,
+                        extra={"insurance_company": insurance_company},
+                    )
+                    raise
+                logger.warning(
+                    "%s missed the deadline; serving the result from %s",
                     insurance_company,
-                    member_id,
-                    patient_dob,
-                    response_data,
+                    cached_at.isoformat(),
+                    extra={"insurance_company": insurance_company},
                 )
+                return {
+                    "status": self._map_status(stale_result["status"]),
+                    "response_data": stale_result,
+                    "error_message": (
+                        "Insurer did not respond in time; showing the result "
+                        f"from {cached_at:%Y-%m-%d %H:%M} UTC"
+                    ),
+                    "response_time_ms": int((time.monotonic() - started) * 1000),
+                }, None
+
+        # Build response data
+        response_data = {
+            "status": result.status,
+            "coverage": result.coverage,
+            "subscriber": result.subscriber,
+        }
+
+        # The cache policy decides which statuses are kept, and for how long
+        self._cache_result(
+            insurance_company,
+            member_id,
+            patient_dob,
+            response_data,
+        )
+
+        return {
+            "status": self._map_status(result.status),
+            "response_data": response_data,
+            "error_message": result.error_message,
+            "response_time_ms": result.response_time_ms,
+        }, get_clock().now()
+
+    async def check_eligibility(
+        self,
+        user: User,
+        patient_first_name: str,
+        patient_last_name: str,
+        patient_dob: date,
+        insurance_company: str,
+        member_id: str,
+        group_number: Optional[str] = None,
+        force_refresh: bool = False,
+        deadline: Optional[Deadline] = None,
+    ) -> EligibilityCheck:
+        """Perform eligibility check with caching.
+
+        Args:
+            user: The user performing the check
+            patient_first_name: Patient's first name
+            patient_last_name: Patient's last name
+            patient_dob: Patient's date of birth
+            insurance_company: Insurance company name
+            member_id: Insurance member ID
+            group_number: Optional group number
+            force_refresh: Bypass the cached result and repopulate it
+            deadline: When the caller stops waiting; the provider call and
+                the write are bounded by it
+
+        Returns:
+            EligibilityCheck record with results
+
+        Raises:
+            DeadlineExceeded: The deadline passed before the record was
+                written; nothing is stored
+        """
+        outcome, checked_at = await self._resolve_result(
+            organization_id=user.organization_id,
+            patient_first_name=patient_first_name,
+            patient_last_name=patient_last_name,
+            patient_dob=patient_dob,
+            insurance_company=insurance_company,
+            member_id=member_id,
+            group_number=group_number,
+            force_refresh=force_refresh,
+            deadline=deadline,
+        )
+
+        eligibility_check = EligibilityCheck(
+            user_id=user.id,
+            organization_id=user.organization_id,
+            patient_first_name=patient_first_name,
+            patient_last_name=patient_last_name,
+            patient_dob=patient_dob,
+            insurance_company=insurance_company,
+            member_id=member_id,
+            group_number=group_number,
+            **outcome,
+        )
+
+        def save() -> None:
+            # The check and the member's latest row, in one transaction
+            if deadline is None:
+                self.db.add(eligibility_check)
+                self._record_latest(eligibility_check, checked_at)
+                self.db.commit()
+            else:
+                self._commit_within(eligibility_check, checked_at, deadline)
+            self.db.refresh(eligibility_check)
+
+        # Writes queue by priority lane and run off the event loop
+        await db_write_scheduler.run(save)
+        replica_router.mark_write(user.id)
+        self._log_recorded(eligibility_check)
+
+        return eligibility_check
+
+    @staticmethod
+    def _log_recorded(eligibility_check: EligibilityCheck) -> None:
+        response_data = eligibility_check.response_data or {}
+        logger.info(
+            "Eligibility check %s recorded: %s",
+            eligibility_check.id,
+            response_data.get("status", "error"),
+            extra={
+                "check_id": str(eligibility_check.id),
+                "insurance_company": eligibility_check.insurance_company,
+                "result": response_data.get("status", "error"),
+                "response_time_ms": eligibility_check.response_time_ms,
+                "cached": eligibility_check.response_time_ms == 0,
+            },
+        )
+
+    def _commit_within(
+        self,
+        eligibility_check: EligibilityCheck,
+        checked_at: Optional[datetime],
+        deadline: Deadline,
+    ) -> None:
+        """Insert a check and its latest row, giving up when the deadline passes.
+
+        The remaining time becomes the transaction's statement_timeout, so
+        a write stuck on locks or a slow primary is cancelled server-side.
+        """
+        deadline.check("database write")
+        timeout_ms = max(1, int(deadline.remaining() * 1000))
+        try:
+            self.db.execute(
+                text("SELECT set_config('statement_timeout', :timeout, true)"),
+                {"timeout": str(timeout_ms)},
+            )
+            self.db.add(eligibility_check)
+            self._record_latest(eligibility_check, checked_at)
+            self.db.commit()
+        except OperationalError:
+            self.db.rollback()
+            if deadline.expired:
+                raise DeadlineExceeded("database write") from None
+            raise
+
+    def create_pending_check(
+        self,
+        user: User,
+        patient_first_name: str,
+        patient_last_name: str,
+        patient_dob: date,
+        insurance_company: str,
+        member_id: str,
+        group_number: Optional[str] = None,
+    ) -> EligibilityCheck:
+        """Record a check in PENDING state, to be completed in the background.
+
+        Returns:
+            The pending EligibilityCheck record
+        """
+        eligibility_check = EligibilityCheck(
+            user_id=user.id,
+            organization_id=user.organization_id,
+            patient_first_name=patient_first_name,
+            patient_last_name=patient_last_name,
+            patient_dob=patient_dob,
+            insurance_company=insurance_company,
+            member_id=member_id,
+            group_number=group_number,
+            status=EligibilityStatus.PENDING,
+        )
 
-        # Save to database
         self.db.add(eligibility_check)
         self.db.commit()
         self.db.refresh(eligibility_check)
+        replica_router.mark_write(user.id)
+
+        return eligibility_check
+
+    async def complete_pending_check(
+        self, check_id: UUID, force_refresh: bool = False
+    ) -> Optional[EligibilityCheck]:
+        """Resolve a PENDING check, store the result and publish completion.
+
+        Args:
+            check_id: ID of a check created by create_pending_check
+            force_refresh: Bypass the cached result and repopulate it
+
+        Returns:
+            The completed EligibilityCheck, or None if it does not exist
+        """
+        eligibility_check = self.db.get(EligibilityCheck, check_id)
+        if eligibility_check is None or eligibility_check.status != EligibilityStatus.PENDING:
+            return eligibility_check
+
+        try:
+            outcome, checked_at = await self._resolve_result(
+                organization_id=eligibility_check.organization_id,
+                patient_first_name=eligibility_check.patient_first_name,
+                patient_last_name=eligibility_check.patient_last_name,
+                patient_dob=eligibility_check.patient_dob,
+                insurance_company=eligibility_check.insurance_company,
+                member_id=eligibility_check.member_id,
+                group_number=eligibility_check.group_number,
+                force_refresh=force_refresh,
+            )
+        except Exception:
+            # Never leave a record pending; clients are waiting on it
+            outcome = {
+                "status": EligibilityStatus.ERROR,
+                "response_data": {"status": "error", "coverage": None, "subscriber": None},
+                "error_message": "Eligibility check failed",
+                "response_time_ms": None,
+            }
+            checked_at = None
+
+        def save() -> None:
+            for column, value in outcome.items():
+                setattr(eligibility_check, column, value)
+            self._record_latest(eligibility_check, checked_at)
+            self.db.commit()
+            self.db.refresh(eligibility_check)
+
+        await db_write_scheduler.run(save)
+        replica_router.mark_write(eligibility_check.user_id)
+        self._log_recorded(eligibility_check)
+
+        content = serialization.check_response_content(eligibility_check)
+        self.cache_check_response(eligibility_check, serialization.dumps(content))
+        check_events.publish(
+            get_redis(),
+            eligibility_check.organization_id,
+            {
+                "type": "check.completed",
+                "user_id": eligibility_check.user_id,
+                "check": content,
+            },
+        )
 
         return eligibility_check
 
@@ -192,7 +735,8 @@ class EligibilityService:
         limit: int = 50,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
-    ) -> tuple[list[EligibilityCheck], int]:
+        fields: Optional[Sequence[str]] = None,
+    ) -> tuple[list, int]:
         """Get eligibility check history for user's organization.
 
         Args:
@@ -201,13 +745,21 @@ class EligibilityService:
             limit: Items per page
             start_date: Filter by start date
             end_date: Filter by end date
+            fields: Optional HISTORY_COLUMNS names to select instead of
+                full entities
 
         Returns:
-            Tuple of (checks list, total count)
+            Tuple of (checks list, total count). With ``fields``, the list
+            holds rows exposing only the requested columns.
         """
-        query = self.db.query(EligibilityCheck).filter(
-            EligibilityCheck.organization_id == user.organization_id
-        )
+        if fields is None:
+            query = self.db.query(EligibilityCheck)
+        else:
+            query = self.db.query(
+                *(HISTORY_COLUMNS[name].label(name) for name in fields)
+            )
+
+        query = query.filter(EligibilityCheck.organization_id == user.organization_id)
 
         if start_date:
             query = query.filter(EligibilityCheck.created_at >= start_date)
@@ -215,8 +767,8 @@ class EligibilityService:
         if end_date:
             query = query.filter(EligibilityCheck.created_at <= end_date)
 
-        # Get total count
-        total = query.count()
+        # Get total count without selecting any row data
+        total = query.with_entities(func.count(EligibilityCheck.id)).scalar()
 
         # Apply pagination
         offset = (page - 1) * limit
@@ -252,6 +804,29 @@ class EligibilityService:
             .first()
         )
 
+    def cache_check_response(self, check: EligibilityCheck, body: bytes) -> None:
+        """Cache the encoded response body of a completed check record."""
+        # Only completed records are immutable
+        if not self.redis_client or check.status == EligibilityStatus.PENDING:
+            return
+
+        with timing.phase("cache"):
+            self.redis_client.setex(
+                self._get_response_cache_key(check.organization_id, check.id),
+                self.settings.ELIGIBILITY_RESPONSE_CACHE_TTL,
+                body,
+            )
+
+    def get_cached_check_response(self, user: User, check_id: UUID) -> Optional[bytes]:
+        """Get the cached response body of a check in the user's organization."""
+        if not self.redis_client:
+            return None
+
+        with timing.phase("cache"):
+            return self.redis_client.get(
+                self._get_response_cache_key(user.organization_id, check_id)
+            )
+
     def get_supported_insurers(self) -> list[str]:
         """Get list of supported insurance companies."""
         return self.provider.get_supported_insurers()
@@ -0,0 +1,215 @@
+"""Priority lanes for provider calls and check writes.
+
+Work is tagged with a lane:
+
+- ``interactive``: synchronous checks someone is waiting on
+- ``batch``: asynchronous checks (roster and batch runs)
+- ``background``: scheduled re-verification
+
+A ``PriorityScheduler`` guards a fixed number of slots. While slots are
+free, work starts immediately. Once they run out, waiters are served
+weighted-fair (stride scheduling over ``PRIORITY_WEIGHTS``), so by default
+interactive work gets 8 of every 11 freed slots when all lanes are busy.
+A lane that was idle rejoins at the current virtual time and gains no
+backlog of credit. A lane whose oldest waiter has waited longer than
+``PRIORITY_MAX_WAIT_MS`` without the lane getting any slot is served next,
+so bulk work slows down under interactive load but never stops.
+
+The lane is carried in a context variable, so code below the API layer
+(the service, the batcher) does not need it passed through.
+"""
+
+import asyncio
+import enum
+import json
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Iterator, Optional, TypeVar
+
+from app.config import get_settings
+
+T = TypeVar("T")
+
+
+class Lane(str, enum.Enum):
+    """Priority lane of a unit of work, highest first."""
+
+    INTERACTIVE = "interactive"
+    BATCH = "batch"
+    BACKGROUND = "background"
+
+
+current_lane: ContextVar[Lane] = ContextVar("current_lane", default=Lane.INTERACTIVE)
+
+
+@contextmanager
+def priority_lane(lane: Lane) -> Iterator[None]:
+    """Run the block, and tasks it creates, in ``lane``."""
+    token = current_lane.set(lane)
+    try:
+        yield
+    finally:
+        current_lane.reset(token)
+
+
+@dataclass
+class LaneStats:
+    """Queue counters of one lane since startup."""
+
+    queued: int = 0  # waiting now
+    started: int = 0
+    promoted: int = 0  # served ahead of its turn by the starvation guard
+    wait_total_s: float = 0.0
+    wait_max_s: float = 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "queued": self.queued,
+            "started": self.started,
+            "promoted": self.promoted,
+            "wait_avg_ms": round(self.wait_total_s / self.started * 1000, 1) if self.started else 0.0,
+            "wait_max_ms": round(self.wait_max_s * 1000, 1),
+        }
+
+
+class PriorityScheduler:
+    """Slots shared by all lanes, handed out weighted-fair when contended."""
+
+    def __init__(self, name: str, slots: int, weights: dict[Lane, int], max_wait_s: float):
+        self.name = name
+        self.slots = slots
+        self.weights = {lane: max(1, weights.get(lane, 1)) for lane in Lane}
+        self.max_wait_s = max_wait_s
+        self._free = slots
+        self._waiters: dict[Lane, deque[tuple[float, asyncio.Future]]] = {
+            lane: deque() for lane in Lane
+        }
+        # Stride scheduling: the lane with the lowest pass goes next
+        self._pass = dict.fromkeys(Lane, 0.0)
+        self._virtual_time = 0.0
+        self._served_at = dict.fromkeys(Lane, float("-inf"))
+        self.stats = {lane: LaneStats() for lane in Lane}
+
+    @asynccontextmanager
+    async def slot(self, lane: Optional[Lane] = None) -> AsyncIterator[None]:
+        """Hold a slot for the block, waiting in ``lane`` (default: current lane)."""
+        lane = lane or current_lane.get()
+        await self._acquire(lane)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def run(self, func: Callable[[], T], lane: Optional[Lane] = None) -> T:
+        """Run blocking ``func`` in a thread once a slot is free.
+
+        The slot is held until the thread returns, even if the caller is
+        cancelled first, because the thread cannot be stopped.
+        """
+        await self._acquire(lane or current_lane.get())
+        future = asyncio.ensure_future(asyncio.to_thread(func))
+        future.add_done_callback(self._release_after)
+        return await asyncio.shield(future)
+
+    def _release_after(self, future: asyncio.Future) -> None:
+        if not future.cancelled():
+            future.exception()  # the caller may be gone; do not warn it was never retrieved
+        self._release()
+
+    async def _acquire(self, lane: Lane) -> None:
+        stats = self.stats[lane]
+        if self._free > 0 and not any(self._waiters.values()):
+            self._free -= 1
+            stats.started += 1
+            return
+
+        waiters = self._waiters[lane]
+        if not waiters:
+            # An idle lane rejoins at the current virtual time, without saved-up credit
+            self._pass[lane] = max(self._pass[lane], self._virtual_time)
+        entry = (time.monotonic(), asyncio.get_running_loop().create_future())
+        waiters.append(entry)
+        stats.queued += 1
+        try:
+            await entry[1]
+        except asyncio.CancelledError:
+            if entry[1].done() and not entry[1].cancelled():
+                # Granted a slot just as the waiter was cancelled; give it back
+                self._release()
+            elif entry in waiters:
+                waiters.remove(entry)
+                stats.queued -= 1
+            raise
+
+        waited = time.monotonic() - entry[0]
+        stats.started += 1
+        stats.wait_total_s += waited
+        stats.wait_max_s = max(stats.wait_max_s, waited)
+
+    def _release(self) -> None:
+        self._free += 1
+        while self._free > 0:
+            lane = self._next_lane()
+            if lane is None:
+                return
+            _, future = self._waiters[lane].popleft()
+            self.stats[lane].queued -= 1
+            self._free -= 1
+            future.set_result(None)
+
+    def _drop_cancelled(self) -> None:
+        """Drop waiters cancelled before their task could remove them."""
+        for lane, waiters in self._waiters.items():
+            while waiters and waiters[0][1].done():
+                waiters.popleft()
+                self.stats[lane].queued -= 1
+
+    def _next_lane(self) -> Optional[Lane]:
+        """Pick the lane to serve next and charge it for the slot."""
+        self._drop_cancelled()
+        waiting = [lane for lane in Lane if self._waiters[lane]]
+        if not waiting:
+            return None
+
+        now = time.monotonic()
+        lane = min(waiting, key=lambda lane: self._pass[lane])
+
+        # A lane whose head has waited too long and that got no slot meanwhile goes first
+        starved = [
+            other
+            for other in waiting
+            if now - max(self._waiters[other][0][0], self._served_at[other]) > self.max_wait_s
+        ]
+        if starved and lane not in starved:
+            lane = min(starved, key=lambda other: self._waiters[other][0][0])
+            self.stats[lane].promoted += 1
+
+        self._served_at[lane] = now
+        self._virtual_time = self._pass[lane]
+        self._pass[lane] += 1 / self.weights[lane]
+        return lane
+
+    def metrics(self) -> dict:
+        """Slot use and per-lane queue counters."""
+        return {
+            "slots": self.slots,
+            "in_use": self.slots - self._free,
+            "lanes": {lane.value: stats.as_dict() for lane, stats in self.stats.items()},
+        }
+
+
+def _scheduler(name: str, slots: int) -> PriorityScheduler:
+    settings = get_settings()
+    return PriorityScheduler(
+        name,
+        slots,
+        weights={Lane(lane): weight for lane, weight in json.loads(settings.PRIORITY_WEIGHTS).items()},
+        max_wait_s=settings.PRIORITY_MAX_WAIT_MS / 1000,
+    )
+
+
+provider_scheduler = _scheduler("provider", get_settings().PRIORITY_PROVIDER_SLOTS)
+db_write_scheduler = _scheduler("db_write", get_settings().PRIORITY_DB_WRITE_SLOTS)
@@ -0,0 +1,314 @@
+"""Scheduled re-verification of recently seen members.
+
+Coverage typically changes at month boundaries. On the configured days,
+during an off-peak local window, the scheduler re-checks every member seen
+in the last REVERIFY_PANEL_DAYS and refreshes the eligibility cache, so
+daytime checks are cache hits. Calls are spread evenly across the window
+and paced per insurer to stay within payer rate limits.
+
+Organization admins can also start a run for their own organization's
+members. Runs hold a Redis key while in progress, so one organization
+never has two runs at once on any worker, and none starts during a
+scheduled run.
+"""
+
+import asyncio
+import os
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Optional
+from uuid import UUID
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import select
+
+from app.config import get_settings
+from app.core import logs
+from app.core.clock import Clock, get_clock
+from app.core.redis_pool import get_redis
+from app.database import SessionLocal
+from app.models.eligibility import EligibilityCheck
+from app.services.eligibility_service import EligibilityService
+from app.services.priority import Lane, priority_lane
+
+logger = logs.get_logger("reverification")
+
+
+@dataclass
+class PanelMember:
+    """A member to re-verify, with the identity from their latest check."""
+
+    insurance_company: str
+    member_id: str
+    patient_dob: date
+    patient_first_name: str
+    patient_last_name: str
+    group_number: Optional[str]
+
+
+@dataclass
+class ReverificationReport:
+    """Outcome of one re-verification run."""
+
+    started_at: datetime
+    finished_at: Optional[datetime] = None
+    organization_id: Optional[UUID] = None  # None for a scheduled run of every organization
+    panel_size: int = 0
+    refreshed: int = 0
+    failed: int = 0
+    skipped: int = 0  # not reached before the window closed
+    by_status: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+
+def load_panel(db, since: datetime, organization_id: Optional[UUID] = None) -> list[PanelMember]:
+    """Get distinct members checked since ``since``.
+
+    Covers every organization unless ``organization_id`` is given. The
+    cache is keyed by insurer, member and date of birth, so a member seen
+    by several clinics is only re-verified once.
+    """
+    statement = (
+        select(
+            EligibilityCheck.insurance_company,
+            EligibilityCheck.member_id,
+            EligibilityCheck.patient_dob,
+            EligibilityCheck.patient_first_name,
+            EligibilityCheck.patient_last_name,
+            EligibilityCheck.group_number,
+        )
+        .where(EligibilityCheck.created_at >= since)
+        .distinct(
+            EligibilityCheck.insurance_company,
+            EligibilityCheck.member_id,
+            EligibilityCheck.patient_dob,
+        )
+        .order_by(
+            EligibilityCheck.insurance_company,
+            EligibilityCheck.member_id,
+            EligibilityCheck.patient_dob,
+            EligibilityCheck.created_at.desc(),
+        )
+        .execution_options(yield_per=5000)
+    )
+    if organization_id is not None:
+        statement = statement.where(EligibilityCheck.organization_id == organization_id)
+    return [PanelMember(**row._asdict()) for row in db.execute(statement)]
+
+
+class ReverificationScheduler:
+    """Runs re-verification inside the off-peak window on scheduled days."""
+
+    LOCK_KEY = "reverify:lock:{day}"
+    # Held while a run is in progress: "all" for scheduled runs, else the organization
+    RUN_KEY = "reverify:running:{scope}"
+    # Runs that overshoot their deadline keep the key this much longer
+    RUN_KEY_GRACE_S = 300
+
+    def __init__(self, clock: Optional[Clock] = None):
+        self.settings = get_settings()
+        self.clock = clock or get_clock()
+        self.timezone = ZoneInfo(self.settings.REVERIFY_TIMEZONE)
+        self._task: Optional[asyncio.Task] = None
+        self.last_report: Optional[ReverificationReport] = None
+        # Last manual run per organization
+        self.organization_reports: dict[UUID, ReverificationReport] = {}
+
+    def _runs_on(self, day: date) -> bool:
+        days = self.settings.REVERIFY_DAYS_OF_MONTH.strip()
+        if days == "*":
+            return True
+        return day.day in {int(value) for value in days.split(",") if value.strip()}
+
+    def next_window(self, now: datetime) -> tuple[datetime, datetime]:
+        """Get the (start, end) of the next or current window, in naive UTC."""
+        local_now = now.replace(tzinfo=timezone.utc).astimezone(self.timezone)
+        for offset in range(0, 62):
+            day = local_now.date() + timedelta(days=offset)
+            if not self._runs_on(day):
+                continue
+            start = datetime.combine(
+                day, time(hour=self.settings.REVERIFY_WINDOW_START_HOUR), tzinfo=self.timezone
+            )
+            end = start + timedelta(hours=self.settings.REVERIFY_WINDOW_HOURS)
+            if end > local_now:
+                to_utc = lambda value: value.astimezone(timezone.utc).replace(tzinfo=None)
+                return to_utc(max(start, local_now)), to_utc(end)
+        raise ValueError("REVERIFY_DAYS_OF_MONTH matches no day in the next two months")
+
+    def _acquire_leadership(self, window_start: datetime) -> bool:
+        """Let exactly one worker run each window, via a Redis lock."""
+        redis_client = get_redis()
+        if not redis_client:
+            # No cache to warm without Redis
+            return False
+        return bool(
+            redis_client.set(
+                self.LOCK_KEY.format(day=window_start.date().isoformat()),
+                os.getpid(),
+                nx=True,
+                ex=self.settings.REVERIFY_WINDOW_HOURS * 3600,
+            )
+        )
+
+    def _claim_run(self, scope: str, deadline: datetime) -> bool:
+        """Mark a run for ``scope`` in progress unless one already is."""
+        redis_client = get_redis()
+        if not redis_client:
+            return False
+        ttl = int((deadline - self.clock.now()).total_seconds()) + self.RUN_KEY_GRACE_S
+        return bool(
+            redis_client.set(self.RUN_KEY.format(scope=scope), os.getpid(), nx=True, ex=max(ttl, 1))
+        )
+
+    def _release_run(self, scope: str) -> None:
+        redis_client = get_redis()
+        if redis_client:
+            redis_client.delete(self.RUN_KEY.format(scope=scope))
+
+    def start_organization_run(
+        self, organization_id: UUID, deadline: datetime
+    ) -> Optional[asyncio.Task]:
+        """Re-verify one organization's members in the background.
+
+        Returns:
+            The run, or None if a scheduled run or another run for the
+            organization is in progress on any worker, or Redis is down
+        """
+        redis_client = get_redis()
+        if not redis_client or redis_client.exists(self.RUN_KEY.format(scope="all")):
+            return None
+        scope = str(organization_id)
+        if not self._claim_run(scope, deadline):
+            return None
+
+        async def run() -> ReverificationReport:
+            try:
+                return await self.run_once(deadline, organization_id=organization_id)
+            finally:
+                self._release_run(scope)
+
+        return asyncio.create_task(run())
+
+    async def run_once(
+        self, deadline: datetime, organization_id: Optional[UUID] = None
+    ) -> ReverificationReport:
+        """Re-verify the panel, stopping when ``deadline`` (naive UTC) passes.
+
+        Args:
+            deadline: When to stop starting checks
+            organization_id: Only re-verify this organization's members
+        """
+        report = ReverificationReport(started_at=self.clock.now(), organization_id=organization_id)
+        db = SessionLocal()
+        try:
+            service = EligibilityService(db)
+            since = self.clock.now() - timedelta(days=self.settings.REVERIFY_PANEL_DAYS)
+            panel = await asyncio.to_thread(load_panel, db, since, organization_id)
+            report.panel_size = len(panel)
+
+            by_insurer: dict[str, list[PanelMember]] = defaultdict(list)
+            for member in panel:
+                by_insurer[member.insurance_company].append(member)
+
+            # Yields to interactive and batch checks for provider slots
+            with priority_lane(Lane.BACKGROUND):
+                await asyncio.gather(
+                    *(
+                        self._run_insurer(service, members, deadline, report)
+                        for members in by_insurer.values()
+                    )
+                )
+        finally:
+            db.close()
+
+        report.finished_at = self.clock.now()
+        if organization_id is None:
+            self.last_report = report
+        else:
+            self.organization_reports[organization_id] = report
+        return report
+
+    async def _run_insurer(
+        self,
+        service: EligibilityService,
+        members: list[PanelMember],
+        deadline: datetime,
+        report: ReverificationReport,
+    ) -> None:
+        """Re-verify one insurer's members, spread evenly until the deadline."""
+        remaining = (deadline - self.clock.now()).total_seconds()
+        min_interval = 1 / self.settings.REVERIFY_MAX_RPS_PER_INSURER
+        interval = max(min_interval, remaining / len(members)) if remaining > 0 else min_interval
+        concurrency = asyncio.Semaphore(self.settings.REVERIFY_MAX_CONCURRENCY_PER_INSURER)
+        tasks = []
+
+        async def refresh(member: PanelMember) -> None:
+            async with concurrency:
+                try:
+                    result = await service.refresh_cached_result(
+                        patient_first_name=member.patient_first_name,
+                        patient_last_name=member.patient_last_name,
+                        patient_dob=member.patient_dob,
+                        insurance_company=member.insurance_company,
+                        member_id=member.member_id,
+                        group_number=member.group_number,
+                        ttl=self.settings.REVERIFY_CACHE_TTL,
+                    )
+                except Exception:
+                    report.failed += 1
+                    return
+                report.refreshed += 1
+                report.by_status[result.status] += 1
+
+        for index, member in enumerate(members):
+            if self.clock.now() >= deadline:
+                report.skipped += len(members) - index
+                break
+            tasks.append(asyncio.create_task(refresh(member)))
+            await self.clock.sleep(interval)
+
+        await asyncio.gather(*tasks)
+
+    async def run_forever(self) -> None:
+        """Wait for each window and run when this worker wins the lock."""
+        while True:
+            start, end = self.next_window(self.clock.now())
+            wait = (start - self.clock.now()).total_seconds()
+            if wait > 0:
+                await self.clock.sleep(wait)
+
+            try:
+                if self._acquire_leadership(start):
+                    # Not exclusive: the leader runs even if an organization's run is in progress
+                    self._claim_run("all", end)
+                    try:
+                        await self.run_once(deadline=end)
+                    finally:
+                        self._release_run("all")
+            except Exception:
+                # A database or Redis outage skips this window, not every later one
+                logger.exception("Re-verification window starting %s failed", start.isoformat())
+
+            # Move past this window before computing the next one
+            remaining = (end - self.clock.now()).total_seconds()
+            if remaining > 0:
+                await self.clock.sleep(remaining)
+
+    def start(self) -> None:
+        """Start the scheduler loop in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self.run_forever())
+
+    async def stop(self) -> None:
+        """Cancel the scheduler loop."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+reverification_scheduler = ReverificationScheduler()
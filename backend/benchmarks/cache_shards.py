@@ -0,0 +1,120 @@
+"""Measure how evenly the cache ring spreads keys and how many move on resize.
+
+Hashes ``--keys`` synthetic eligibility cache keys onto ``--nodes`` nodes,
+then reports each node's share and the fraction of keys that change node
+when one node is added or removed (ideally 1/(N+1) and 1/N). With
+``--urls``, the keys are also written through ``ShardedRedis`` and read
+back, and each node's key count is taken from Redis itself:
+
+    python -m benchmarks.cache_shards
+    python -m benchmarks.cache_shards --nodes 3 --vnodes 40 --json
+    python -m benchmarks.cache_shards --urls '["redis://localhost:6380/0",
+        "redis://localhost:6381/0", "redis://localhost:6382/0"]'
+"""
+
+import argparse
+import json
+import statistics
+import time
+from datetime import date, timedelta
+
+from app.core.redis_shards import HashRing, ShardedRedis
+from app.insurance.mock_data import INSURANCE_COMPANIES
+
+
+def cache_keys(count: int) -> list[str]:
+    return [
+        f"eligibility:{INSURANCE_COMPANIES[i % len(INSURANCE_COMPANIES)]}:KZ{i:09d}:"
+        f"{(date(1950, 1, 1) + timedelta(days=i * 97 % 25000)).isoformat()}"
+        for i in range(count)
+    ]
+
+
+def moved(keys: list[str], before: HashRing, after: HashRing) -> float:
+    """Fraction of ``keys`` owned by a different node in ``after``."""
+    return sum(before.node_for(key) != after.node_for(key) for key in keys) / len(keys)
+
+
+def ring_stats(keys: list[str], nodes: int, vnodes: int) -> dict:
+    names = [f"node{index}" for index in range(nodes)]
+    ring = HashRing(names, vnodes)
+    counts = dict.fromkeys(names, 0)
+    for key in keys:
+        counts[ring.node_for(key)] += 1
+    mean = len(keys) / nodes
+
+    return {
+        "nodes": nodes,
+        "vnodes": vnodes,
+        "keys": len(keys),
+        "max_over_mean": round(max(counts.values()) / mean, 3),
+        "stdev_over_mean": round(statistics.pstdev(counts.values()) / mean, 3),
+        "moved_on_add": round(moved(keys, ring, HashRing(names + [f"node{nodes}"], vnodes)), 4),
+        "ideal_on_add": round(1 / (nodes + 1), 4),
+        "moved_on_remove": round(moved(keys, ring, HashRing(names[1:], vnodes)), 4),
+        "ideal_on_remove": round(1 / nodes, 4),
+    }
+
+
+def live_stats(keys: list[str], urls: list[str], vnodes: int) -> dict:
+    sharded = ShardedRedis(urls, vnodes=vnodes)
+    pipe = sharded.pipeline()
+    for key in keys:
+        pipe.setex(key, 300, b"{}")
+    started = time.perf_counter()
+    pipe.execute()
+    write_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    hits = sum(value is not None for value in sharded.mget(*keys))
+    read_s = time.perf_counter() - started
+
+    return {
+        "hits": hits,
+        "write_keys_per_s": round(len(keys) / write_s),
+        "mget_keys_per_s": round(len(keys) / read_s),
+        "nodes": [
+            {
+                **node,
+                "dbsize": sharded.shards[node["name"]].client.dbsize() if node["healthy"] else None,
+            }
+            for node in sharded.status()
+        ],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--keys", type=int, default=100000)
+    parser.add_argument("--nodes", type=int, default=4)
+    parser.add_argument("--vnodes", type=int, default=160)
+    parser.add_argument("--urls", help="JSON list of Redis URLs to write the keys to")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    keys = cache_keys(args.keys)
+    results = {"ring": ring_stats(keys, args.nodes, args.vnodes)}
+    if args.urls:
+        results["live"] = live_stats(keys, json.loads(args.urls), args.vnodes)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    ring = results["ring"]
+    print(f"{ring['keys']:,} keys, {ring['nodes']} nodes, {ring['vnodes']} virtual nodes each\n")
+    print(f"largest node      {ring['max_over_mean']:.3f} x mean")
+    print(f"stdev             {ring['stdev_over_mean']:.3f} x mean")
+    print(f"moved on add      {ring['moved_on_add']:.2%} (ideal {ring['ideal_on_add']:.2%})")
+    print(f"moved on remove   {ring['moved_on_remove']:.2%} (ideal {ring['ideal_on_remove']:.2%})")
+    if "live" in results:
+        live = results["live"]
+        print(f"\nlive: {live['hits']:,} hits, {live['write_keys_per_s']:,} writes/s, "
+              f"{live['mget_keys_per_s']:,} reads/s")
+        for node in live["nodes"]:
+            state = "up" if node["healthy"] else "down"
+            print(f"  {node['name']:<24} {state:<5} share {node['share']:.2%}  keys {node['dbsize']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""Measure compression CPU cost against bytes saved for history payloads.
+
+Builds realistic ``/history`` pages from mock provider results and
+compresses them at several gzip levels and brotli qualities:
+
+    python -m benchmarks.compression
+    python -m benchmarks.compression --items 50 --json
+"""
+
+import argparse
+import json
+import time
+import uuid
+import zlib
+from datetime import date, datetime, timedelta
+
+from app.core import serialization
+from app.insurance.mock_data import FIRST_NAMES, INSURANCE_COMPANIES, LAST_NAMES
+from app.insurance.mock_provider import MockInsuranceProvider
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+class _Check:
+    """Attribute bag shaped like an EligibilityCheck row."""
+
+    def __init__(self, **fields):
+        self.__dict__.update(fields)
+
+
+def history_page(items: int) -> bytes:
+    """Encode a history page of ``items`` checks as the API would."""
+    provider = MockInsuranceProvider()
+    now = datetime.utcnow()
+    checks = []
+    for i in range(items):
+        first_name = FIRST_NAMES[i % len(FIRST_NAMES)]
+        last_name = LAST_NAMES[(i * 7) % len(LAST_NAMES)]
+        insurer = INSURANCE_COMPANIES[(i * 3) % len(INSURANCE_COMPANIES)]
+        member_id = f"KZ{i:09d}"
+        result = provider.generate_result(first_name, last_name, insurer, member_id, 900 + i)
+        checks.append(
+            _Check(
+                id=uuid.uuid4(),
+                patient_first_name=first_name,
+                patient_last_name=last_name,
+                patient_dob=date(1950, 1, 1) + timedelta(days=i * 97),
+                insurance_company=insurer,
+                member_id=member_id,
+                group_number=None,
+                response_data={
+                    "status": result.status,
+                    "coverage": result.coverage,
+                    "subscriber": result.subscriber,
+                },
+                error_message=result.error_message,
+                response_time_ms=result.response_time_ms,
+                created_at=now - timedelta(minutes=i),
+            )
+        )
+
+    return serialization.dumps(
+        {
+            "data": [serialization.history_item_content(check) for check in checks],
+            "pagination": {"page": 1, "limit": items, "total": items, "pages": 1},
+        }
+    )
+
+
+def measure(compress, body: bytes, min_time: float = 0.3) -> tuple[int, float]:
+    """Return (compressed size, microseconds per call)."""
+    size = len(compress(body))
+    loops = 0
+    started = time.perf_counter()
+    while time.perf_counter() - started < min_time:
+        compress(body)
+        loops += 1
+    return size, (time.perf_counter() - started) / loops * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    body = history_page(args.items)
+    codecs = {
+        f"gzip-{level}": (lambda data, level=level: zlib.compress(data, level, wbits=31))
+        for level in (1, 4, 6, 9)
+    }
+    if brotli is not None:
+        codecs.update(
+            {
+                f"br-{quality}": (lambda data, quality=quality: brotli.compress(data, quality=quality))
+                for quality in (1, 4, 6, 9, 11)
+            }
+        )
+
+    results = []
+    for name, compress in codecs.items():
+        size, micros = measure(compress, body)
+        results.append(
+            {
+                "codec": name,
+                "bytes": size,
+                "ratio": round(len(body) / size, 2),
+                "saved_pct": round((1 - size / len(body)) * 100, 1),
+                "cpu_us": round(micros, 1),
+                "mb_per_s": round(len(body) / micros, 1),
+            }
+        )
+
+    if args.json:
+        print(json.dumps({"items": args.items, "raw_bytes": len(body), "results": results}, indent=2))
+        return
+
+    print(f"History page: {args.items} items, {len(body):,} bytes uncompressed\n")
+    print(f"{'codec':<8} {'bytes':>9} {'ratio':>6} {'saved':>7} {'CPU µs':>9} {'MB/s':>7}")
+    for row in results:
+        print(
+            f"{row['codec']:<8} {row['bytes']:>9,} {row['ratio']:>6} "
+            f"{row['saved_pct']:>6}% {row['cpu_us']:>9,.1f} {row['mb_per_s']:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
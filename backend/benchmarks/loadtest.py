@@ -0,0 +1,406 @@
+"""Load-test harness for the eligibility API.
+
+Starts the API against the mock provider (or targets a running server),
+drives a weighted mix of requests and prints a JSON report. Run from the
+backend directory with PostgreSQL and Redis available:
+
+    python -m benchmarks.loadtest --duration 30 --concurrency 20
+    python -m benchmarks.loadtest --rps 200 --mix check=6,history=2,detail=1,login=1
+    python -m benchmarks.loadtest --output baseline.json
+    python -m benchmarks.loadtest --baseline baseline.json --tolerance 0.10
+
+The started server runs without per-organization rate limits unless
+``--rate-limit`` is given. Rate-limited (429) and shed (503) responses are
+counted apart from errors.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Optional
+
+import httpx
+
+from app.insurance.mock_data import INSURANCE_COMPANIES
+
+DEFAULT_MIX = "check=6,history=2,detail=1,login=1"
+OPERATIONS = ("check", "history", "detail", "login")
+
+DEMO_EMAIL = "staff@carelink.demo"
+DEMO_PASSWORD = "CareLink2024!"
+
+
+@dataclass
+class OpStats:
+    """Latency samples and error counts for one operation."""
+
+    latencies_ms: list[float] = field(default_factory=list)
+    errors: int = 0
+    rate_limited: int = 0  # 429 from the per-organization limiter
+    shed: int = 0  # 503 from admission control
+
+    def record(self, latency_ms: float, status_code: Optional[int]) -> None:
+        """Add a sample; ``status_code`` is None when the request failed in transport."""
+        self.latencies_ms.append(latency_ms)
+        if status_code == 429:
+            self.rate_limited += 1
+        elif status_code == 503:
+            self.shed += 1
+        elif status_code is None or status_code >= 400:
+            self.errors += 1
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(stats: OpStats, elapsed_s: float) -> dict:
+    """Build the JSON summary for a set of samples."""
+    values = sorted(stats.latencies_ms)
+    count = len(values)
+    return {
+        "requests": count,
+        "errors": stats.errors,
+        "error_rate": round(stats.errors / count, 4) if count else 0.0,
+        "rate_limited": stats.rate_limited,
+        "shed": stats.shed,
+        "throughput_rps": round(count / elapsed_s, 2) if elapsed_s else 0.0,
+        "p50_ms": round(percentile(values, 50), 2),
+        "p95_ms": round(percentile(values, 95), 2),
+        "p99_ms": round(percentile(values, 99), 2),
+        "max_ms": round(values[-1], 2) if values else 0.0,
+    }
+
+
+def parse_mix(mix: str) -> dict[str, float]:
+    """Parse ``op=weight,op=weight`` into a weight mapping."""
+    weights = {}
+    for part in mix.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise argparse.ArgumentTypeError(f"Unknown operation: {name}")
+        weights[name] = float(weight or 1)
+    return weights
+
+
+class LoadGenerator:
+    """Issues a weighted, reproducible mix of API requests."""
+
+    def __init__(self, client: httpx.AsyncClient, args: argparse.Namespace):
+        self.client = client
+        self.args = args
+        self.rng = random.Random(args.random_seed)
+        self.weights = parse_mix(args.mix)
+        self.stats: dict[str, OpStats] = {op: OpStats() for op in self.weights}
+        self.check_ids: deque[str] = deque(maxlen=1000)
+        self.token: Optional[str] = None
+        self.recording = False
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {"Authorization": f"Bearer {self.token}"}
+
+    async def login(self) -> httpx.Response:
+        return await self.client.post(
+            "/api/auth/login",
+            json={"email": self.args.email, "password": self.args.password},
+        )
+
+    def _check_payload(self) -> dict:
+        # A bounded member pool gives a realistic cache hit ratio
+        member = self.rng.randrange(self.args.members)
+        return {
+            "patient_first_name": "Load",
+            "patient_last_name": f"Test{member}",
+            "patient_dob": (date(1960, 1, 1) + timedelta(days=member % 15000)).isoformat(),
+            "insurance_company": INSURANCE_COMPANIES[member % len(INSURANCE_COMPANIES)],
+            "member_id": f"LT{member:08d}",
+        }
+
+    def choose_operation(self) -> str:
+        ops = list(self.weights)
+        return self.rng.choices(ops, weights=[self.weights[op] for op in ops])[0]
+
+    async def run_operation(self, op: str) -> int:
+        """Issue one request and return its status code."""
+        if op == "detail" and not self.check_ids:
+            op = "check"
+
+        if op == "check":
+            response = await self.client.post(
+                "/api/eligibility/check", json=self._check_payload(), headers=self.headers
+            )
+            if response.status_code == 200:
+                self.check_ids.append(response.json()["id"])
+        elif op == "history":
+            response = await self.client.get(
+                "/api/eligibility/history",
+                params={"limit": self.args.history_limit},
+                headers=self.headers,
+            )
+        elif op == "detail":
+            check_id = self.rng.choice(self.check_ids)
+            response = await self.client.get(
+                f"/api/eligibility/{check_id}", headers=self.headers
+            )
+        else:
+            response = await self.login()
+
+        return response.status_code
+
+    async def timed(self, op: str, started: float) -> None:
+        """Run one operation and record latency measured from ``started``."""
+        try:
+            status_code = await self.run_operation(op)
+        except httpx.HTTPError:
+            status_code = None
+        if self.recording:
+            self.stats[op].record((time.perf_counter() - started) * 1000, status_code)
+
+    async def closed_loop(self, deadline: float) -> None:
+        """Keep a fixed number of requests in flight until the deadline."""
+
+        async def worker() -> None:
+            while time.perf_counter() < deadline:
+                await self.timed(self.choose_operation(), time.perf_counter())
+
+        await asyncio.gather(*(worker() for _ in range(self.args.concurrency)))
+
+    async def open_loop(self, deadline: float) -> None:
+        """Issue requests at a fixed arrival rate until the deadline.
+
+        Latency is measured from each request's scheduled start, so a
+        stalled server shows up in the percentiles instead of silently
+        lowering the offered load.
+        """
+        interval = 1 / self.args.rps
+        inflight = asyncio.Semaphore(self.args.max_inflight)
+        tasks = set()
+        next_start = time.perf_counter()
+
+        async def fire(op: str, scheduled: float) -> None:
+            async with inflight:
+                await self.timed(op, scheduled)
+
+        while next_start < deadline:
+            delay = next_start - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            task = asyncio.create_task(fire(self.choose_operation(), next_start))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            next_start += interval
+
+        if tasks:
+            await asyncio.gather(*tasks)
+
+    async def run(self) -> dict:
+        response = await self.login()
+        response.raise_for_status()
+        self.token = response.json()["token"]
+
+        runner = self.open_loop if self.args.rps else self.closed_loop
+
+        if self.args.warmup > 0:
+            await runner(time.perf_counter() + self.args.warmup)
+
+        self.recording = True
+        started = time.perf_counter()
+        await runner(started + self.args.duration)
+        elapsed = time.perf_counter() - started
+
+        overall = OpStats()
+        for stats in self.stats.values():
+            overall.latencies_ms.extend(stats.latencies_ms)
+            overall.errors += stats.errors
+            overall.rate_limited += stats.rate_limited
+            overall.shed += stats.shed
+
+        return {
+            "config": {
+                "mode": "rps" if self.args.rps else "concurrency",
+                "rps": self.args.rps,
+                "concurrency": self.args.concurrency,
+                "duration_s": self.args.duration,
+                "mix": self.weights,
+                "members": self.args.members,
+                "mock_delay_ms": [self.args.min_delay_ms, self.args.max_delay_ms],
+                "mock_profile": self.args.mock_profile,
+                "random_seed": self.args.random_seed,
+                # Unknown for a server the harness did not start
+                "rate_limit": None if self.args.url else self.args.rate_limit,
+            },
+            "elapsed_s": round(elapsed, 3),
+            "overall": summarize(overall, elapsed),
+            "operations": {
+                op: summarize(stats, elapsed) for op, stats in self.stats.items()
+            },
+        }
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list[dict]:
+    """Flag metrics that regressed beyond ``tolerance`` relative to a baseline."""
+    regressions = []
+    sections = {"overall": (report["overall"], baseline.get("overall", {}))}
+    for op, current in report["operations"].items():
+        if op in baseline.get("operations", {}):
+            sections[op] = (current, baseline["operations"][op])
+
+    for name, (current, base) in sections.items():
+        if not base:
+            continue
+        for metric in ("p50_ms", "p95_ms", "p99_ms"):
+            if base[metric] and current[metric] > base[metric] * (1 + tolerance):
+                regressions.append(
+                    {"scope": name, "metric": metric, "baseline": base[metric], "current": current[metric]}
+                )
+        if base["throughput_rps"] and current["throughput_rps"] < base["throughput_rps"] * (1 - tolerance):
+            regressions.append(
+                {
+                    "scope": name,
+                    "metric": "throughput_rps",
+                    "baseline": base["throughput_rps"],
+                    "current": current["throughput_rps"],
+                }
+            )
+        # Error rates are compared in absolute terms since baselines are often 0
+        if current["error_rate"] > base["error_rate"] + 0.01:
+            regressions.append(
+                {
+                    "scope": name,
+                    "metric": "error_rate",
+                    "baseline": base["error_rate"],
+                    "current": current["error_rate"],
+                }
+            )
+    return regressions
+
+
+def start_server(args: argparse.Namespace) -> subprocess.Popen:
+    """Launch uvicorn with the mock provider and wait until it is healthy."""
+    env = {
+        **os.environ,
+        "INSURANCE_PROVIDER": "mock",
+        "MOCK_API_MIN_DELAY_MS": str(args.min_delay_ms),
+        "MOCK_API_MAX_DELAY_MS": str(args.max_delay_ms),
+        "DEBUG": "false",
+        # The demo organization's limit (600/min) would otherwise cap the run at 10 rps
+        "RATE_LIMIT_ENABLED": "true" if args.rate_limit else "false",
+    }
+    if args.mock_profile:
+        env["MOCK_PROFILE_PATH"] = args.mock_profile
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "app.main:app",
+            "--host", "127.0.0.1",
+            "--port", str(args.port),
+            "--workers", str(args.workers),
+            "--log-level", "warning",
+        ],
+        env=env,
+        stdout=sys.stderr,  # its logs would otherwise interleave with the report
+    )
+
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("API server exited during startup")
+        try:
+            if httpx.get(f"http://127.0.0.1:{args.port}/health").status_code == 200:
+                return process
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+
+    process.terminate()
+    raise RuntimeError("API server did not become healthy within 30s")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="Target a running server instead of starting one")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--min-delay-ms", type=int, default=0)
+    parser.add_argument("--max-delay-ms", type=int, default=0)
+    parser.add_argument("--mock-profile", help="Mock latency/fault profile JSON file")
+    parser.add_argument(
+        "--rate-limit", action="store_true", help="Keep per-organization rate limits on the started server"
+    )
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"Weighted mix (default: {DEFAULT_MIX})")
+    parser.add_argument("--rps", type=float, help="Open-loop target request rate")
+    parser.add_argument("--concurrency", type=int, default=10, help="Closed-loop workers")
+    parser.add_argument("--max-inflight", type=int, default=1000)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--warmup", type=float, default=5.0)
+    parser.add_argument("--members", type=int, default=1000, help="Distinct members to check")
+    parser.add_argument("--history-limit", type=int, default=50)
+    parser.add_argument("--random-seed", type=int, default=42)
+    parser.add_argument("--email", default=DEMO_EMAIL)
+    parser.add_argument("--password", default=DEMO_PASSWORD)
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument("--baseline", help="Compare against a saved JSON report")
+    parser.add_argument("--tolerance", type=float, default=0.10)
+    return parser
+
+
+async def run(args: argparse.Namespace, base_url: str) -> dict:
+    limits = httpx.Limits(max_connections=max(args.concurrency, args.max_inflight))
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        return await LoadGenerator(client, args).run()
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+
+    process = None
+    if args.url:
+        base_url = args.url
+    else:
+        from app.seed import seed_database
+
+        # Keep stdout for the JSON report
+        with contextlib.redirect_stdout(sys.stderr):
+            seed_database()
+        process = start_server(args)
+        base_url = f"http://127.0.0.1:{args.port}"
+
+    try:
+        report = asyncio.run(run(args, base_url))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        report["regressions"] = compare(report, baseline, args.tolerance)
+        exit_code = 1 if report["regressions"] else 0
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    print(output)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,393 @@
+"""Microbenchmarks for per-request CPU work on the hot path.
+
+Each benchmark is timed with an auto-ranged inner loop and repeated; the
+runner reports the best and median ns per operation, peak bytes allocated
+by a single call and blocks retained per call. Results are appended to a
+JSON Lines file so runs can be compared over time:
+
+    python -m benchmarks.microbench
+    python -m benchmarks.microbench --filter jwt --repeat 10
+    python -m benchmarks.microbench --output /tmp/micro.jsonl
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import date, datetime
+from pathlib import Path
+from typing import Callable, Optional
+
+from app.core import serialization
+from app.core.security import create_access_token, decode_token
+from app.insurance.mock_provider import MockInsuranceProvider
+from app.schemas.eligibility import (
+    CoverageInfo,
+    EligibilityCheckResponse,
+    EligibilityHistoryItem,
+    EligibilityHistoryResponse,
+    PaginationInfo,
+    SubscriberInfo,
+)
+from app.services.eligibility_service import EligibilityService
+
+DEFAULT_OUTPUT = Path(__file__).parent / "results" / "microbench.jsonl"
+
+BENCHMARKS: dict[str, Callable[[], Callable[[], object]]] = {}
+BENCHMARK_CLEANUP: list[Callable[[], object]] = []
+
+
+def benchmark(name: str):
+    """Register a benchmark factory that returns the callable to time."""
+
+    def decorator(factory: Callable[[], Callable[[], object]]):
+        BENCHMARKS[name] = factory
+        return factory
+
+    return decorator
+
+
+def _sample_response_data() -> dict:
+    provider = MockInsuranceProvider()
+    seed = provider._get_deterministic_seed("KZ123456789", "Евразия")
+    return {
+        "status": "active",
+        "coverage": provider._generate_coverage_data(seed, "Евразия"),
+        "subscriber": provider._generate_subscriber_data(
+            seed, "KZ123456789", "Айбек", "Ахметов"
+        ),
+    }
+
+
+@benchmark("mock.deterministic_seed")
+def bench_deterministic_seed():
+    provider = MockInsuranceProvider()
+    return lambda: provider._get_deterministic_seed("KZ123456789", "Евразия")
+
+
+@benchmark("mock.generate_coverage_data")
+def bench_generate_coverage():
+    provider = MockInsuranceProvider()
+    seed = provider._get_deterministic_seed("KZ123456789", "Евразия")
+    return lambda: provider._generate_coverage_data(seed, "Евразия")
+
+
+@benchmark("cache.serialize")
+def bench_cache_serialize():
+    payload = _sample_response_data()
+    return lambda: EligibilityService._serialize_result(payload)
+
+
+@benchmark("cache.deserialize")
+def bench_cache_deserialize():
+    cached = EligibilityService._serialize_result(_sample_response_data())
+    return lambda: EligibilityService._deserialize_result(cached)
+
+
+@benchmark("schema.check_response")
+def bench_check_response():
+    payload = _sample_response_data()
+    check_id = uuid.uuid4()
+    created_at = datetime.utcnow()
+
+    def build():
+        return EligibilityCheckResponse(
+            id=check_id,
+            status=payload["status"],
+            coverage=CoverageInfo(**payload["coverage"]),
+            subscriber=SubscriberInfo(**payload["subscriber"]),
+            error_message=None,
+            response_time_ms=1200,
+            created_at=created_at,
+        )
+
+    return build
+
+
+@benchmark("schema.history_item")
+def bench_history_item():
+    payload = _sample_response_data()
+    check_id = uuid.uuid4()
+    created_at = datetime.utcnow()
+
+    def build():
+        return EligibilityHistoryItem(
+            id=check_id,
+            patient_first_name="Айбек",
+            patient_last_name="Ахметов",
+            patient_dob=date(1985, 3, 14),
+            insurance_company="Евразия",
+            member_id="KZ123456789",
+            group_number=None,
+            status=payload["status"],
+            response_data=payload,
+            error_message=None,
+            response_time_ms=1200,
+            created_at=created_at,
+        )
+
+    return build
+
+
+def _sample_check():
+    from types import SimpleNamespace
+
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        patient_first_name="Айбек",
+        patient_last_name="Ахметов",
+        patient_dob=date(1985, 3, 14),
+        insurance_company="Евразия",
+        member_id="KZ123456789",
+        group_number=None,
+        response_data=_sample_response_data(),
+        error_message=None,
+        response_time_ms=1200,
+        created_at=datetime.utcnow(),
+    )
+
+
+@benchmark("serialize.check_response_orjson")
+def bench_check_response_orjson():
+    check = _sample_check()
+    return lambda: serialization.dumps(serialization.check_response_content(check))
+
+
+@benchmark("serialize.history_page_orjson")
+def bench_history_page_orjson():
+    checks = [_sample_check() for _ in range(100)]
+    return lambda: serialization.dumps(
+        [serialization.history_item_content(check) for check in checks]
+    )
+
+
+@benchmark("serialize.history_page_pydantic")
+def bench_history_page_pydantic():
+    checks = [_sample_check() for _ in range(100)]
+    return lambda: EligibilityHistoryResponse(
+        data=[EligibilityHistoryItem(**serialization.history_item_content(c)) for c in checks],
+        pagination=PaginationInfo(page=1, limit=100, total=100, pages=1),
+    ).model_dump_json()
+
+
+@benchmark("jwt.create_access_token")
+def bench_create_token():
+    user_id = str(uuid.uuid4())
+    return lambda: create_access_token(data={"sub": user_id})
+
+
+@benchmark("jwt.decode_token")
+def bench_decode_token():
+    token = create_access_token(data={"sub": str(uuid.uuid4())})
+    return lambda: decode_token(token)
+
+
+@benchmark("orm.hydrate_history_page")
+def bench_orm_hydration():
+    """Load and hydrate a 50-row history page from the configured database.
+
+    Rows are inserted inside a transaction that is rolled back afterwards.
+    Returns None (skipped) when the database is unreachable or its schema
+    is missing.
+    """
+    from sqlalchemy import select
+    from sqlalchemy.exc import DBAPIError
+    from sqlalchemy.orm import Session
+
+    from app.database import engine
+    from app.models.eligibility import EligibilityCheck, EligibilityStatus
+    from app.models.organization import Organization
+    from app.models.user import User
+
+    try:
+        connection = engine.connect()
+    except DBAPIError:
+        return None
+
+    transaction = connection.begin()
+    session = Session(bind=connection)
+    try:
+        org = Organization(name="Microbench Clinic")
+        session.add(org)
+        session.flush()
+        user = User(
+            email=f"bench-{uuid.uuid4().hex}@carelink.demo",
+            password_hash="x",
+            full_name="Bench User",
+            organization_id=org.id,
+        )
+        session.add(user)
+        session.flush()
+
+        payload = _sample_response_data()
+        session.add_all(
+            EligibilityCheck(
+                user_id=user.id,
+                organization_id=org.id,
+                patient_first_name="Айбек",
+                patient_last_name="Ахметов",
+                patient_dob=date(1985, 3, 14),
+                insurance_company="Евразия",
+                member_id=f"KZ{i:09d}",
+                status=EligibilityStatus.SUCCESS,
+                response_data=payload,
+                response_time_ms=1200,
+            )
+            for i in range(50)
+        )
+        session.flush()
+    except DBAPIError:
+        # Reachable but not migrated (missing tables or columns); closing rolls back
+        session.close()
+        connection.close()
+        return None
+
+    statement = select(EligibilityCheck).where(EligibilityCheck.organization_id == org.id)
+    BENCHMARK_CLEANUP.append(lambda: (session.close(), transaction.rollback(), connection.close()))
+
+    def hydrate():
+        session.expunge_all()
+        return session.execute(statement).scalars().all()
+
+    return hydrate
+
+
+def autorange(func: Callable[[], object], min_time: float = 0.2) -> int:
+    """Find a loop count whose total runtime is at least ``min_time``."""
+    loops = 1
+    while True:
+        start = time.perf_counter_ns()
+        for _ in range(loops):
+            func()
+        if (time.perf_counter_ns() - start) / 1e9 >= min_time:
+            return loops
+        loops *= 2
+
+
+def measure(func: Callable[[], object], repeat: int, min_time: float) -> dict:
+    """Time ``func`` and measure its allocation behaviour."""
+    func()  # warm caches and lazy imports
+    loops = autorange(func, min_time)
+
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter_ns()
+            for _ in range(loops):
+                func()
+            timings.append((time.perf_counter_ns() - start) / loops)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    retained_loops = min(loops, 1000)
+    gc.collect()
+    blocks_before = sys.getallocatedblocks()
+    for _ in range(retained_loops):
+        func()
+    gc.collect()
+    blocks_after = sys.getallocatedblocks()
+
+    return {
+        "loops": loops,
+        "best_ns": round(min(timings), 1),
+        "median_ns": round(statistics.median(timings), 1),
+        "stdev_ns": round(statistics.stdev(timings), 1) if len(timings) > 1 else 0.0,
+        "peak_alloc_bytes": peak - baseline,
+        "retained_blocks_per_op": round((blocks_after - blocks_before) / retained_loops, 3),
+    }
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_previous(path: Path) -> dict[str, dict]:
+    """Return the most recent stored result for each benchmark."""
+    previous: dict[str, dict] = {}
+    if not path.exists():
+        return previous
+    with path.open() as f:
+        for line in f:
+            if line.strip():
+                run = json.loads(line)
+                previous.update(run["results"])
+    return previous
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--filter", default="", help="Only run benchmarks containing this text")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--min-time", type=float, default=0.2, help="Seconds per timed repeat")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--no-save", action="store_true")
+    args = parser.parse_args()
+
+    previous = load_previous(args.output)
+    results: dict[str, dict] = {}
+
+    print(f"{'benchmark':<32} {'best ns':>12} {'median ns':>12} {'peak B':>9} {'kept/op':>8} {'vs prev':>8}")
+    try:
+        for name, factory in BENCHMARKS.items():
+            if args.filter not in name:
+                continue
+            func = factory()
+            if func is None:
+                print(f"{name:<32} {'skipped (database unavailable or not migrated)':>52}")
+                continue
+
+            result = measure(func, args.repeat, args.min_time)
+            results[name] = result
+
+            change = ""
+            if name in previous:
+                change = f"{(result['best_ns'] / previous[name]['best_ns'] - 1) * 100:+.1f}%"
+            print(
+                f"{name:<32} {result['best_ns']:>12,.1f} {result['median_ns']:>12,.1f} "
+                f"{result['peak_alloc_bytes']:>9,} {result['retained_blocks_per_op']:>8} {change:>8}"
+            )
+    finally:
+        for cleanup in BENCHMARK_CLEANUP:
+            cleanup()
+
+    if results and not args.no_save:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        run = {
+            "timestamp": datetime.utcnow().isoformat(),
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": results,
+        }
+        with args.output.open("a") as f:
+            f.write(json.dumps(run, ensure_ascii=False) + "\n")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
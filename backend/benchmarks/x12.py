@@ -0,0 +1,135 @@
+"""Measure X12 270 build and 271 parse throughput on synthetic interchanges.
+
+Builds a 271 with ``--members`` subscribers from mock provider results
+(dependents and rejections included) and parses it in ``--chunk-size``
+pieces, as it would arrive from a socket. Peak memory of the streaming
+parse is compared with handing the parser the whole document at once:
+
+    python -m benchmarks.x12
+    python -m benchmarks.x12 --members 50000 --chunk-size 16384 --json
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+from app.insurance.mock_data import FIRST_NAMES, INSURANCE_COMPANIES, LAST_NAMES
+from app.insurance.mock_provider import MockInsuranceProvider
+from app.insurance.mock_x12 import MOCK_INSURANCE_TYPES, PROVIDER
+from app.insurance.x12 import (
+    EligibilityInquiry,
+    Envelope,
+    Party,
+    Reader271,
+    build_270,
+    encode_271,
+)
+
+PAYER = Party(INSURANCE_COMPANIES[0], "MOCKPAYER")
+
+
+def inquiries(count: int) -> list[EligibilityInquiry]:
+    return [
+        EligibilityInquiry(
+            trace_number=f"{i}",
+            patient_first_name=FIRST_NAMES[i % len(FIRST_NAMES)],
+            patient_last_name=LAST_NAMES[(i * 7) % len(LAST_NAMES)],
+            patient_dob=date(1950, 1, 1) + timedelta(days=i * 97 % 25000),
+            member_id=f"KZ{i:09d}",
+            group_number=f"G{i % 50}" if i % 3 else None,
+        )
+        for i in range(count)
+    ]
+
+
+def interchange_271(requests: list[EligibilityInquiry]) -> bytes:
+    provider = MockInsuranceProvider()
+    results = (
+        provider.generate_result(
+            inquiry.patient_first_name, inquiry.patient_last_name, PAYER.name, inquiry.member_id
+        )
+        for inquiry in requests
+    )
+    return encode_271(
+        zip(requests, results),
+        Envelope("MOCKPAYER", "CARELINK"),
+        PAYER,
+        PROVIDER,
+        insurance_types=MOCK_INSURANCE_TYPES,
+    )
+
+
+def parse(document: bytes, chunk_size: int) -> int:
+    """Parse ``document`` in chunks and return the number of members."""
+    reader = Reader271(insurance_types=MOCK_INSURANCE_TYPES)
+    members = 0
+    for start in range(0, len(document), chunk_size):
+        members += len(reader.feed(document[start : start + chunk_size]))
+    return members + len(reader.close())
+
+
+def peak_bytes(func) -> int:
+    """Peak memory allocated while running ``func``."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def timed(func, min_time: float = 1.0) -> float:
+    """Best seconds per call over at least ``min_time``."""
+    best = float("inf")
+    deadline = time.perf_counter() + min_time
+    while True:
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+        if time.perf_counter() > deadline:
+            return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--members", type=int, default=10000)
+    parser.add_argument("--chunk-size", type=int, default=65536)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    requests = inquiries(args.members)
+    document = interchange_271(requests)
+    members = parse(document, args.chunk_size)
+
+    build_s = timed(lambda: build_270(requests, Envelope("CARELINK", "MOCKPAYER"), PAYER, PROVIDER))
+    parse_s = timed(lambda: parse(document, args.chunk_size))
+    results = {
+        "members": members,
+        "bytes_271": len(document),
+        "chunk_size": args.chunk_size,
+        "build_270_members_per_s": round(args.members / build_s),
+        "parse_271_members_per_s": round(members / parse_s),
+        "parse_271_mb_per_s": round(len(document) / parse_s / 1e6, 1),
+        "parse_271_us_per_member": round(parse_s / members * 1e6, 1),
+        "peak_bytes_streaming": peak_bytes(lambda: parse(document, args.chunk_size)),
+        "peak_bytes_whole_document": peak_bytes(lambda: parse(document, len(document))),
+    }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"271: {members:,} members, {len(document):,} bytes, {args.chunk_size:,}-byte chunks\n")
+    print(f"build 270   {results['build_270_members_per_s']:>10,} members/s")
+    print(
+        f"parse 271   {results['parse_271_members_per_s']:>10,} members/s  "
+        f"{results['parse_271_mb_per_s']} MB/s  {results['parse_271_us_per_member']} µs/member"
+    )
+    print(f"peak memory {results['peak_bytes_streaming']:>10,} bytes streaming")
+    print(f"            {results['peak_bytes_whole_document']:>10,} bytes whole document")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Tests for admission control and load shedding."""
+
+import asyncio
+
+import pytest
+
+from app.config import get_settings
+from app.core import admission
+from app.core.admission import MAX_RETRY_AFTER_S, AdmissionController, Overloaded
+
+
+@pytest.fixture
+def controller() -> AdmissionController:
+    controller = AdmissionController()
+    controller.settings = get_settings().model_copy(
+        update={
+            "ADMISSION_MAX_QUEUE_WAIT_MS": 1000,
+            "ADMISSION_READY_COOLDOWN_S": 5.0,
+            "ADMISSION_DB_POOL_SATURATION": 0.9,
+        }
+    )
+    controller.max_in_flight = 2
+    controller.max_queue = 2
+    return controller
+
+
+async def hold(controller: AdmissionController, release: asyncio.Event) -> None:
+    async with controller.admit():
+        await release.wait()
+
+
+async def settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def test_admits_up_to_max_in_flight_then_queues(controller):
+    release = asyncio.Event()
+    holders = [asyncio.create_task(hold(controller, release)) for _ in range(3)]
+    await settle()
+
+    assert controller.in_flight == 2
+    assert controller.queued == 1
+    assert controller.stats().ready
+
+    release.set()
+    await asyncio.gather(*holders)
+    assert controller.admitted == 3
+    assert controller.shed == 0
+    assert controller.in_flight == controller.queued == 0
+
+
+async def test_sheds_when_the_queue_is_full(controller):
+    release = asyncio.Event()
+    holders = [asyncio.create_task(hold(controller, release)) for _ in range(4)]
+    await settle()
+
+    with pytest.raises(Overloaded) as shed:
+        async with controller.admit():
+            pass
+
+    assert shed.value.reason == "too many checks in progress"
+    assert 1 <= shed.value.retry_after <= MAX_RETRY_AFTER_S
+    assert controller.shed == 1
+    assert not controller.stats().ready
+
+    release.set()
+    await asyncio.gather(*holders)
+
+
+async def test_sheds_when_the_queue_wait_runs_out(controller):
+    release = asyncio.Event()
+    holders = [asyncio.create_task(hold(controller, release)) for _ in range(2)]
+    await settle()
+
+    with pytest.raises(Overloaded) as shed:
+        async with controller.admit(max_wait_s=0.02):
+            pass
+
+    assert shed.value.reason == "queue wait exceeded"
+    assert controller.queued == 0
+    release.set()
+    await asyncio.gather(*holders)
+    assert controller.in_flight == 0
+
+
+async def test_sheds_while_the_database_pool_is_saturated(controller, monkeypatch):
+    monkeypatch.setattr(admission, "db_pool_usage", lambda: (9, 10))
+
+    with pytest.raises(Overloaded) as shed:
+        async with controller.admit():
+            pass
+
+    assert shed.value.reason == "database pool saturated"
+    assert not controller.stats().ready
+
+
+def test_retry_after_grows_with_backlog_and_is_capped(controller):
+    controller.service_time_s = 0.5
+    controller.queued = 6
+    assert controller.retry_after() == 2  # 0.5 s * 7 waiting / 2 slots
+
+    controller.service_time_s = 60.0
+    assert controller.retry_after() == MAX_RETRY_AFTER_S
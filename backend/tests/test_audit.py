@@ -0,0 +1,61 @@
+"""Tests for the audit writer's fallbacks when the spool is unwritable."""
+
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.services.audit import AuditWriter
+
+USER = SimpleNamespace(id=uuid.uuid4())
+
+
+@pytest.fixture
+def writer(tmp_path, monkeypatch) -> AuditWriter:
+    writer = AuditWriter()
+    monkeypatch.setattr(writer.settings, "AUDIT_ENABLED", True)
+    # A file where the spool directory should be makes every spool write fail
+    writer.spool_dir = tmp_path / "spool"
+    writer.spool_dir.write_text("")
+    return writer
+
+
+def test_unwritable_spool_falls_back_to_insert(writer, monkeypatch):
+    inserted = []
+    monkeypatch.setattr(writer, "_insert", inserted.extend)
+
+    writer.record(USER, action="eligibility.view", resource_type="eligibility_check")
+
+    assert [row["action"] for row in inserted] == ["eligibility.view"]
+    assert (writer.written, writer.spooled, writer.dropped) == (1, 0, 0)
+
+
+def test_events_are_counted_when_spool_and_insert_fail(writer, monkeypatch):
+    def insert(rows):
+        raise OperationalError("INSERT", {}, Exception("database is down"))
+
+    monkeypatch.setattr(writer, "_insert", insert)
+
+    writer.record(USER, action="eligibility.view", resource_type="eligibility_check")
+
+    assert (writer.written, writer.spooled, writer.dropped) == (0, 0, 1)
+
+
+async def test_overflow_is_persisted_when_the_spool_fails(writer, monkeypatch):
+    inserted = []
+    monkeypatch.setattr(writer, "_insert", inserted.extend)
+    monkeypatch.setattr(writer.settings, "AUDIT_QUEUE_MAX", 2)
+    monkeypatch.setattr(writer, "replay_spool", lambda: 0)
+    monkeypatch.setattr(writer, "_run", asyncio.Event().wait)  # leave the queue undrained
+
+    await writer.start()
+    for _ in range(5):
+        writer.record(USER, action="eligibility.view", resource_type="eligibility_check")
+    await writer._overflow_task
+
+    assert len(inserted) == 3
+    assert writer.dropped == 0
+    writer._task.cancel()
+    await asyncio.gather(writer._task, return_exceptions=True)
@@ -0,0 +1,82 @@
+"""Tests for the wall and virtual clocks."""
+
+import asyncio
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core.clock import SystemClock, VirtualClock
+
+
+@pytest.fixture
+def non_utc_timezone():
+    """Run the test with the host in UTC+5, where local-time mistakes show."""
+    previous = os.environ.get("TZ")
+    os.environ["TZ"] = "Asia/Almaty"
+    time.tzset()
+    yield
+    if previous is None:
+        del os.environ["TZ"]
+    else:
+        os.environ["TZ"] = previous
+    time.tzset()
+
+
+def test_virtual_clock_starts_at_system_time(non_utc_timezone):
+    system, virtual = SystemClock(), VirtualClock()
+
+    assert abs(virtual.time() - system.time()) < 1
+    assert abs(virtual.now() - system.now()) < timedelta(seconds=1)
+
+
+def test_virtual_clock_reads_naive_start_as_utc(non_utc_timezone):
+    start = datetime(2024, 1, 31, 23, 30)
+    clock = VirtualClock(start=start)
+
+    assert clock.now() == start
+    assert clock.time() == datetime(2024, 1, 31, 23, 30, tzinfo=timezone.utc).timestamp()
+
+
+def test_virtual_clock_accepts_aware_start(non_utc_timezone):
+    start = datetime(2024, 2, 1, 4, 30, tzinfo=timezone(timedelta(hours=5)))
+
+    assert VirtualClock(start=start).now() == datetime(2024, 1, 31, 23, 30)
+
+
+async def test_concurrent_sleeps_overlap():
+    clock = VirtualClock(start=datetime(2024, 1, 1))
+
+    await asyncio.gather(clock.sleep(10), clock.sleep(10), clock.sleep(4))
+
+    assert clock.now() == datetime(2024, 1, 1, 0, 0, 10)
+
+
+async def test_sleeps_wake_in_deadline_order():
+    clock = VirtualClock(start=datetime(2024, 1, 1))
+    woke = []
+
+    async def sleeper(name: str, seconds: float) -> None:
+        await clock.sleep(seconds)
+        woke.append((name, clock.time() - datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp()))
+
+    await asyncio.gather(sleeper("slow", 30), sleeper("fast", 5), sleeper("mid", 12))
+
+    assert woke == [("fast", 5), ("mid", 12), ("slow", 30)]
+
+
+async def test_manual_advance_wakes_due_sleepers_only():
+    clock = VirtualClock(start=datetime(2024, 1, 1), auto_advance=False)
+    short = asyncio.create_task(clock.sleep(5))
+    long = asyncio.create_task(clock.sleep(60))
+    await asyncio.sleep(0)
+
+    clock.advance(10)
+    await asyncio.sleep(0)
+
+    assert short.done()
+    assert not long.done()
+    assert clock.now() == datetime(2024, 1, 1, 0, 0, 10)
+    clock.advance(50)
+    await long
@@ -0,0 +1,148 @@
+"""Tests for weighted-fair priority lanes."""
+
+import asyncio
+import threading
+from collections import Counter
+
+from app.services.priority import Lane, PriorityScheduler, current_lane, priority_lane
+
+WEIGHTS = {Lane.INTERACTIVE: 8, Lane.BATCH: 2, Lane.BACKGROUND: 1}
+
+
+def make_scheduler(slots: int = 1, max_wait_s: float = 60.0) -> PriorityScheduler:
+    return PriorityScheduler("test", slots, weights=WEIGHTS, max_wait_s=max_wait_s)
+
+
+async def settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def test_free_slots_are_taken_without_queueing():
+    scheduler = make_scheduler(slots=2)
+
+    async with scheduler.slot(Lane.BACKGROUND):
+        async with scheduler.slot(Lane.BATCH):
+            assert scheduler.metrics()["in_use"] == 2
+
+    assert scheduler.metrics()["in_use"] == 0
+    assert all(stats.queued == 0 for stats in scheduler.stats.values())
+
+
+async def test_contended_slots_follow_lane_weights():
+    scheduler = make_scheduler()
+    order: list[Lane] = []
+
+    async def work(lane: Lane) -> None:
+        async with scheduler.slot(lane):
+            order.append(lane)
+
+    async with scheduler.slot(Lane.INTERACTIVE):
+        tasks = [asyncio.create_task(work(lane)) for lane in Lane for _ in range(110)]
+        await settle()
+        assert scheduler.metrics()["lanes"]["batch"]["queued"] == 110
+    await asyncio.gather(*tasks)
+
+    served = Counter(order[:110])
+    assert abs(served[Lane.INTERACTIVE] - 80) <= 1
+    assert abs(served[Lane.BATCH] - 20) <= 1
+    assert abs(served[Lane.BACKGROUND] - 10) <= 1
+    assert len(order) == 330
+
+
+async def test_starved_lane_is_promoted():
+    scheduler = make_scheduler(max_wait_s=0.05)
+    order: list[Lane] = []
+
+    async def work(lane: Lane) -> None:
+        async with scheduler.slot(lane):
+            order.append(lane)
+
+    async with scheduler.slot(Lane.INTERACTIVE):
+        background = asyncio.create_task(work(Lane.BACKGROUND))
+        await asyncio.sleep(0.1)
+        interactive = [asyncio.create_task(work(Lane.INTERACTIVE)) for _ in range(5)]
+        await settle()
+    await asyncio.gather(background, *interactive)
+
+    assert order[0] == Lane.BACKGROUND
+    assert scheduler.stats[Lane.BACKGROUND].promoted == 1
+
+
+async def test_cancelled_waiter_leaves_the_queue():
+    scheduler = make_scheduler()
+
+    async with scheduler.slot():
+        waiter = asyncio.create_task(scheduler._acquire(Lane.BATCH))
+        await settle()
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        assert scheduler.stats[Lane.BATCH].queued == 0
+
+    assert scheduler.metrics()["in_use"] == 0
+
+
+async def test_waiter_cancelled_as_it_is_granted_returns_the_slot():
+    scheduler = make_scheduler()
+
+    await scheduler._acquire(Lane.INTERACTIVE)
+    waiter = asyncio.create_task(scheduler._acquire(Lane.BATCH))
+    await settle()
+    scheduler._release()  # hands the slot to the waiter
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+
+    assert scheduler.metrics()["in_use"] == 0
+    assert scheduler.stats[Lane.BATCH].started == 0
+
+
+async def test_priority_lane_applies_to_created_tasks():
+    scheduler = make_scheduler()
+
+    async def work() -> Lane:
+        async with scheduler.slot():
+            return current_lane.get()
+
+    with priority_lane(Lane.BACKGROUND):
+        task = asyncio.create_task(work())
+    assert current_lane.get() == Lane.INTERACTIVE
+
+    assert await task == Lane.BACKGROUND
+    assert scheduler.stats[Lane.BACKGROUND].started == 1
+
+
+async def test_run_holds_the_slot_until_the_thread_returns():
+    scheduler = make_scheduler()
+    finish = threading.Event()
+
+    caller = asyncio.create_task(scheduler.run(finish.wait))
+    await settle()
+    caller.cancel()
+    await asyncio.gather(caller, return_exceptions=True)
+    try:
+        assert scheduler.metrics()["in_use"] == 1
+    finally:
+        finish.set()
+
+    for _ in range(100):
+        if scheduler.metrics()["in_use"] == 0:
+            break
+        await asyncio.sleep(0.01)
+    assert scheduler.metrics()["in_use"] == 0
+
+
+async def test_cancelled_waiter_does_not_charge_its_lane():
+    scheduler = make_scheduler()
+
+    await scheduler._acquire(Lane.BATCH)
+    cancelled = asyncio.create_task(scheduler._acquire(Lane.INTERACTIVE))
+    waiter = asyncio.create_task(scheduler._acquire(Lane.BATCH))
+    await settle()
+    cancelled.cancel()
+    scheduler._release()  # before the cancelled task can leave the queue
+    await asyncio.gather(cancelled, waiter, return_exceptions=True)
+
+    assert waiter.done() and waiter.exception() is None
+    assert scheduler._pass[Lane.INTERACTIVE] == 0
+    assert scheduler.stats[Lane.INTERACTIVE].queued == 0
+    assert scheduler.metrics()["in_use"] == 1
@@ -0,0 +1,154 @@
+"""Tests for consistent hashing and routing of the sharded eligibility cache."""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+import redis
+
+from app.core import redis_shards
+from app.core.redis_shards import HashRing, ShardedRedis
+
+KEYS = [f"eligibility:{i}" for i in range(20000)]
+NODES = ["cache-1:6379/0", "cache-2:6379/0", "cache-3:6379/0", "cache-4:6379/0"]
+
+
+def placement(ring: HashRing) -> dict[str, str]:
+    return {key: ring.node_for(key) for key in KEYS}
+
+
+def test_placement_is_deterministic():
+    assert placement(HashRing(NODES)) == placement(HashRing(reversed(NODES)))
+
+
+def test_empty_ring_has_no_owner():
+    ring = HashRing(["cache-1:6379/0"])
+    ring.remove("cache-1:6379/0")
+
+    assert ring.node_for("eligibility:1") is None
+    assert ring.shares() == {}
+
+
+def test_virtual_nodes_balance_keys():
+    ring = HashRing(NODES)
+
+    shares = ring.shares()
+    counts = {node: 0 for node in NODES}
+    for node in placement(ring).values():
+        counts[node] += 1
+
+    assert sum(shares.values()) == pytest.approx(1.0)
+    assert max(shares.values()) < 1.25 / len(NODES)
+    assert max(counts.values()) < 1.25 * len(KEYS) / len(NODES)
+
+
+def test_adding_a_node_only_moves_keys_onto_it():
+    ring = HashRing(NODES)
+    before = placement(ring)
+
+    ring.add("cache-5:6379/0")
+    after = placement(ring)
+
+    moved = [key for key in KEYS if before[key] != after[key]]
+    assert {after[key] for key in moved} == {"cache-5:6379/0"}
+    assert len(moved) / len(KEYS) == pytest.approx(1 / 5, abs=0.05)
+
+
+def test_removing_a_node_only_moves_its_keys():
+    ring = HashRing(NODES)
+    before = placement(ring)
+
+    ring.remove("cache-2:6379/0")
+    after = placement(ring)
+
+    moved = [key for key in KEYS if before[key] != after[key]]
+    assert moved == [key for key in KEYS if before[key] == "cache-2:6379/0"]
+    assert len(moved) / len(KEYS) == pytest.approx(1 / 4, abs=0.05)
+
+
+class FakeNode:
+    """Dict-backed stand-in for one cache node's ``redis.Redis``."""
+
+    def __init__(self, url: str):
+        host, port = url.removeprefix("redis://").split(":")
+        self.connection_pool = SimpleNamespace(connection_kwargs={"host": host, "port": int(port)})
+        self.data: dict = {}
+        self.up = True
+        self.mgets = 0
+
+    def _ensure_up(self) -> None:
+        if not self.up:
+            raise redis.ConnectionError("node down")
+
+    def ping(self) -> bool:
+        self._ensure_up()
+        return True
+
+    def get(self, key):
+        self._ensure_up()
+        return self.data.get(key)
+
+    def setex(self, key, ttl, value) -> bool:
+        self._ensure_up()
+        self.data[key] = value
+        return True
+
+    def mget(self, keys) -> list:
+        self._ensure_up()
+        self.mgets += 1
+        return [self.data.get(key) for key in keys]
+
+
+@pytest.fixture
+def nodes(monkeypatch) -> dict[str, FakeNode]:
+    created: dict[str, FakeNode] = {}
+
+    def from_url(url, **kwargs):
+        created[url] = FakeNode(url)
+        return created[url]
+
+    monkeypatch.setattr(redis_shards.redis, "from_url", from_url)
+    return created
+
+
+URLS = ["redis://cache-1:6379", "redis://cache-2:6379", "redis://cache-3:6379"]
+
+
+def test_nodes_join_on_a_freshly_booted_host(nodes, monkeypatch):
+    # The monotonic clock starts near zero after boot
+    monkeypatch.setattr(redis_shards.time, "monotonic", lambda: 1.0)
+
+    sharded = ShardedRedis(URLS, health_interval_s=5.0)
+
+    assert all(status["healthy"] for status in sharded.status())
+    assert sharded.shard_for("eligibility:1") is not None
+
+
+def test_keys_are_routed_by_the_ring(nodes):
+    sharded = ShardedRedis(URLS)
+
+    for key in KEYS[:300]:
+        sharded.setex(key, 60, key.encode())
+
+    for key in KEYS[:300]:
+        owner = sharded.ring.node_for(key)
+        assert nodes[f"redis://{owner.split('/')[0]}"].data[key] == key.encode()
+    assert sharded.mget(*KEYS[:300]) == [key.encode() for key in KEYS[:300]]
+    assert all(node.mgets == 1 for node in nodes.values())
+
+
+def test_down_node_reads_as_misses_and_rejoins(nodes):
+    sharded = ShardedRedis(URLS, health_interval_s=0.05)
+    for key in KEYS[:300]:
+        sharded.setex(key, 60, b"cached")
+    down = nodes["redis://cache-2:6379"]
+    lost = [key for key in KEYS[:300] if key in down.data]
+    down.up = False
+
+    assert sharded.mget(*lost) == [None] * len(lost)
+    assert "cache-2:6379/0" not in sharded.ring.nodes
+    assert sharded.get(lost[0]) is None  # now served by another node, cold
+
+    down.up = True
+    time.sleep(0.1)
+    assert sharded.get(lost[0]) == b"cached"
@@ -0,0 +1,38 @@
+"""Tests for the scheduled re-verification loop."""
+
+import asyncio
+from datetime import datetime
+
+from app.core.clock import VirtualClock
+from app.services.reverification import ReverificationScheduler
+
+
+async def test_failed_window_does_not_stop_the_schedule(monkeypatch):
+    scheduler = ReverificationScheduler(clock=VirtualClock(datetime(2024, 3, 31, 12, 0)))
+    monkeypatch.setattr(scheduler.settings, "REVERIFY_DAYS_OF_MONTH", "*")
+    released, windows = [], []
+
+    async def run_once(deadline, organization_id=None):
+        windows.append(deadline)
+        if len(windows) == 1:
+            raise ConnectionError("database is down")
+        if len(windows) == 3:
+            await asyncio.Event().wait()  # keep the loop parked on the third window
+        return None
+
+    monkeypatch.setattr(scheduler, "_acquire_leadership", lambda start: True)
+    monkeypatch.setattr(scheduler, "_claim_run", lambda scope, deadline: True)
+    monkeypatch.setattr(scheduler, "_release_run", released.append)
+    monkeypatch.setattr(scheduler, "run_once", run_once)
+
+    task = asyncio.create_task(scheduler.run_forever())
+    for _ in range(100):
+        await asyncio.sleep(0)
+        if len(windows) == 3:
+            break
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert len(windows) == 3
+    assert windows[1] - windows[0] == windows[2] - windows[1]
+    assert released == ["all"] * 3
@@ -0,0 +1,170 @@
+"""Tests for the X12 270/271 codec."""
+
+from datetime import date, datetime
+
+import pytest
+
+from app.insurance.base import EligibilityResult
+from app.insurance.mock_provider import MockInsuranceProvider
+from app.insurance.mock_x12 import MOCK_INSURANCE_TYPES, PROVIDER
+from app.insurance.x12 import (
+    Delimiters,
+    EligibilityInquiry,
+    Envelope,
+    Party,
+    Reader271,
+    X12Error,
+    aparse_271,
+    build_270,
+    encode_271,
+    parse_270,
+    parse_271,
+)
+
+PAYER = Party("Евразия", "MOCKPAYER")
+ENVELOPE = Envelope("MOCKPAYER", "CARELINK", control_number=42)
+NOW = datetime(2024, 3, 1, 9, 30)
+
+
+def make_inquiries(count: int) -> list[EligibilityInquiry]:
+    return [
+        EligibilityInquiry(
+            trace_number=str(1000 + i),
+            patient_first_name="Айбек",
+            patient_last_name=f"Ахметов{i}",
+            patient_dob=date(1980, 1, 1 + i % 28),
+            member_id=f"KZ{i:09d}",
+            group_number=f"G{i}" if i % 2 else None,
+        )
+        for i in range(count)
+    ]
+
+
+def mock_results(inquiries: list[EligibilityInquiry]) -> list[EligibilityResult]:
+    provider = MockInsuranceProvider()
+    return [
+        provider.generate_result(
+            inquiry.patient_first_name, inquiry.patient_last_name, PAYER.name, inquiry.member_id
+        )
+        for inquiry in inquiries
+    ]
+
+
+def encode(pairs, **options) -> bytes:
+    return encode_271(
+        pairs, ENVELOPE, PAYER, PROVIDER, now=NOW, insurance_types=MOCK_INSURANCE_TYPES, **options
+    )
+
+
+def test_271_round_trips_mock_results():
+    inquiries = make_inquiries(200)
+    results = mock_results(inquiries)
+    assert {result.status for result in results} >= {"active", "inactive"}
+
+    parsed = list(parse_271([encode(zip(inquiries, results))], insurance_types=MOCK_INSURANCE_TYPES))
+
+    assert [response.trace_number for response in parsed] == [i.trace_number for i in inquiries]
+    for response, result in zip(parsed, results):
+        assert response.result.status == result.status
+        if result.status in ("active", "inactive"):
+            assert response.result.coverage == result.coverage
+            assert response.result.subscriber == result.subscriber
+
+
+def test_271_dependent_reports_subscriber_and_relationship():
+    inquiry = make_inquiries(1)[0]
+    result = EligibilityResult(
+        status="active",
+        coverage={"plan_name": "Family Plan", "effective_date": "2024-01-01"},
+        subscriber={"name": "Марат Ахметов", "relationship": "Child", "member_id": "KZ000000000"},
+    )
+
+    (response,) = parse_271([encode([(inquiry, result)])], insurance_types=MOCK_INSURANCE_TYPES)
+
+    assert response.trace_number == inquiry.trace_number
+    assert response.result.subscriber == result.subscriber
+    assert response.result.coverage["plan_name"] == "Family Plan"
+    assert response.result.coverage["effective_date"] == "2024-01-01"
+
+
+@pytest.mark.parametrize(
+    ("status", "message"),
+    [("not_found", "Subscriber/insured not found"), ("error", "Unable to respond at current time")],
+)
+def test_271_rejections(status, message):
+    inquiry = make_inquiries(1)[0]
+    result = EligibilityResult(status=status, error_message="anything")
+
+    (response,) = parse_271([encode([(inquiry, result)])])
+
+    assert response.result.status == status
+    assert response.result.error_message == message
+
+
+def test_271_streams_members_as_chunks_arrive():
+    inquiries = make_inquiries(50)
+    document = encode(zip(inquiries, mock_results(inquiries)))
+    whole = list(parse_271([document], insurance_types=MOCK_INSURANCE_TYPES))
+
+    reader = Reader271(insurance_types=MOCK_INSURANCE_TYPES)
+    streamed, first_seen_at = [], None
+    for offset in range(0, len(document), 7):
+        completed = reader.feed(document[offset : offset + 7])
+        if completed and first_seen_at is None:
+            first_seen_at = offset
+        streamed.extend(completed)
+    streamed.extend(reader.close())
+
+    assert streamed == whole
+    assert first_seen_at < len(document) // 2
+
+
+async def test_271_async_parse_matches_sync():
+    inquiries = make_inquiries(10)
+    document = encode(zip(inquiries, mock_results(inquiries)))
+
+    async def chunks():
+        for offset in range(0, len(document), 64):
+            yield document[offset : offset + 64]
+
+    parsed = [response async for response in aparse_271(chunks(), insurance_types=MOCK_INSURANCE_TYPES)]
+
+    assert parsed == list(parse_271([document], insurance_types=MOCK_INSURANCE_TYPES))
+
+
+def test_271_truncated_stream_raises():
+    inquiries = make_inquiries(3)
+    document = encode(zip(inquiries, mock_results(inquiries)))
+
+    with pytest.raises(X12Error):
+        list(parse_271([document[: len(document) // 2]]))
+    with pytest.raises(X12Error):
+        list(parse_271([document[:-1]]))
+
+
+def test_270_round_trips_inquiries():
+    inquiries = make_inquiries(5)
+
+    document = build_270(inquiries, ENVELOPE, PAYER, PROVIDER, now=NOW)
+
+    assert document.startswith(b"ISA*")
+    assert list(parse_270([document])) == inquiries
+
+
+def test_270_honours_declared_delimiters_and_blanks_them_in_data():
+    delimiters = Delimiters(element=b"|", repetition=b"!", component=b">", segment=b"'")
+    inquiry = make_inquiries(1)[0]
+    inquiry.patient_last_name = "O'Brien|Smith"
+
+    document = build_270([inquiry], ENVELOPE, PAYER, PROVIDER, now=NOW, delimiters=delimiters)
+    chunks = [document[offset : offset + 5] for offset in range(0, len(document), 5)]
+    (parsed,) = parse_270(chunks)
+
+    assert Delimiters.from_isa(document[:106]) == delimiters
+    assert parsed.patient_last_name == "O Brien Smith"
+    assert parsed.member_id == inquiry.member_id
+
+
+def test_isa_is_required():
+    with pytest.raises(X12Error):
+        Delimiters.from_isa(b"GS*HS" + b" " * 120)